@@ -1,108 +1,19 @@
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import pprint
-import networkx as nx
-import matplotlib.pyplot as plt
-
-# -----------------------------------------------------------
-#          ДВА ГРАФИ (НЕОРІЄНТОВАНИЙ + ОРІЄНТОВАНИЙ)
-# -----------------------------------------------------------
-
-# НЕорієнтований граф
-VERTICES_UNDIR = ['a', 'b', 'c', 'd', 'e', 'f']
-EDGES_UNDIR = [
-    ('a', 'b'),
-    ('a', 'c'),
-    ('b', 'd'),
-    ('a', 'e'),
-    ('b', 'e'),
-    ('c', 'd'),
-    ('c', 'd'),  # паралельне ребро
-    ('c', 'f'),
-    ('d', 'f'),
-]
-
-# Орієнтований граф
-VERTICES_DIR = ['a', 'b', 'c', 'd', 'e', 'f']
-EDGES_DIR = [
-    ('a', 'b'),
-    ('a', 'c'),
-    ('a', 'e'),
-    ('b', 'a'),
-    ('b', 'c'),
-    ('b', 'f'),
-    ('e', 'a'),
-    ('e', 'f'),
-    ('e', 'd'),
-    ('f', 'b'),
-    ('f', 'd'),
-]
-
-# -----------------------------------------------------------
-#                КООРДИНАТИ ДЛЯ ВІЗУАЛІЗАЦІЇ
-# -----------------------------------------------------------
-
-directed_positions = {
-    'a': (-0.400,  0.500),
-    'b': ( 0.400,  0.500),
-    'c': ( 0.000,  0.100),
-    'e': (-0.600, -0.500),
-    'f': ( 0.600, -0.500),
-    'd': ( 0.000, -0.700),
-}
-
-undirected_positions = {
-    'a': (-0.400,  0.500),
-    'b': ( 0.400,  0.500),
-    'c': (-0.600, -0.500),
-    'e': ( 0.000,  0.100),
-    'd': ( 0.600, -0.500),
-    'f': ( 0.000, -0.700),
-}
-
-# -----------------------------------------------------------
-#                ПЕРЕТВОРЕННЯ ПРЕДСТАВЛЕНЬ
-# -----------------------------------------------------------
-
-def edges_to_adjacency_matrix(vertices, edges, directed=False):
-    n = len(vertices)
-    idx = {v: i for i, v in enumerate(vertices)}
-    A = [[0] * n for _ in range(n)]
-
-    for u, v in edges:
-        i, j = idx[u], idx[v]
-        A[i][j] += 1
-        if not directed:
-            A[j][i] += 1
-    return A
-
-
-def edges_to_incidence_matrix(vertices, edges, directed=False):
-    n, m = len(vertices), len(edges)
-    idx = {v: i for i, v in enumerate(vertices)}
-    Inc = [[0] * m for _ in range(n)]
-
-    for col, (u, v) in enumerate(edges):
-        i, j = idx[u], idx[v]
-        if directed:
-            Inc[i][col] = 1
-            Inc[j][col] = -1
-        else:
-            Inc[i][col] = 1
-            Inc[j][col] = 1
-    return Inc
-
-
-def adjacency_matrix_to_adj_list(vertices, A):
-    n = len(vertices)
-    adj = {v: [] for v in vertices}
-
-    for i in range(n):
-        for j in range(n):
-            for _ in range(A[i][j]):
-                adj[vertices[i]].append(vertices[j])
-    return adj
 
+from mlta.representations import (
+    edges_to_adjacency_matrix,
+    edges_to_incidence_matrix,
+    edges_to_adj_list,
+)
+from mlta.binfmt import save_csr
+from mlta.export import write_adjacency, write_incidence, write_edge_list, write_adj_list
+from mlta.samples import (
+    VERTICES_UNDIR, EDGES_UNDIR, VERTICES_DIR, EDGES_DIR,
+    directed_positions, undirected_positions,
+)
+from mlta import plotting
 
 # -----------------------------------------------------------
 #             ВИБІР ПОТОЧНОГО ГРАФУ (directed/undirected)
@@ -141,37 +52,17 @@ def show_edge_list():
 
 def show_adj_list():
     V, E, directed, _ = get_graph_data()
-    A = edges_to_adjacency_matrix(V, E, directed)
-    adj = adjacency_matrix_to_adj_list(V, A)
+    adj = edges_to_adj_list(V, E, directed)
     text = pprint.pformat(adj)
     messagebox.showinfo("Список суміжності", text)
 
 
 def draw_graph():
     V, E, directed, pos = get_graph_data()
-
-    if directed:
-        G = nx.DiGraph()
-    else:
-        G = nx.MultiGraph()
-
-    G.add_nodes_from(V)
-    G.add_edges_from(E)
-
-    plt.figure(figsize=(7, 7))
-    nx.draw(
-        G, pos,
-        with_labels=True,
-        node_color="lightblue" if directed else "orange",
-        node_size=1300,
-        font_size=14,
-        arrows=directed,
-        arrowstyle='-|>' if directed else '-',
-        arrowsize=20,
-    )
-
-    plt.title("Орієнтований граф" if directed else "Неорієнтований граф")
-    plt.show()
+    try:
+        plotting.draw_graph(V, E, pos, directed, node_size=1300)
+    except ImportError as e:
+        messagebox.showerror("Помилка", str(e))
 
 
 # -----------------------------------------------------------
@@ -184,10 +75,7 @@ def save_adjacency():
     if not file:
         return
 
-    A = edges_to_adjacency_matrix(V, E, directed)
-    with open(file, "w") as f:
-        for row in A:
-            f.write(" ".join(str(x) for x in row) + "\n")
+    write_adjacency(file, V, E, directed)
 
     messagebox.showinfo("Успіх", "Матрицю суміжності збережено!")
 
@@ -198,10 +86,7 @@ def save_incidence():
     if not file:
         return
 
-    Inc = edges_to_incidence_matrix(V, E, directed)
-    with open(file, "w") as f:
-        for row in Inc:
-            f.write(" ".join(str(x) for x in row) + "\n")
+    write_incidence(file, V, E, directed)
 
     messagebox.showinfo("Успіх", "Матрицю інцидентності збережено!")
 
@@ -212,9 +97,7 @@ def save_edge_list():
     if not file:
         return
 
-    with open(file, "w") as f:
-        for i, e in enumerate(E):
-            f.write(f"{i+1}: {e}\n")
+    write_edge_list(file, E)
 
     messagebox.showinfo("Успіх", "Список ребер збережено!")
 
@@ -225,43 +108,51 @@ def save_adj_list():
     if not file:
         return
 
-    A = edges_to_adjacency_matrix(V, E, directed)
-    adj = adjacency_matrix_to_adj_list(V, A)
-
-    with open(file, "w", encoding="utf-8") as f:
-        for v in adj:
-            f.write(f"{v}: {adj[v]}\n")
+    write_adj_list(file, V, E, directed)
 
     messagebox.showinfo("Успіх", "Список суміжності збережено!")
 
 
+def save_binary():
+    V, E, directed, _ = get_graph_data()
+    file = filedialog.asksaveasfilename(defaultextension=".mltag")
+    if not file:
+        return
+
+    save_csr(file, edges_to_adjacency_matrix(V, E, directed, sparse=True))
+
+    messagebox.showinfo("Успіх", "Граф збережено у бінарному форматі!")
+
+
 # -----------------------------------------------------------
 #                           GUI
 # -----------------------------------------------------------
 
-root = tk.Tk()
-root.title("Лабораторна робота №1 — Графи")
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Лабораторна робота №1 — Графи")
 
-graph_type_var = tk.StringVar(value="undirected")
+    graph_type_var = tk.StringVar(value="undirected")
 
-tk.Label(root, text="Оберіть тип графа:", font=("Arial", 14)).pack(pady=10)
+    tk.Label(root, text="Оберіть тип графа:", font=("Arial", 14)).pack(pady=10)
 
-tk.Radiobutton(root, text="Неорієнтований граф", variable=graph_type_var, value="undirected").pack()
-tk.Radiobutton(root, text="Орієнтований граф", variable=graph_type_var, value="directed").pack()
+    tk.Radiobutton(root, text="Неорієнтований граф", variable=graph_type_var, value="undirected").pack()
+    tk.Radiobutton(root, text="Орієнтований граф", variable=graph_type_var, value="directed").pack()
 
-tk.Label(root, text="Виберіть дію:", font=("Arial", 14)).pack(pady=10)
+    tk.Label(root, text="Виберіть дію:", font=("Arial", 14)).pack(pady=10)
 
-tk.Button(root, text="Показати матрицю суміжності", width=35, command=show_adjacency_matrix).pack(pady=5)
-tk.Button(root, text="Показати матрицю інцидентності", width=35, command=show_incidence_matrix).pack(pady=5)
-tk.Button(root, text="Показати список ребер", width=35, command=show_edge_list).pack(pady=5)
-tk.Button(root, text="Показати список суміжності", width=35, command=show_adj_list).pack(pady=5)
-tk.Button(root, text="Показати граф (візуально)", width=35, command=draw_graph).pack(pady=10)
+    tk.Button(root, text="Показати матрицю суміжності", width=35, command=show_adjacency_matrix).pack(pady=5)
+    tk.Button(root, text="Показати матрицю інцидентності", width=35, command=show_incidence_matrix).pack(pady=5)
+    tk.Button(root, text="Показати список ребер", width=35, command=show_edge_list).pack(pady=5)
+    tk.Button(root, text="Показати список суміжності", width=35, command=show_adj_list).pack(pady=5)
+    tk.Button(root, text="Показати граф (візуально)", width=35, command=draw_graph).pack(pady=10)
 
-tk.Label(root, text="Зберегти у файл:", font=("Arial", 14)).pack(pady=10)
+    tk.Label(root, text="Зберегти у файл:", font=("Arial", 14)).pack(pady=10)
 
-tk.Button(root, text="Зберегти матрицю суміжності", width=35, command=save_adjacency).pack(pady=5)
-tk.Button(root, text="Зберегти матрицю інцидентності", width=35, command=save_incidence).pack(pady=5)
-tk.Button(root, text="Зберегти список ребер", width=35, command=save_edge_list).pack(pady=5)
-tk.Button(root, text="Зберегти список суміжності", width=35, command=save_adj_list).pack(pady=5)
+    tk.Button(root, text="Зберегти матрицю суміжності", width=35, command=save_adjacency).pack(pady=5)
+    tk.Button(root, text="Зберегти матрицю інцидентності", width=35, command=save_incidence).pack(pady=5)
+    tk.Button(root, text="Зберегти список ребер", width=35, command=save_edge_list).pack(pady=5)
+    tk.Button(root, text="Зберегти список суміжності", width=35, command=save_adj_list).pack(pady=5)
+    tk.Button(root, text="Зберегти граф (бінарний формат)", width=35, command=save_binary).pack(pady=5)
 
-root.mainloop()
+    root.mainloop()
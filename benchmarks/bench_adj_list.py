@@ -0,0 +1,72 @@
+"""
+Порівняння побудови списку суміжності:
+  - матричний шлях: edges_to_adjacency_matrix + adjacency_matrix_to_adj_list, O(n²);
+  - прямий шлях: edges_to_adj_list, O(n + m).
+
+Запуск:  python benchmarks/bench_adj_list.py [--dense-limit N]
+Матричний шлях пропускається для n > dense-limit (n² клітинок не вміщується
+в пам'ять уже при n = 10⁵).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mlta.representations import (  # noqa: E402
+    adjacency_matrix_to_adj_list,
+    edges_to_adj_list,
+    edges_to_adjacency_matrix,
+)
+
+
+def random_graph(n, m, seed=0):
+    rnd = random.Random(seed)
+    vertices = [f"v{i}" for i in range(n)]
+    edges = [(vertices[rnd.randrange(n)], vertices[rnd.randrange(n)]) for _ in range(m)]
+    return vertices, edges
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    res = fn(*args)
+    return res, time.perf_counter() - t0
+
+
+def dense_path(vertices, edges, directed):
+    A = edges_to_adjacency_matrix(vertices, edges, directed)
+    return adjacency_matrix_to_adj_list(vertices, A)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**4, 10**5])
+    parser.add_argument("--avg-degree", type=int, default=5)
+    parser.add_argument("--dense-limit", type=int, default=3000)
+    parser.add_argument("--directed", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'n':>8} {'m':>9} {'матриця, с':>12} {'напряму, с':>12} {'прискорення':>12}")
+    for n in args.sizes:
+        m = n * args.avg_degree
+        V, E = random_graph(n, m)
+
+        direct, t_direct = timed(edges_to_adj_list, V, E, args.directed)
+
+        if n <= args.dense_limit:
+            dense, t_dense = timed(dense_path, V, E, args.directed)
+            assert dense == direct, "результати не збігаються"
+            dense_col = f"{t_dense:12.4f}"
+            speedup = f"{t_dense / t_direct:11.1f}x"
+        else:
+            dense_col = f"{'пропущено':>12}"
+            speedup = f"{'—':>12}"
+
+        print(f"{n:>8} {m:>9} {dense_col} {t_direct:12.4f} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+BFS з перемиканням напрямку проти поточного top-down BFS
+на R-MAT графі "соціального" типу (малий діаметр, степеневий розподіл).
+
+Запуск:  python benchmarks/bench_bfs.py [--scale 16] [--edge-factor 16]
+TEPS — ребра компоненти старту за секунду (як у Graph500);
+"переглянуто" — скільки ребер реально перевірив кожен варіант.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mlta.traversal import (  # noqa: E402
+    bfs_direction_optimizing,
+    build_adj_list,
+    build_bfs_index,
+    iter_bfs_events,
+    traversal_numbers,
+)
+
+
+def rmat_edges(scale, edge_factor, seed=0, a=0.57, b=0.19, c=0.19):
+    rnd = random.Random(seed)
+    n = 1 << scale
+    edges = []
+    for _ in range(n * edge_factor):
+        u = v = 0
+        for _ in range(scale):
+            r = rnd.random()
+            u <<= 1
+            v <<= 1
+            if r < a:
+                pass
+            elif r < a + b:
+                v |= 1
+            elif r < a + b + c:
+                u |= 1
+            else:
+                u |= 1
+                v |= 1
+        if u != v:
+            edges.append((u, v))
+    return list(range(n)), edges
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=16, help="n = 2^scale вершин")
+    parser.add_argument("--edge-factor", type=int, default=16)
+    parser.add_argument("--roots", type=int, default=4)
+    args = parser.parse_args()
+
+    V, E = rmat_edges(args.scale, args.edge_factor)
+    t0 = time.perf_counter()
+    adj = build_adj_list(V, E, directed=False)
+    t_adj = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    index = build_bfs_index(adj, directed=False)
+    t_index = time.perf_counter() - t0
+    print(f"n={len(V)}, m={len(E)}; список суміжності {t_adj:.2f} с, CSR-індекс {t_index:.2f} с")
+
+    rnd = random.Random(1)
+    roots = [v for v in rnd.sample(V, len(V)) if adj[v]][:args.roots]
+
+    print(f"{'старт':>8} {'рівні':>6} {'top-down, с':>12} {'TEPS':>12} "
+          f"{'перемикання, с':>15} {'TEPS':>12} {'переглянуто (td / do)':>24}")
+    for root in roots:
+        t0 = time.perf_counter()
+        numbers = traversal_numbers(iter_bfs_events(V, E, root, adj=adj))
+        t_td = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        res = bfs_direction_optimizing(V, E, root, index=index)
+        t_do = time.perf_counter() - t0
+        assert set(res["numbers"]) == set(numbers)
+
+        component_edges = sum(len(adj[v]) for v in numbers) // 2
+        td_checked = 2 * component_edges
+        print(f"{root:>8} {len(res['steps']):>6} {t_td:12.3f} {component_edges / t_td:12.0f} "
+              f"{t_do:15.3f} {component_edges / t_do:12.0f} "
+              f"{td_checked:>11} / {res['edges_traversed']:<11}")
+
+
+if __name__ == "__main__":
+    main()
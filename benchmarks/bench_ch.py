@@ -0,0 +1,68 @@
+"""
+Ієрархія стягнення проти двобічної Дейкстри на "карті".
+
+Запуск:  python benchmarks/bench_ch.py [--side 60] [--queries 200] [--file ch.bin]
+Граф — та сама решітка, що й у bench_p2p.py. Ієрархія будується один раз,
+зберігається у файл і читається назад; далі порівнюється час запиту
+та кількість вибраних вершин.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_p2p import grid_map  # noqa: E402
+from mlta.ch import ContractionHierarchy  # noqa: E402
+from mlta.shortest_paths import ShortestPathEngine  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--side", type=int, default=60)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--file", default=os.path.join(tempfile.gettempdir(), "mlta_ch.bin"))
+    args = parser.parse_args()
+
+    V, E, _ = grid_map(args.side)
+    t0 = time.perf_counter()
+    ch = ContractionHierarchy.build(V, E, directed=False)
+    build = time.perf_counter() - t0
+    ch.save(args.file)
+    t0 = time.perf_counter()
+    ch = ContractionHierarchy.load(args.file)
+    load = time.perf_counter() - t0
+    print(f"n={len(V)}, m={len(E)}; побудова {build:.2f} с, читання {load:.3f} с, "
+          f"файл {os.path.getsize(args.file) / 1024:.0f} КіБ")
+    print(ch)
+
+    engine = ShortestPathEngine(V, E, directed=False)
+    rnd = random.Random(1)
+    pairs = [(rnd.choice(V), rnd.choice(V)) for _ in range(args.queries)]
+
+    print(f"{'метод':>14} {'мкс / запит':>12} {'вибрано':>10}")
+    reference = None
+    for method in ("bidirectional", "ch"):
+        total_time = total_settled = 0
+        answers = []
+        for s, t in pairs:
+            t0 = time.perf_counter()
+            res = ch.query(s, t) if method == "ch" else engine.query(s, t, method)
+            total_time += time.perf_counter() - t0
+            total_settled += res["settled"]
+            answers.append(res["dist"])
+        if reference is None:
+            reference = answers
+        assert all(math.isclose(a, b) for a, b in zip(answers, reference))
+        print(f"{method:>14} {total_time / len(pairs) * 1e6:12.0f} "
+              f"{total_settled / len(pairs):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
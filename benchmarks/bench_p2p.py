@@ -0,0 +1,79 @@
+"""
+Запити від точки до точки на "карті": звичайна Дейкстра з ранньою
+зупинкою, двобічна Дейкстра та A* з евклідовою евристикою.
+
+Запуск:  python benchmarks/bench_p2p.py [--side 300] [--queries 20]
+Граф — решітка side × side з координатами; вага ребра — його довжина,
+помножена на випадковий коефіцієнт 1..2 (тож евристика узгоджена).
+"вибрано" — середня кількість остаточно вибраних вершин на запит.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mlta.shortest_paths import (  # noqa: E402
+    ShortestPathEngine,
+    euclidean_heuristic,
+    euclidean_scale,
+)
+
+
+def grid_map(side, seed=0):
+    rnd = random.Random(seed)
+    pos = {}
+    for r in range(side):
+        for c in range(side):
+            pos[r * side + c] = (c + rnd.uniform(-0.3, 0.3), r + rnd.uniform(-0.3, 0.3))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            v = r * side + c
+            for u in ((v + 1) if c + 1 < side else None, (v + side) if r + 1 < side else None):
+                if u is not None:
+                    edges.append((v, u, math.dist(pos[v], pos[u]) * rnd.uniform(1, 2)))
+    return list(pos), edges, pos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--side", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    V, E, pos = grid_map(args.side)
+    t0 = time.perf_counter()
+    engine = ShortestPathEngine(V, E, directed=False)
+    scale = euclidean_scale(pos, E)
+    print(f"n={len(V)}, m={len(E)}; індекс {time.perf_counter() - t0:.2f} с, "
+          f"масштаб евристики {scale:.3f}")
+
+    rnd = random.Random(1)
+    pairs = [(rnd.choice(V), rnd.choice(V)) for _ in range(args.queries)]
+
+    print(f"{'метод':>14} {'с / запит':>10} {'вибрано':>10}")
+    reference = None
+    for method in ("dijkstra", "bidirectional", "astar"):
+        total_time = total_settled = 0
+        answers = []
+        for s, t in pairs:
+            h = euclidean_heuristic(pos, t, scale) if method == "astar" else None
+            t0 = time.perf_counter()
+            res = engine.query(s, t, method, h)
+            total_time += time.perf_counter() - t0
+            total_settled += res["settled"]
+            answers.append(res["dist"])
+        if reference is None:
+            reference = answers
+        assert all(math.isclose(a, b) for a, b in zip(answers, reference))
+        print(f"{method:>14} {total_time / len(pairs):10.4f} "
+              f"{total_settled / len(pairs):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+SPFA і Беллман–Форд (проходи) проти Дейкстри на невід'ємних вагах.
+
+Запуск:  python benchmarks/bench_spfa.py [--n 50000] [--degree 4] [--sources 3]
+Усі три варіанти працюють на одному індексі build_weighted_index;
+"релаксації" — скільки разів відстань справді покращувалась.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mlta.shortest_paths import (  # noqa: E402
+    bellman_ford_arrays,
+    build_weighted_index,
+    dijkstra_arrays,
+    spfa_arrays,
+)
+
+
+def random_graph(n, degree, seed=0, max_weight=100):
+    rnd = random.Random(seed)
+    edges = [(rnd.randrange(n), rnd.randrange(n), rnd.randint(0, max_weight))
+             for _ in range(n * degree)]
+    # кільце гарантує, що всі вершини досяжні
+    edges.extend((i, (i + 1) % n, max_weight) for i in range(n))
+    return list(range(n)), edges
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=50000)
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--sources", type=int, default=3)
+    parser.add_argument("--skip-passes", action="store_true",
+                        help="не запускати проходи Беллмана–Форда (найповільніші)")
+    args = parser.parse_args()
+
+    V, E = random_graph(args.n, args.degree)
+    t0 = time.perf_counter()
+    index = build_weighted_index(V, E)
+    print(f"n={len(V)}, m={len(E)}; індекс {time.perf_counter() - t0:.2f} с")
+
+    variants = [("dijkstra", lambda s: dijkstra_arrays(index, s)),
+                ("spfa", lambda s: spfa_arrays(index, s))]
+    if not args.skip_passes:
+        variants.append(("bellman-ford", lambda s: bellman_ford_arrays(index, s)))
+
+    rnd = random.Random(1)
+    print(f"{'джерело':>8} {'варіант':>13} {'час, с':>9} {'релаксації':>11}")
+    for s in rnd.sample(V, args.sources):
+        reference = None
+        for name, run in variants:
+            t0 = time.perf_counter()
+            res = run(s)
+            elapsed = time.perf_counter() - t0
+            dist = res[0]
+            relaxations = res[3] if len(res) == 4 else "-"
+            if reference is None:
+                reference = dist
+            assert dist == reference
+            print(f"{s:>8} {name:>13} {elapsed:9.3f} {relaxations:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Ядро лабораторних робіт MLTA без графічного інтерфейсу.
+
+Модулі пакета не імпортують tkinter, а networkx/matplotlib підвантажуються
+лише в mlta.plotting під час малювання. Імена нижче доступні як mlta.<ім'я>;
+відповідний модуль імпортується при першому зверненні, тож сам
+"import mlta" нічого важкого не завантажує.
+"""
+
+import importlib
+
+_EXPORTS = {
+    # ЛР №1 — представлення графів
+    "edges_to_adjacency_matrix": "mlta.representations",
+    "edges_to_incidence_matrix": "mlta.representations",
+    "adjacency_matrix_to_adj_list": "mlta.representations",
+    "edges_to_adj_list": "mlta.representations",
+    "CSRAdjacency": "mlta.sparse",
+    "COOIncidence": "mlta.sparse",
+    "load_edge_list": "mlta.loader",
+    "EdgeListGraph": "mlta.loader",
+    "load_binary": "mlta.binfmt",
+    "save_binary": "mlta.binfmt",
+    # ЛР №2 — обходи
+    "build_adj_list": "mlta.traversal",
+    "dfs_protocol": "mlta.traversal",
+    "iter_dfs_events": "mlta.traversal",
+    "dfs_snapshots": "mlta.traversal",
+    "bfs_protocol": "mlta.traversal",
+    "iter_bfs_events": "mlta.traversal",
+    "bfs_snapshots": "mlta.traversal",
+    "traversal_numbers": "mlta.traversal",
+    "bfs_direction_optimizing": "mlta.traversal",
+    "traversal_forest": "mlta.traversal",
+    "multi_source_bfs": "mlta.traversal",
+    "connected_components": "mlta.traversal",
+    "strongly_connected_components": "mlta.traversal",
+    "reachability_from_sources": "mlta.traversal",
+    "Graph": "mlta.graph",
+    "parallel_numbering": "mlta.parallel",
+    # ЛР №3 — найкоротші шляхи
+    "dijkstra": "mlta.shortest_paths",
+    "dijkstra_distances": "mlta.shortest_paths",
+    "iter_dijkstra_events": "mlta.shortest_paths",
+    "build_weighted_index": "mlta.shortest_paths",
+    "ShortestPathEngine": "mlta.shortest_paths",
+    "euclidean_heuristic": "mlta.shortest_paths",
+    "bellman_ford": "mlta.shortest_paths",
+    "floyd_warshall": "mlta.shortest_paths",
+    "make_sink": "mlta.protocol",
+    "all_pairs_floyd": "mlta.apsp",
+    "all_pairs_floyd_memmap": "mlta.apsp",
+    "open_distance_matrix": "mlta.apsp",
+    "all_pairs_dijkstra": "mlta.apsp",
+    "DynamicShortestPaths": "mlta.dynamic",
+    "DistanceTreeCache": "mlta.query_cache",
+    "ContractionHierarchy": "mlta.ch",
+    # ЛР №4 — жадібні алгоритми
+    "minimal_coins": "mlta.greedy",
+    "decompose_even_powers": "mlta.greedy",
+    # ЛР №5 — динамічне програмування
+    "rod_cutting_memo": "mlta.dp",
+    "rod_cutting_table": "mlta.dp",
+    "optimize_printing": "mlta.dp",
+    "PrintJob": "mlta.dp",
+    "PrinterConstraints": "mlta.dp",
+    # ЛР №6 — максимальний потік і Trie
+    "build_capacity_graph": "mlta.flow",
+    "edmonds_karp": "mlta.flow",
+    "solve_logistics": "mlta.flow",
+    "Trie": "mlta.trie",
+    "Homework": "mlta.trie",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'mlta' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
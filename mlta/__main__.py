@@ -0,0 +1,5 @@
+import sys
+
+from mlta.cli import main
+
+sys.exit(main())
@@ -0,0 +1,359 @@
+import math
+import os
+from multiprocessing import Pool
+
+from mlta.samples import VERTICES_WEIGHTED as VERTICES, EDGES_WEIGHTED as EDGES
+from mlta.shortest_paths import (
+    bellman_ford_potentials,
+    build_weighted_index,
+    dijkstra_arrays,
+    reweighted_index,
+)
+from mlta.sparse import HAS_NP
+
+# -------------------------------------------------------------
+#     ВСІ ПАРИ НАЙКОРОТШИХ ШЛЯХІВ: ФЛОЙД–УОРШЕЛЛ НА NUMPY
+# -------------------------------------------------------------
+#
+# Крок k алгоритму Флойда–Уоршелла — одна операція над усією матрицею:
+#     D = min(D, D[:, k] + D[k, :])
+# Блочний варіант обробляє матрицю плитками block × block, щоб плитки
+# рядка та стовпця k лишались у кеші, поки оновлюється решта.
+#
+# pred[i, j] — попередник j на найкоротшому шляху з i (-1, якщо шляху
+# немає або i == j). Паралельні ребра дають мінімальну вагу.
+
+BLOCK = 256
+
+
+def _require_numpy():
+    if not HAS_NP:
+        raise ImportError("Для матричного Флойда–Уоршелла потрібен numpy: pip install numpy")
+
+
+def _edge_arrays(vertices, edges, dtype):
+    """Номери кінців і ваги ребер як NumPy-масиви."""
+    import numpy as np
+
+    idx = {v: i for i, v in enumerate(vertices)}
+    edges = list(edges)
+    rows = np.fromiter((idx[u] for u, _, _ in edges), dtype=np.intp, count=len(edges))
+    cols = np.fromiter((idx[v] for _, v, _ in edges), dtype=np.intp, count=len(edges))
+    w = np.fromiter((w for _, _, w in edges), dtype=dtype, count=len(edges))
+    return rows, cols, w
+
+
+def initial_matrices(vertices=VERTICES, edges=EDGES, dtype="float64",
+                     predecessors=False):
+    """
+    Початкові D (inf поза ребрами, 0 на діагоналі) та, за потреби,
+    (pred, hops) — попередники й кількість ребер у поточних шляхах.
+    З паралельних ребер береться найлегше; петля змінює діагональ лише
+    тоді, коли вона від'ємна — те саме правило, що й у floyd_warshall.
+    """
+    _require_numpy()
+    import numpy as np
+
+    n = len(vertices)
+    D = np.full((n, n), np.inf, dtype=dtype)
+    np.fill_diagonal(D, 0)
+    rows, cols, w = _edge_arrays(vertices, edges, dtype)
+    np.minimum.at(D, (rows, cols), w)
+
+    paths = None
+    if predecessors:
+        has_edge = np.isfinite(D)
+        np.fill_diagonal(has_edge, False)
+        P = np.full((n, n), -1, dtype=np.int32 if n < 2**31 else np.int64)
+        P[has_edge] = np.nonzero(has_edge)[0]
+        H = np.where(has_edge, 1, 0).astype(np.int32)
+        paths = (P, H)
+    return D, paths
+
+
+def _relax(T, col, row, tmp, paths=None, k_paths=None):
+    """
+    T = min(T, col[:, None] + row[None, :]) на місці.
+    Якщо ведуться шляхи, при рівній довжині перемагає шлях з меншою
+    кількістю ребер: без цього ребра нульової ваги в блочному порядку
+    обчислень можуть замкнути попередників у цикл.
+    """
+    import numpy as np
+
+    np.add(col[:, None], row[None, :], out=tmp)
+    if paths is None:
+        np.minimum(T, tmp, out=T)
+        return
+    P, H = paths
+    P_row, H_col, H_row = k_paths
+    hops = H_col[:, None] + H_row[None, :]
+    better = (tmp < T) | ((tmp == T) & (hops < H) & np.isfinite(tmp))
+    np.copyto(T, tmp, where=better)
+    np.copyto(H, hops, where=better)
+    np.copyto(P, np.broadcast_to(P_row, P.shape), where=better)
+
+
+def floyd_warshall_vectorized(D, paths=None):
+    """Флойд–Уоршелл на місці: n кроків, кожен — одна векторна операція."""
+    import numpy as np
+
+    n = D.shape[0]
+    tmp = np.empty_like(D)
+    for k in range(n):
+        # рядок і стовпець k на кроці k не змінюються — копії для безпеки out=
+        col = D[:, k].copy()
+        row = D[k, :].copy()
+        k_paths = None
+        if paths is not None:
+            P, H = paths
+            k_paths = (P[k, :].copy(), H[:, k].copy(), H[k, :].copy())
+        _relax(D, col, row, tmp, paths, k_paths)
+    return D, paths
+
+
+def floyd_warshall_blocked(D, paths=None, block=BLOCK):
+    """
+    Блочний Флойд–Уоршелл на місці. Для кожної діагональної плитки kb:
+      1) звичайний алгоритм усередині плитки (kb, kb);
+      2) плитки рядка kb та стовпця kb — через уже готову (kb, kb);
+      3) решта плиток (i, j) — мін-плюс добуток (i, kb) ⊗ (kb, j).
+    """
+    import numpy as np
+
+    n = D.shape[0]
+    spans = [(s, min(n, s + block)) for s in range(0, n, block)]
+    tmp = np.empty((block, block), dtype=D.dtype)
+
+    def update(ti, tj, kb):
+        # T = плитка (ti, tj); проходимо всі k з плитки kb по порядку
+        rows, cols = slice(*ti), slice(*tj)
+        T = D[rows, cols]
+        buf = tmp[:T.shape[0], :T.shape[1]]
+        tile_paths = None
+        if paths is not None:
+            P, H = paths
+            tile_paths = (P[rows, cols], H[rows, cols])
+        for k in range(kb[0], kb[1]):
+            col = D[rows, k]
+            row = D[k, cols]
+            k_paths = None
+            if paths is not None:
+                k_paths = (P[k, cols], H[rows, k], H[k, cols])
+            if ti == kb or tj == kb:
+                # плитки на перетині з kb змінюються в межах кроку — копії
+                col, row = col.copy(), row.copy()
+                if k_paths is not None:
+                    k_paths = tuple(a.copy() for a in k_paths)
+            _relax(T, col, row, buf, tile_paths, k_paths)
+
+    for kb in spans:
+        update(kb, kb, kb)
+        for other in spans:
+            if other != kb:
+                update(kb, other, kb)
+                update(other, kb, kb)
+        for ti in spans:
+            if ti == kb:
+                continue
+            for tj in spans:
+                if tj != kb:
+                    update(ti, tj, kb)
+    return D, paths
+
+
+def all_pairs_floyd(vertices=VERTICES, edges=EDGES, method="auto", dtype="float64",
+                    predecessors=False, block=BLOCK):
+    """
+    Матриця відстаней для всіх пар вершин.
+    method: "vectorized" | "blocked" | "auto" (blocked, якщо n > 2 * block);
+    dtype="float32" вдвічі зменшує пам'ять і прискорює обчислення ціною точності.
+
+    Повертає словник:
+      {"vertices": [...], "dist": ndarray n×n, "pred": ndarray n×n або None}
+    """
+    if method not in ("auto", "vectorized", "blocked"):
+        raise ValueError("method має бути 'auto', 'vectorized' або 'blocked'.")
+    vertices = list(vertices)
+    D, paths = initial_matrices(vertices, edges, dtype, predecessors)
+    if method == "auto":
+        method = "blocked" if len(vertices) > 2 * block else "vectorized"
+    if method == "blocked":
+        floyd_warshall_blocked(D, paths, block)
+    else:
+        floyd_warshall_vectorized(D, paths)
+    return {"vertices": vertices, "dist": D, "pred": None if paths is None else paths[0]}
+
+
+def matrix_path(pred, i, j):
+    """Номери вершин шляху i → j за матрицею попередників ([] — шляху немає)."""
+    if i != j and pred[i, j] < 0:
+        return []
+    path = [j]
+    while j != i:
+        j = int(pred[i, j])
+        path.append(j)
+    path.reverse()
+    return path
+
+
+def dist_to_lists(D, integral=False):
+    """
+    ndarray → list-of-lists з math.inf, як у floyd_warshall; integral=True
+    повертає скінченні відстані як int (для цілих ваг).
+    """
+    rows = D.tolist()
+    if integral:
+        rows = [[x if math.isinf(x) else int(x) for x in row] for row in rows]
+    return rows
+
+
+# -------------------------------------------------------------
+#        МАТРИЦЯ ВІДСТАНЕЙ НА ДИСКУ (np.memmap, ФОРМАТ .npy)
+# -------------------------------------------------------------
+#
+# Для десятків тисяч вершин матриця n×n не вміщується в RAM. Тоді вона
+# живе у файлі .npy, відображеному в пам'ять: ініціалізація йде смугами
+# рядків, а блочний Флойд–Уоршелл оновлює плитки прямо у файлі, тож
+# у пам'яті одночасно лише кілька плиток. Готовий файл інші процеси
+# відкривають через open_distance_matrix (np.load з mmap_mode) без
+# копіювання; назви вершин лежать поряд у <path>.vertices, по одній
+# на рядок (як секція назв у mlta.binfmt). Перший рядок — заголовок
+# NAMES_HEADER + "int" або "str": як і FLAG_INT_NAMES у binfmt, "int"
+# означає, що всі назви були цілими числами й читаються назад як int.
+
+NAMES_HEADER = "# mlta vertices: "
+
+
+def _names_path(path):
+    return path + ".vertices"
+
+
+def _write_names(path, vertices):
+    names = [str(v) for v in vertices]
+    if any("\n" in name for name in names):
+        raise ValueError("Назви вершин не можуть містити символ нового рядка.")
+    kind = "int" if all(type(v) is int for v in vertices) else "str"
+    with open(_names_path(path), "w", encoding="utf-8") as f:
+        f.write(NAMES_HEADER + kind + "\n")
+        f.writelines(name + "\n" for name in names)
+
+
+def _read_names(path):
+    """Назви з <path>.vertices (None, якщо файлу немає)."""
+    try:
+        with open(_names_path(path), encoding="utf-8") as f:
+            lines = f.read().split("\n")[:-1]
+    except FileNotFoundError:
+        return None
+    kind = "str"
+    if lines and lines[0].startswith(NAMES_HEADER):
+        kind = lines.pop(0)[len(NAMES_HEADER):]
+    return [int(v) for v in lines] if kind == "int" else lines
+
+
+def all_pairs_floyd_memmap(path, vertices=VERTICES, edges=EDGES, dtype="float64",
+                           block=BLOCK):
+    """
+    Флойд–Уоршелл з матрицею у файлі path (.npy). Повертає
+    {"vertices": [...], "dist": np.memmap n×n, "path": path}.
+    dtype="float32" вдвічі зменшує файл і введення-виведення, але цілі
+    відстані, більші за 2**24, у ньому вже округлюються.
+    """
+    _require_numpy()
+    import numpy as np
+
+    vertices = list(vertices)
+    n = len(vertices)
+    _write_names(path, vertices)
+    rows, cols, w = _edge_arrays(vertices, edges, dtype)
+    order = np.argsort(rows, kind="stable")
+    rows, cols, w = rows[order], cols[order], w[order]
+    bounds = np.searchsorted(rows, np.arange(0, n + block, block))
+
+    D = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n, n))
+    for b, r0 in enumerate(range(0, n, block)):
+        r1 = min(n, r0 + block)
+        stripe = np.full((r1 - r0, n), np.inf, dtype=dtype)
+        stripe[np.arange(r1 - r0), np.arange(r0, r1)] = 0
+        lo, hi = bounds[b], bounds[b + 1]
+        np.minimum.at(stripe, (rows[lo:hi] - r0, cols[lo:hi]), w[lo:hi])
+        D[r0:r1] = stripe
+    D.flush()
+
+    floyd_warshall_blocked(D, None, block)
+    D.flush()
+    return {"vertices": vertices, "dist": D, "path": path}
+
+
+def open_distance_matrix(path, mode="r"):
+    """
+    Відкриває матрицю, збережену all_pairs_floyd_memmap, без читання в RAM.
+    Цілі назви вершин повертаються як int, решта — рядками (None, якщо
+    файлу назв немає).
+    """
+    _require_numpy()
+    import numpy as np
+
+    D = np.load(path, mmap_mode=mode)
+    return {"vertices": _read_names(path), "dist": D, "path": path}
+
+
+# -------------------------------------------------------------
+#     ВСІ ПАРИ ДЛЯ РОЗРІДЖЕНИХ ГРАФІВ: ДЕЙКСТРА З КОЖНОЇ ВЕРШИНИ
+# -------------------------------------------------------------
+#
+# O(V * E log V) замість O(V^3). Якщо є від'ємні ребра, ваги спершу
+# перезважуються потенціалами Беллмана–Форда (алгоритм Джонсона), а
+# відстані повертаються до справжніх: d(u, v) = d'(u, v) - h[u] + h[v].
+# Джерела діляться між процесами пулу; індекс передається кожному
+# процесу один раз через ініціалізатор.
+
+SOURCES_PER_TASK = 32
+PARALLEL_MIN_VERTICES = 256  # менші графи швидше порахувати в одному процесі
+
+_worker_index = None
+
+
+def _init_worker(index):
+    global _worker_index
+    _worker_index = index
+
+
+def _dijkstra_rows(sources):
+    return [(s, dijkstra_arrays(_worker_index, s)[0]) for s in sources]
+
+
+def all_pairs_dijkstra(vertices=VERTICES, edges=EDGES, directed=True, processes=None):
+    """
+    Матриця відстаней D[i][j] (list-of-lists, math.inf — шляху немає) у
+    тому ж вигляді, що й floyd_warshall, тож підходить для
+    format_distance_matrix. processes=1 — без пулу.
+    """
+    vertices = list(vertices)
+    n = len(vertices)
+    index = build_weighted_index(vertices, edges, directed)
+    h = None
+    if any(w < 0 for w in index["weights"]):
+        if not directed:
+            raise ValueError("Неорієнтоване ребро від'ємної ваги — це від'ємний цикл.")
+        h = bellman_ford_potentials(index)
+        index = reweighted_index(index, h)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    D = [None] * n
+    if processes == 1 or n < PARALLEL_MIN_VERTICES:
+        for s in range(n):
+            D[s] = dijkstra_arrays(index, s)[0]
+    else:
+        tasks = [range(i, min(n, i + SOURCES_PER_TASK)) for i in range(0, n, SOURCES_PER_TASK)]
+        with Pool(processes, initializer=_init_worker, initargs=(index,)) as pool:
+            for chunk in pool.imap_unordered(_dijkstra_rows, tasks):
+                for s, row in chunk:
+                    D[s] = row
+
+    if h is not None:
+        for s, row in enumerate(D):
+            hs = h[s]
+            D[s] = [d if d == math.inf else d - hs + h[t] for t, d in enumerate(row)]
+    return D
@@ -0,0 +1,262 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import Hashable, List, Optional, Sequence
+
+from mlta.sparse import CSRAdjacency, build_csr_arrays
+
+# -----------------------------------------------------------
+#          БІНАРНИЙ ФОРМАТ ГРАФА (.mltag) + MMAP
+# -----------------------------------------------------------
+#
+# Структура файлу (little-endian, кожна секція вирівняна до 8 байтів):
+#   заголовок (64 байти, HEADER);
+#   offsets  — int32 × (n + 1);
+#   targets  — int32 × nnz;
+#   counts   — int32 × nnz            (якщо FLAG_COUNTS);
+#   weights  — int64/float64 × nnz    (якщо FLAG_WEIGHTS);
+#   names    — назви вершин у UTF-8, розділені "\n" (якщо FLAG_NAMES).
+#
+# Назви пишуться як str(v); FLAG_INT_NAMES означає, що всі назви були
+# цілими числами, і при читанні вони знову стають int. Назви інших типів
+# повертаються рядками.
+#
+# FLAG_UNSORTED означає, що сусіди в рядках ідуть у порядку появи ребер,
+# а паралельні ребра записані окремо (так пише save_edge_graph, бо в них
+# можуть бути різні ваги). to_csr() тоді сортує й зливає рядки.
+#
+# Масиви читаються через mmap без копіювання: кілька процесів, що
+# відкрили той самий файл, спільно використовують сторінки кешу ОС.
+
+MAGIC = b"MLTAGRF\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHHqqq")  # magic, version, flags, n, nnz, names_bytes
+HEADER_SIZE = 64
+
+FLAG_DIRECTED = 1
+FLAG_COUNTS = 2
+FLAG_WEIGHTS = 4
+FLAG_FLOAT_WEIGHTS = 8
+FLAG_NAMES = 16
+FLAG_UNSORTED = 32
+FLAG_INT_NAMES = 64
+
+INT32_MAX = 2**31 - 1
+
+
+def _align(pos: int) -> int:
+    return (pos + 7) & ~7
+
+
+def _as_array(data, typecode: str) -> array:
+    if isinstance(data, array) and data.typecode == typecode:
+        arr = data
+    else:
+        arr = array(typecode, data)
+    if sys.byteorder == "big":
+        arr = array(typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+def _is_identity(vertices) -> bool:
+    return all(v == i and type(v) is int for i, v in enumerate(vertices))
+
+
+def save_binary(path: str, offsets, targets, counts=None, weights=None,
+                vertices: Optional[Sequence[Hashable]] = None,
+                directed: bool = False, sorted_rows: bool = True) -> None:
+    """
+    Записує CSR-масиви у бінарний файл. Кожна секція пишеться одним
+    викликом write. vertices (рядки без "\n" або цілі числа) зберігаються
+    як назви; якщо не задані або це номери 0..n-1 — секція назв не пишеться.
+    sorted_rows=False — рядки не відсортовані й можуть мати повтори.
+    """
+    n = len(offsets) - 1
+    nnz = len(targets)
+    if nnz > INT32_MAX or n > INT32_MAX:
+        raise ValueError("Формат підтримує не більше 2^31 - 1 вершин і ребер.")
+    if counts is not None and len(counts) != nnz:
+        raise ValueError("counts повинен мати довжину nnz.")
+    if weights is not None and len(weights) != nnz:
+        raise ValueError("weights повинен мати довжину nnz.")
+
+    flags = FLAG_DIRECTED if directed else 0
+    if not sorted_rows:
+        flags |= FLAG_UNSORTED
+    sections = [_as_array(offsets, "i"), _as_array(targets, "i")]
+    if counts is not None:
+        flags |= FLAG_COUNTS
+        sections.append(_as_array(counts, "i"))
+    if weights is not None:
+        flags |= FLAG_WEIGHTS
+        is_float = (isinstance(weights, array) and weights.typecode in "fd") or \
+            any(isinstance(w, float) for w in weights)
+        if is_float:
+            flags |= FLAG_FLOAT_WEIGHTS
+        sections.append(_as_array(weights, "d" if is_float else "q"))
+
+    names = b""
+    if vertices is not None and not _is_identity(vertices):
+        if len(vertices) != n:
+            raise ValueError("Кількість назв вершин має дорівнювати n.")
+        text = "\n".join(str(v) for v in vertices)
+        if text.count("\n") != max(0, n - 1):
+            raise ValueError("Назви вершин не можуть містити символ нового рядка.")
+        flags |= FLAG_NAMES
+        if all(type(v) is int for v in vertices):
+            flags |= FLAG_INT_NAMES
+        names = text.encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, n, nnz, len(names)).ljust(HEADER_SIZE, b"\0"))
+        pos = HEADER_SIZE
+        for arr in sections:
+            f.write(arr.tobytes())
+            pos += arr.itemsize * len(arr)
+            pad = _align(pos) - pos
+            f.write(b"\0" * pad)
+            pos += pad
+        f.write(names)
+
+
+def save_csr(path: str, csr: CSRAdjacency) -> None:
+    """Зберігає CSRAdjacency (ЛР №1) разом із кратностями та назвами."""
+    save_binary(path, csr.offsets, csr.targets, counts=csr.counts,
+                vertices=csr.vertices, directed=csr.directed)
+
+
+def save_edge_graph(path: str, graph) -> None:
+    """
+    Зберігає EdgeListGraph (mlta.loader): ребра групуються за початковою
+    вершиною, ваги (якщо є) — в окремій секції.
+    """
+    offsets, targets, weights = build_csr_arrays(
+        graph.n, graph.src, graph.dst, graph.weights, graph.directed)
+    save_binary(path, offsets, targets, weights=weights,
+                vertices=graph.vertices, directed=graph.directed, sorted_rows=False)
+
+
+class BinaryGraph:
+    """
+    Граф, відкритий з бінарного файлу через mmap. Атрибути offsets,
+    targets, counts, weights — memoryview над сторінками файлу (без копій).
+    Закривати через close() або контекстний менеджер.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, flags, n, nnz, names_bytes = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"'{path}' не є бінарним файлом графа.")
+            if version != VERSION:
+                raise ValueError(f"Непідтримувана версія формату: {version}.")
+            if sys.byteorder == "big":
+                raise ValueError("mmap-завантаження підтримується лише на little-endian.")
+
+            self.n = n
+            self.nnz = nnz
+            self.directed = bool(flags & FLAG_DIRECTED)
+            self.sorted_rows = not flags & FLAG_UNSORTED
+            self._views = []
+
+            pos = HEADER_SIZE
+            self.offsets, pos = self._section(pos, "i", n + 1)
+            self.targets, pos = self._section(pos, "i", nnz)
+            self.counts = self.weights = None
+            if flags & FLAG_COUNTS:
+                self.counts, pos = self._section(pos, "i", nnz)
+            if flags & FLAG_WEIGHTS:
+                fmt = "d" if flags & FLAG_FLOAT_WEIGHTS else "q"
+                self.weights, pos = self._section(pos, fmt, nnz)
+
+            self._names_span = (pos, pos + names_bytes) if flags & FLAG_NAMES else None
+            self._int_names = bool(flags & FLAG_INT_NAMES)
+            self._vertices = None
+        except Exception:
+            self.close()
+            raise
+
+    def _section(self, pos: int, fmt: str, count: int):
+        size = struct.calcsize(fmt) * count
+        if pos + size > len(self._mm):
+            raise ValueError(f"Файл '{self.path}' обрізаний.")
+        raw = memoryview(self._mm)[pos:pos + size]
+        view = raw.cast(fmt)
+        self._views.extend((view, raw))
+        return view, _align(pos + size)
+
+    @property
+    def vertices(self) -> List[Hashable]:
+        """Назви вершин (декодуються при першому зверненні; цілі — як int)."""
+        if self._vertices is None:
+            if self._names_span is None:
+                self._vertices = list(range(self.n))
+            else:
+                lo, hi = self._names_span
+                text = self._mm[lo:hi].decode("utf-8")
+                self._vertices = text.split("\n") if self.n else []
+                if self._int_names:
+                    self._vertices = [int(v) for v in self._vertices]
+        return self._vertices
+
+    def to_csr(self) -> CSRAdjacency:
+        """
+        CSRAdjacency поверх відображених масивів (без копій). Якщо рядки
+        у файлі не відсортовані, вони сортуються, а повтори зливаються
+        в кратності — тоді масиви копіюються.
+        """
+        counts = self.counts
+        if counts is None:
+            counts = array("i", [1]) * self.nnz
+        if self.sorted_rows:
+            return CSRAdjacency(self.vertices, self.offsets, self.targets, counts,
+                                self.directed)
+
+        offsets = array("i", [0]) * (self.n + 1)
+        targets = array("i")
+        merged = array("i")
+        for i in range(self.n):
+            lo, hi = self.offsets[i], self.offsets[i + 1]
+            prev = -1
+            for j, c in sorted(zip(self.targets[lo:hi], counts[lo:hi])):
+                if j == prev:
+                    merged[-1] += c
+                else:
+                    targets.append(j)
+                    merged.append(c)
+                    prev = j
+            offsets[i + 1] = len(targets)
+        return CSRAdjacency(self.vertices, offsets, targets, merged, self.directed)
+
+    def close(self) -> None:
+        """
+        Звільняє відображення. Якщо десь ще живуть зрізи масивів,
+        mmap повідомить про це через BufferError.
+        """
+        for view in getattr(self, "_views", ()):
+            view.release()
+        self._views = []
+        self.offsets = self.targets = self.counts = self.weights = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self) -> "BinaryGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        return f"BinaryGraph('{self.path}', n={self.n}, nnz={self.nnz}, {kind})"
+
+
+def load_binary(path: str) -> BinaryGraph:
+    return BinaryGraph(path)
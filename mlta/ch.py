@@ -0,0 +1,375 @@
+import heapq
+import math
+import struct
+import sys
+from array import array
+
+from mlta.samples import VERTICES_WEIGHTED as VERTICES, EDGES_WEIGHTED as EDGES
+
+# -------------------------------------------------------------
+#                 ІЄРАРХІЇ СТЯГНЕННЯ (CONTRACTION HIERARCHIES)
+# -------------------------------------------------------------
+#
+# Попередня обробка: вершини по черзі "стягуються" у порядку важливості
+# (різниця ребер + кількість уже стягнутих сусідів, з лінивим
+# оновленням пріоритетів). Стягуючи v, для кожної пари сусідів u → v → w
+# перевіряємо обмеженим пошуком, чи є шлях u → w в обхід v не довший за
+# u → v → w; якщо немає — додаємо ребро-скорочення u → w (середина v).
+#
+# Запит: двобічна Дейкстра, що з обох кінців іде лише "вгору" за рангом.
+# Обидва пошуки зустрічаються у найважливішій вершині шляху, тож на
+# великих графах вони торкаються сотень вершин замість мільйонів;
+# вершини, до яких є коротший шлях згори, "зупиняються" (stall-on-demand).
+# Скорочення розгортаються назад у вихідні ребра через їхні середини.
+#
+# Формат файлу (little-endian, секції вирівняні до 8 байтів):
+#   заголовок (64 байти, HEADER): magic, version, flags, n, m_up, m_down, names_bytes;
+#   rank                                             — int32 × n;
+#   up: offsets int32 × (n+1), targets int32, weights float64, mids int32;
+#   down: те саме (ребра x → v з rank[x] > rank[v], згруповані за v);
+#   names — назви вершин у UTF-8 через "\n" (якщо FLAG_NAMES).
+#
+# Назви пишуться як str(v); FLAG_INT_NAMES означає, що всі назви були
+# цілими числами, і при читанні вони знову стають int.
+
+MAGIC = b"MLTACH\x00\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHHqqqq")
+HEADER_SIZE = 64
+
+FLAG_DIRECTED = 1
+FLAG_INTEGRAL = 2
+FLAG_NAMES = 4
+FLAG_INT_NAMES = 8
+
+WITNESS_SETTLE_LIMIT = 64  # скільки вершин максимум вибирає пошук свідка
+
+
+def _witness_search(out, source, skip, targets, limit, settle_limit):
+    """
+    Обмежена Дейкстра з source в обхід вершини skip: зупиняється, коли
+    вибрано всі targets, відстань перевищила limit або вибрано
+    settle_limit вершин.
+    """
+    dist = {source: 0}
+    heap = [(0, source)]
+    left = set(targets)
+    settled = 0
+    while heap and left and settled < settle_limit:
+        d, x = heapq.heappop(heap)
+        if d > dist[x]:
+            continue
+        if d > limit:
+            break
+        settled += 1
+        left.discard(x)
+        for y, (w, _) in out[x].items():
+            nd = d + w
+            if nd <= limit and y != skip and nd < dist.get(y, math.inf):
+                dist[y] = nd
+                heapq.heappush(heap, (nd, y))
+    return dist
+
+
+def _shortcuts(out, inn, v, settle_limit):
+    """Скорочення (u, w, вага), потрібні при стягуванні v."""
+    result = []
+    outs = [(w, c) for w, (c, _) in out[v].items()]
+    if not outs:
+        return result
+    targets = [w for w, _ in outs]
+    max_out = max(c for _, c in outs)
+    for u, (cu, _) in inn[v].items():
+        dist = _witness_search(out, u, v, targets, cu + max_out, settle_limit)
+        for w, cw in outs:
+            if w != u and dist.get(w, math.inf) > cu + cw:
+                result.append((u, w, cu + cw))
+    return result
+
+
+class ContractionHierarchy:
+    """
+    Ієрархія стягнення зваженого графа (ваги невід'ємні).
+    build() — попередня обробка; query() / distance() — запити;
+    save() / load() — збереження на диск.
+    """
+
+    def __init__(self, vertices, rank, up, down, directed, integral):
+        self.vertices = list(vertices)
+        self.idx = {v: i for i, v in enumerate(self.vertices)}
+        self.rank = rank
+        self.up = up          # (offsets, targets, weights, mids): ребра вгору
+        self.down = down      # те саме для зворотного пошуку
+        self.directed = directed
+        self.integral = integral
+        self._mid = {}
+        for (offsets, targets, _, mids), forward in ((up, True), (down, False)):
+            for x in range(len(self.vertices)):
+                for p in range(offsets[x], offsets[x + 1]):
+                    if mids[p] >= 0:
+                        key = (x, targets[p]) if forward else (targets[p], x)
+                        self._mid[key] = mids[p]
+
+    # ---------------------- попередня обробка ----------------------
+
+    @classmethod
+    def build(cls, vertices=VERTICES, edges=EDGES, directed=True,
+              settle_limit=WITNESS_SETTLE_LIMIT):
+        vertices = list(vertices)
+        n = len(vertices)
+        idx = {v: i for i, v in enumerate(vertices)}
+        out = [dict() for _ in range(n)]  # out[x][y] = (вага, середина або -1)
+        inn = [dict() for _ in range(n)]
+        integral = True
+        for u, v, w in edges:
+            if w < 0:
+                raise ValueError("Ієрархія стягнення потребує невід'ємних ваг.")
+            integral = integral and isinstance(w, int)
+            i, j = idx[u], idx[v]
+            arcs = ((i, j),) if directed or i == j else ((i, j), (j, i))
+            for a, b in arcs:
+                if a != b and w < out[a].get(b, (math.inf,))[0]:
+                    out[a][b] = (w, -1)
+                    inn[b][a] = (w, -1)
+
+        deleted = [0] * n
+
+        def priority(v):
+            shortcuts = len(_shortcuts(out, inn, v, settle_limit))
+            return shortcuts - len(out[v]) - len(inn[v]) + deleted[v]
+
+        current = [priority(v) for v in range(n)]
+        heap = [(p, v) for v, p in enumerate(current)]
+        heapq.heapify(heap)
+        contracted = [False] * n
+        rank = array("i", [0]) * n
+        up_lists = [[] for _ in range(n)]
+        down_lists = [[] for _ in range(n)]
+        order = 0
+
+        while heap:
+            p, v = heapq.heappop(heap)
+            if contracted[v] or p != current[v]:
+                continue  # застарілий запис купи
+            # ліниве оновлення: якщо пріоритет погіршився — повертаємо в купу
+            p = current[v] = priority(v)
+            if heap and p > heap[0][0]:
+                heapq.heappush(heap, (p, v))
+                continue
+
+            for u, w, c in _shortcuts(out, inn, v, settle_limit):
+                if c < out[u].get(w, (math.inf,))[0]:
+                    out[u][w] = (c, v)
+                    inn[w][u] = (c, v)
+
+            contracted[v] = True
+            rank[v] = order
+            order += 1
+            for w, (c, mid) in out[v].items():
+                up_lists[v].append((w, c, mid))
+                del inn[w][v]
+                deleted[w] += 1
+            for u, (c, mid) in inn[v].items():
+                down_lists[v].append((u, c, mid))
+                del out[u][v]
+                deleted[u] += 1
+            neighbours = out[v].keys() | inn[v].keys()
+            out[v] = {}
+            inn[v] = {}
+            # пріоритети сусідів змінились найсильніше — оновлюємо їх одразу
+            for x in neighbours:
+                current[x] = priority(x)
+                heapq.heappush(heap, (current[x], x))
+
+        return cls(vertices, rank, _to_csr(up_lists), _to_csr(down_lists),
+                   directed, integral)
+
+    # ---------------------------- запити ---------------------------
+
+    def _search(self, s, t):
+        """(відстань, вершина зустрічі, pred вперед, pred назад, вибрано вершин)."""
+        inf = math.inf
+        sides = (self.up, self.down)
+        dist = ({s: 0}, {t: 0})
+        pred = ({s: -1}, {t: -1})
+        heaps = ([(0, s)], [(0, t)])
+        best, meet = (0, s) if s == t else (inf, -1)
+        settled = 0
+
+        while True:
+            kf = heaps[0][0][0] if heaps[0] else inf
+            kb = heaps[1][0][0] if heaps[1] else inf
+            if min(kf, kb) >= best:
+                break
+            side = 0 if kf <= kb else 1
+            my_dist, my_pred, heap = dist[side], pred[side], heaps[side]
+            d, x = heapq.heappop(heap)
+            if d > my_dist[x]:
+                continue
+            settled += 1
+            other = dist[1 - side].get(x)
+            if other is not None and d + other < best:
+                best, meet = d + other, x
+
+            # stall-on-demand: якщо до x можна дійти коротше згори (через
+            # вищу вершину y), x не лежить на найкоротшому шляху — не
+            # розширюємо його
+            offsets, targets, weights, _ = sides[1 - side]
+            lo, hi = offsets[x], offsets[x + 1]
+            for y, w in zip(targets[lo:hi], weights[lo:hi]):
+                if my_dist.get(y, inf) + w < d:
+                    break
+            else:
+                offsets, targets, weights, _ = sides[side]
+                lo, hi = offsets[x], offsets[x + 1]
+                for y, w in zip(targets[lo:hi], weights[lo:hi]):
+                    nd = d + w
+                    if nd < my_dist.get(y, inf):
+                        my_dist[y] = nd
+                        my_pred[y] = x
+                        heapq.heappush(heap, (nd, y))
+        return best, meet, pred[0], pred[1], settled
+
+    def _unpack(self, a, b, out):
+        """Додає до out вершини ребра (a, b) без a, розгортаючи скорочення."""
+        stack = [(a, b)]
+        while stack:
+            x, y = stack.pop()
+            m = self._mid.get((x, y))
+            if m is None:
+                out.append(y)
+            else:
+                stack.append((m, y))
+                stack.append((x, m))
+
+    def _value(self, d):
+        return int(d) if self.integral and d != math.inf else d
+
+    def vertex_id(self, v):
+        """Номер вершини (ValueError, якщо вершини немає)."""
+        i = self.idx.get(v)
+        if i is None:
+            raise ValueError(f"Вершини {v!r} немає в графі.")
+        return i
+
+    def distance(self, source, target):
+        """Лише відстань (без розгортання шляху)."""
+        return self._value(self._search(self.vertex_id(source), self.vertex_id(target))[0])
+
+    def query(self, source, target):
+        """
+        Повертає {"dist": відстань, "path": [source, ..., target] (порожній,
+        якщо шляху немає), "settled": кількість вибраних вершин}.
+        """
+        s, t = self.vertex_id(source), self.vertex_id(target)
+        best, meet, pf, pb, settled = self._search(s, t)
+        if meet < 0:
+            return {"dist": math.inf, "path": [], "settled": settled}
+
+        chain = [meet]
+        while pf[chain[-1]] != -1:
+            chain.append(pf[chain[-1]])
+        chain.reverse()
+        x = meet
+        while pb[x] != -1:
+            chain.append(pb[x])
+            x = pb[x]
+
+        path = [chain[0]]
+        for a, b in zip(chain, chain[1:]):
+            self._unpack(a, b, path)
+        return {"dist": self._value(best), "path": [self.vertices[i] for i in path],
+                "settled": settled}
+
+    # ------------------------ збереження ------------------------
+
+    def save(self, path):
+        """Зберігає ієрархію; назви вершин (якщо це не 0..n-1) — як str(v)."""
+        names = b""
+        flags = (FLAG_DIRECTED if self.directed else 0) | (FLAG_INTEGRAL if self.integral else 0)
+        if any(not (type(v) is int and v == i) for i, v in enumerate(self.vertices)):
+            text = "\n".join(str(v) for v in self.vertices)
+            if text.count("\n") != max(0, len(self.vertices) - 1):
+                raise ValueError("Назви вершин не можуть містити символ нового рядка.")
+            flags |= FLAG_NAMES
+            if all(type(v) is int for v in self.vertices):
+                flags |= FLAG_INT_NAMES
+            names = text.encode("utf-8")
+
+        sections = [array("i", self.rank)]
+        for offsets, targets, weights, mids in (self.up, self.down):
+            sections += [array("i", offsets), array("i", targets),
+                         array("d", weights), array("i", mids)]
+        if sys.byteorder == "big":
+            for arr in sections:
+                arr.byteswap()
+
+        n = len(self.vertices)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, flags, n, len(self.up[1]),
+                                len(self.down[1]), len(names)).ljust(HEADER_SIZE, b"\0"))
+            for arr in sections:
+                raw = arr.tobytes()
+                f.write(raw + b"\0" * (-len(raw) % 8))
+            f.write(names)
+
+    @classmethod
+    def load(cls, path):
+        """Читає ієрархію, збережену save(); перебудова графа не потрібна."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER_SIZE or data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{path}' не є файлом ієрархії стягнення.")
+        _, version, flags, n, m_up, m_down, names_bytes = HEADER.unpack_from(data, 0)
+        if version != VERSION:
+            raise ValueError(f"Непідтримувана версія формату: {version}.")
+
+        pos = HEADER_SIZE
+
+        def section(fmt, count):
+            nonlocal pos
+            arr = array(fmt)
+            size = arr.itemsize * count
+            if pos + size > len(data):
+                raise ValueError(f"Файл '{path}' обрізаний.")
+            arr.frombytes(data[pos:pos + size])
+            if sys.byteorder == "big":
+                arr.byteswap()
+            pos += size + (-size % 8)
+            return arr
+
+        rank = section("i", n)
+        parts = []
+        for m in (m_up, m_down):
+            offsets = section("i", n + 1).tolist()
+            targets = section("i", m).tolist()
+            weights = section("d", m).tolist()
+            mids = section("i", m).tolist()
+            parts.append((offsets, targets, weights, mids))
+
+        if flags & FLAG_NAMES:
+            text = data[pos:pos + names_bytes].decode("utf-8")
+            vertices = text.split("\n") if n else []
+            if flags & FLAG_INT_NAMES:
+                vertices = [int(v) for v in vertices]
+        else:
+            vertices = list(range(n))
+        return cls(vertices, rank, parts[0], parts[1],
+                   bool(flags & FLAG_DIRECTED), bool(flags & FLAG_INTEGRAL))
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return (f"ContractionHierarchy(n={len(self.vertices)}, up={len(self.up[1])}, "
+                f"down={len(self.down[1])}, shortcuts={len(self._mid)}, {kind})")
+
+
+def _to_csr(lists):
+    """Списки (ціль, вага, середина) → (offsets, targets, weights, mids) як списки Python."""
+    offsets, targets, weights, mids = [0], [], [], []
+    for row in lists:
+        for y, w, m in row:
+            targets.append(y)
+            weights.append(w)
+            mids.append(m)
+        offsets.append(len(targets))
+    return offsets, targets, weights, mids
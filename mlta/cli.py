@@ -0,0 +1,425 @@
+"""
+Пакетний запуск алгоритмів лабораторних робіт з командного рядка.
+
+    python -m mlta TASK INPUT... [-o OUT] [--protocol [--protocol-mode MODE]]
+
+Кожен INPUT — файл JSON lines ("-" — stdin), один екземпляр задачі на
+рядок. Результати пишуться як JSON lines (по рядку на екземпляр) разом
+із часом виконання алгоритму. TASK=auto бере назву задачі з поля "task"
+кожного рядка.
+
+Поля екземплярів:
+  dfs, bfs   {"edges": [[u, v], ...], "vertices": [...], "start": u, "directed": bool}
+  dijkstra   {"edges": [[u, v, w], ...], "vertices": [...], "source": u}
+             необов'язковий "target": t — відповідь {"dist", "path"} замість
+             усіх відстаней (з --protocol і без нього)
+  floyd      {"edges": [[u, v, w], ...], "vertices": [...]}
+             з паралельних ребер береться найлегше, діагональ — 0 (петля
+             враховується лише від'ємна) — з --protocol і без нього;
+             відстані з нульовою дробовою частиною виводяться як цілі
+  johnson    {"edges": [[u, v, w], ...], "vertices": [...], "processes": 4}
+  coins      {"n": 90}
+  powers     {"n": 21}
+  rod        {"length": 5, "prices": [2, 5, 7, 8, 10], "method": "table" | "memo"}
+  print      {"jobs": [["M1", 30, 1, 120], ...] або "M1,30,1,120\\n...",
+              "max_volume": 60, "max_items": 3}
+  maxflow    {"edges": [[u, v, c], ...], "source": s, "sink": t}
+             або {"logistics": true, "variant": bool} — мережа з ЛР №6
+  trie       {"words": [...], "queries": [["has_prefix", "app"],
+              ["count_words_with_suffix", "na"], ["exists_with_mismatch", "cot", 1],
+              ["total_characters"]]}
+
+Для графових задач замість "edges" можна вказати "graph": шлях до файлу
+зі списком ребер (текст/CSV/gzip, див. mlta.loader). Нескінченні
+відстані в JSON записуються як null.
+"""
+
+import argparse
+import functools
+import json
+import math
+import sys
+import time
+
+from mlta.loader import load_edge_list
+
+# -----------------------------------------------------------
+#                   ДОПОМІЖНІ ФУНКЦІЇ
+# -----------------------------------------------------------
+
+
+def _timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def _protocol_sink(with_protocol):
+    """Приймач протоколу Дейкстри/Флойда: with_protocol — True або фабрика приймачів."""
+    from mlta.protocol import ListSink
+
+    return with_protocol() if callable(with_protocol) else ListSink()
+
+
+def _finite(x):
+    if isinstance(x, float) and math.isinf(x):
+        return None
+    return x
+
+
+def _matrix_cell(x):
+    """Клітинка матриці відстаней: inf → None, ціле значення → int."""
+    if isinstance(x, float):
+        if math.isinf(x):
+            return None
+        if x.is_integer():
+            return int(x)
+    return x
+
+
+class GraphCache:
+    """Графи, завантажені з файлів, — один раз на (шлях, орієнтованість)."""
+
+    def __init__(self):
+        self._graphs = {}
+
+    def get(self, path, directed, weighted):
+        key = (path, directed, weighted)
+        if key not in self._graphs:
+            self._graphs[key] = load_edge_list(path, directed=directed, weighted=weighted)
+        return self._graphs[key]
+
+    def trees(self, path):
+        """Кеш дерев Дейкстри для зваженого орієнтованого графа з файлу."""
+        from mlta.graph import Graph
+        from mlta.query_cache import DistanceTreeCache
+
+        key = ("trees", path)
+        if key not in self._graphs:
+            g = self.get(path, True, True)
+            self._graphs[key] = DistanceTreeCache(
+                Graph(g.vertices, g.iter_weighted_edges(), directed=True))
+        return self._graphs[key]
+
+
+def _graph(inst, cache, directed, weighted):
+    """(vertices, edges) з полів "graph" або "vertices"/"edges"."""
+    if "graph" in inst:
+        g = cache.get(inst["graph"], directed, weighted)
+        edges = list(g.iter_weighted_edges() if weighted else g.iter_edges())
+        return g.vertices, edges
+
+    edges = [tuple(e) for e in inst["edges"]]
+    vertices = inst.get("vertices")
+    if vertices is None:
+        seen = {}
+        for e in edges:
+            seen.setdefault(e[0], None)
+            seen.setdefault(e[1], None)
+        vertices = list(seen)
+    return vertices, edges
+
+
+# -----------------------------------------------------------
+#                      ОБРОБНИКИ ЗАДАЧ
+# -----------------------------------------------------------
+
+
+def _run_traversal(events_fn, protocol_fn):
+    from mlta.traversal import traversal_numbers
+
+    def numbers(vertices, edges, start, directed):
+        return traversal_numbers(events_fn(vertices, edges, start, directed))
+
+    def run(inst, cache, with_protocol):
+        directed = inst.get("directed", False)
+        vertices, edges = _graph(inst, cache, directed, weighted=False)
+        if "start" in inst:
+            start = inst["start"]
+            if start not in vertices:
+                raise ValueError(f"Стартової вершини {start!r} немає в графі.")
+        elif vertices:
+            start = vertices[0]
+        else:
+            raise ValueError("Граф порожній, а стартову вершину (\"start\") не задано.")
+        if not with_protocol:
+            # лише номери: O(V + E) без копій стеку/черги на кожному кроці
+            numbering, seconds = _timed(numbers, vertices, edges, start, directed)
+            return {"numbering": numbering}, seconds
+        prot, seconds = _timed(protocol_fn, vertices, edges, start, directed)
+        numbering = {v: num for v, num, _ in prot if num != "-"}
+        return {"numbering": numbering, "protocol": prot}, seconds
+    return run
+
+
+def _run_dijkstra(inst, cache, with_protocol):
+    from mlta.shortest_paths import ShortestPathEngine, dijkstra
+
+    source, target = inst["source"], inst.get("target")
+    if "graph" in inst and not with_protocol:
+        # той самий файл і джерело в кількох рядках — дерево береться з кешу
+        trees = cache.trees(inst["graph"])
+        if target is not None:
+            (d, path), seconds = _timed(trees.path, source, target)
+            return {"dist": _finite(d), "path": path}, seconds
+        dist, seconds = _timed(trees.distances, source)
+        return {"dist": {v: _finite(d) for v, d in dist.items()}}, seconds
+
+    vertices, edges = _graph(inst, cache, True, weighted=True)
+
+    def solve():
+        engine = ShortestPathEngine(vertices, edges)
+        # ті самі ValueError, що й у гілці з кешем дерев
+        engine.require_non_negative()
+        engine.vertex_id(source)
+        prot = None
+        if with_protocol:
+            dist, prot = dijkstra(source, index=engine.index,
+                                  sink=_protocol_sink(with_protocol))
+        if target is not None:
+            return engine.path(source, target), prot
+        return (dist if with_protocol else engine.distances(source)), prot
+
+    (answer, prot), seconds = _timed(solve)
+    if target is not None:
+        d, path = answer
+        result = {"dist": _finite(d), "path": path}
+    else:
+        result = {"dist": {v: _finite(d) for v, d in answer.items()}}
+    if with_protocol:
+        result["protocol"] = prot
+    return result, seconds
+
+
+def _run_floyd(inst, cache, with_protocol):
+    from mlta.shortest_paths import floyd_warshall
+    from mlta.sparse import HAS_NP
+
+    vertices, edges = _graph(inst, cache, True, weighted=True)
+    if with_protocol or not HAS_NP:
+        sink = _protocol_sink(with_protocol) if with_protocol else None
+        (D, prot), seconds = _timed(floyd_warshall, vertices, edges, sink=sink)
+    else:
+        from mlta.apsp import all_pairs_floyd, dist_to_lists
+
+        res, seconds = _timed(all_pairs_floyd, vertices, edges)
+        D = dist_to_lists(res["dist"])
+    # NumPy рахує у float64, а floyd_warshall зберігає типи ваг — зводимо
+    # обидві гілки до одного вигляду
+    result = {"vertices": vertices, "matrix": [[_matrix_cell(x) for x in row] for row in D]}
+    if with_protocol:
+        result["protocol"] = prot
+    return result, seconds
+
+
+def _run_johnson(inst, cache, with_protocol):
+    from mlta.apsp import all_pairs_dijkstra
+
+    vertices, edges = _graph(inst, cache, True, weighted=True)
+    D, seconds = _timed(all_pairs_dijkstra, vertices, edges,
+                        processes=inst.get("processes"))
+    return {"vertices": vertices, "matrix": [[_finite(x) for x in row] for row in D]}, seconds
+
+
+def _run_coins(inst, cache, with_protocol):
+    from mlta.greedy import minimal_coins
+
+    text, seconds = _timed(minimal_coins, int(inst["n"]))
+    return {"result": text}, seconds
+
+
+def _run_powers(inst, cache, with_protocol):
+    from mlta.greedy import decompose_even_powers
+
+    text, seconds = _timed(decompose_even_powers, int(inst["n"]))
+    return {"result": text}, seconds
+
+
+def _run_rod(inst, cache, with_protocol):
+    from mlta.dp import rod_cutting_memo, rod_cutting_table
+
+    method = inst.get("method", "table")
+    fn = {"table": rod_cutting_table, "memo": rod_cutting_memo}[method]
+    return _timed(fn, int(inst["length"]), [int(p) for p in inst["prices"]])
+
+
+def _run_print(inst, cache, with_protocol):
+    from mlta.dp import PrinterConstraints, optimize_printing, parse_print_jobs
+
+    raw = inst["jobs"]
+    if isinstance(raw, str):
+        jobs = parse_print_jobs(raw)
+    else:
+        jobs = parse_print_jobs("\n".join(",".join(str(x) for x in job) for job in raw))
+    constraints = PrinterConstraints(max_volume=float(inst["max_volume"]),
+                                     max_items=int(inst["max_items"]))
+
+    res, seconds = _timed(optimize_printing, jobs, constraints)
+    batches = [
+        {
+            "jobs": [j.id for j in b.jobs],
+            "time_without_penalty": b.time_without_penalty,
+            "penalty": b.penalty,
+            "total_time": b.total_time,
+        }
+        for b in res["batches"]
+    ]
+    return {"print_order": res["print_order"], "total_time": res["total_time"],
+            "batches": batches}, seconds
+
+
+def _run_maxflow(inst, cache, with_protocol):
+    from mlta.flow import build_capacity_graph, edmonds_karp, solve_logistics
+
+    if inst.get("logistics"):
+        res, seconds = _timed(solve_logistics, bool(inst.get("variant", False)))
+        result = {
+            "max_flow": res["max_flow"],
+            "table": res["table"],
+            "terminal_totals": res["terminal_totals"],
+            "shop_totals": res["shop_totals"],
+        }
+        steps = res["steps"]
+    else:
+        _, edges = _graph(inst, cache, True, weighted=True)
+        source, sink = inst["source"], inst["sink"]
+
+        def solve():
+            capacity, adj = build_capacity_graph(edges, source, sink)
+            return edmonds_karp(capacity, adj, source, sink)
+
+        (max_flow, _, steps), seconds = _timed(solve)
+        result = {"max_flow": max_flow}
+
+    if with_protocol:
+        result["steps"] = steps
+    return result, seconds
+
+
+TRIE_QUERIES = ("has_prefix", "count_words_with_suffix", "exists_with_mismatch",
+                "total_characters")
+
+
+def _run_trie(inst, cache, with_protocol):
+    from mlta.trie import Homework
+
+    def run():
+        trie = Homework()
+        for i, w in enumerate(inst["words"]):
+            trie.put(w, i)
+        answers = []
+        for op, *args in inst.get("queries", []):
+            if op not in TRIE_QUERIES:
+                raise ValueError(f"Невідомий запит до Trie: {op}")
+            answers.append(getattr(trie, op)(*args))
+        return answers
+
+    answers, seconds = _timed(run)
+    return {"answers": answers}, seconds
+
+
+def _tasks():
+    from mlta.traversal import bfs_protocol, dfs_protocol, iter_bfs_events, iter_dfs_events
+
+    return {
+        "dfs": _run_traversal(iter_dfs_events, dfs_protocol),
+        "bfs": _run_traversal(iter_bfs_events, bfs_protocol),
+        "dijkstra": _run_dijkstra,
+        "floyd": _run_floyd,
+        "johnson": _run_johnson,
+        "coins": _run_coins,
+        "powers": _run_powers,
+        "rod": _run_rod,
+        "print": _run_print,
+        "maxflow": _run_maxflow,
+        "trie": _run_trie,
+    }
+
+
+TASK_NAMES = ("dfs", "bfs", "dijkstra", "floyd", "johnson", "coins", "powers",
+              "rod", "print", "maxflow", "trie")
+
+
+# -----------------------------------------------------------
+#                     ЗАПУСК З КОНСОЛІ
+# -----------------------------------------------------------
+
+
+def iter_instances(paths):
+    """Пари (мітка "файл:рядок", екземпляр) з усіх вхідних файлів."""
+    for path in paths:
+        f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            for lineno, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                yield f"{path}:{lineno}", line
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def run_batch(task, paths, out, with_protocol=False):
+    """
+    Виконує всі екземпляри; повертає кількість помилок. with_protocol —
+    False, True (повний протокол) або фабрика приймачів mlta.protocol.
+    """
+    handlers = _tasks()
+    cache = GraphCache()
+    errors = 0
+
+    for label, line in iter_instances(paths):
+        record = {"input": label}
+        try:
+            inst = json.loads(line)
+            name = inst.get("task", task) if task == "auto" else task
+            record["task"] = name
+            if name not in handlers:
+                raise ValueError(f"Невідома задача: {name}")
+            if "id" in inst:
+                record["id"] = inst["id"]
+            result, seconds = handlers[name](inst, cache, with_protocol)
+            record["seconds"] = seconds
+            record["result"] = result
+        except Exception as e:
+            errors += 1
+            record["error"] = f"{type(e).__name__}: {e}"
+
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m mlta",
+        description="Пакетний запуск алгоритмів ЛР №2–№6 над файлами JSON lines.",
+    )
+    parser.add_argument("task", choices=TASK_NAMES + ("auto",),
+                        help="задача для всіх екземплярів або auto (поле \"task\")")
+    parser.add_argument("inputs", nargs="+", help="файли JSON lines; '-' — stdin")
+    parser.add_argument("-o", "--output", help="файл результатів (типово stdout)")
+    parser.add_argument("--protocol", action="store_true",
+                        help="додати покроковий протокол (DFS/BFS, Дейкстра, Флойд, max flow)")
+    parser.add_argument("--protocol-mode", choices=("counters", "ring", "full"),
+                        default="full",
+                        help="протокол Дейкстри/Флойда: лише лічильники, останні "
+                             "--protocol-limit подій або весь")
+    parser.add_argument("--protocol-limit", type=int, default=1000,
+                        help="місткість кільцевого буфера для --protocol-mode ring")
+    args = parser.parse_args(argv)
+
+    with_protocol = args.protocol
+    if with_protocol and args.protocol_mode != "full":
+        from mlta.protocol import make_sink
+
+        with_protocol = functools.partial(make_sink, args.protocol_mode, args.protocol_limit)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        errors = run_batch(args.task, args.inputs, out, with_protocol)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if errors else 0
@@ -0,0 +1,232 @@
+from dataclasses import dataclass
+from typing import List, Dict, Tuple
+import math
+
+# ============================================================
+#                    ЗАВДАННЯ 1 — ROD CUTTING
+# ============================================================
+
+S_COST = 10  # фіксована вартість стрижня (варіант 11)
+
+
+def rod_cutting_memo(length: int, prices: List[int]) -> Dict:
+    """
+    Знаходить оптимальний спосіб розрізання через рекурсію з мемоізацією.
+    Повертає словник:
+      {
+        "gross_profit": ...,
+        "net_profit": ...,
+        "pieces": [...],
+        "cuts": ...
+      }
+    """
+    if length <= 0 or len(prices) != length:
+        raise ValueError("Довжина та кількість цін повинні збігатися і бути > 0.")
+
+    memo: Dict[int, Tuple[int, List[int]]] = {}
+
+    def helper(n: int) -> Tuple[int, List[int]]:
+        if n == 0:
+            return 0, []
+        if n in memo:
+            return memo[n]
+
+        best_profit = -math.inf
+        best_combo: List[int] = []
+
+        # пробуємо всі можливі перші відрізки довжини i (1..n)
+        for i in range(1, n + 1):
+            price_i = prices[i - 1]
+            remain_profit, remain_pieces = helper(n - i)
+            total = price_i + remain_profit
+            if total > best_profit:
+                best_profit = total
+                best_combo = [i] + remain_pieces
+
+        memo[n] = (best_profit, best_combo)
+        return memo[n]
+
+    gross_profit, pieces = helper(length)
+    net_profit = gross_profit - S_COST
+    cuts = max(0, len(pieces) - 1)
+
+    return {
+        "gross_profit": gross_profit,
+        "net_profit": net_profit,
+        "pieces": pieces,
+        "cuts": cuts,
+    }
+
+
+def rod_cutting_table(length: int, prices: List[int]) -> Dict:
+    """
+    Знаходить оптимальний спосіб розрізання через табуляцію.
+    """
+    if length <= 0 or len(prices) != length:
+        raise ValueError("Довжина та кількість цін повинні збігатися і бути > 0.")
+
+    # dp[i] — максимальний прибуток для довжини i
+    dp = [0] * (length + 1)
+    # choice[i] — довжина першого шматка для оптимального розбиття i
+    choice = [0] * (length + 1)
+
+    for n in range(1, length + 1):
+        best_profit = -math.inf
+        best_first = 0
+        for i in range(1, n + 1):
+            total = prices[i - 1] + dp[n - i]
+            if total > best_profit:
+                best_profit = total
+                best_first = i
+        dp[n] = best_profit
+        choice[n] = best_first
+
+    # Відновлення відрізків
+    pieces: List[int] = []
+    rem = length
+    while rem > 0:
+        p = choice[rem]
+        pieces.append(p)
+        rem -= p
+
+    gross_profit = dp[length]
+    net_profit = gross_profit - S_COST
+    cuts = max(0, len(pieces) - 1)
+
+    return {
+        "gross_profit": gross_profit,
+        "net_profit": net_profit,
+        "pieces": pieces,
+        "cuts": cuts,
+    }
+
+
+# ============================================================
+#   ЗАВДАННЯ 2 — ОПТИМІЗАЦІЯ ЧЕРГИ 3D-ПРИНТЕРА (варіант 11)
+# ============================================================
+
+@dataclass
+class PrintJob:
+    id: str
+    volume: float
+    priority: int  # 1, 2, 3
+    print_time: int  # хвилини
+
+
+@dataclass
+class PrinterConstraints:
+    max_volume: float
+    max_items: int
+
+
+@dataclass
+class Batch:
+    jobs: List[PrintJob]
+
+    @property
+    def total_volume(self) -> float:
+        return sum(j.volume for j in self.jobs)
+
+    @property
+    def has_p1(self) -> bool:
+        return any(j.priority == 1 for j in self.jobs)
+
+    @property
+    def has_p3(self) -> bool:
+        return any(j.priority == 3 for j in self.jobs)
+
+    @property
+    def time_without_penalty(self) -> int:
+        return max(j.print_time for j in self.jobs) if self.jobs else 0
+
+    @property
+    def penalty(self) -> int:
+        # Варіант 11: штраф 15 хв, якщо в партії змішані P1 та P3
+        return 15 if self.has_p1 and self.has_p3 else 0
+
+    @property
+    def total_time(self) -> int:
+        return self.time_without_penalty + self.penalty
+
+
+def optimize_printing(print_jobs: List[PrintJob],
+                      constraints: PrinterConstraints) -> Dict:
+    """
+    Жадібна оптимізація:
+      - сортуємо задачі за пріоритетом (1 -> 2 -> 3), потім за часом друку (спадно);
+      - додаємо в існуючі партії, не перевищуючи max_volume і max_items;
+      - намагаємось не створювати партій зі змішаним пріоритетом P1+P3.
+    """
+
+    # Сортування: вищий пріоритет перший, при однаковому — довший друк спочатку
+    jobs_sorted = sorted(print_jobs, key=lambda j: (j.priority, -j.print_time))
+
+    batches: List[Batch] = []
+
+    for job in jobs_sorted:
+        placed = False
+
+        # Спробуємо покласти завдання в існуючу партію
+        for batch in batches:
+            if batch.total_volume + job.volume > constraints.max_volume:
+                continue
+            if len(batch.jobs) + 1 > constraints.max_items:
+                continue
+
+            would_mixed_p1p3 = (
+                (job.priority == 1 and batch.has_p3) or
+                (job.priority == 3 and batch.has_p1)
+            )
+            if would_mixed_p1p3:
+                # Уникаємо створення нової партії зі штрафом, якщо можливо
+                continue
+
+            batch.jobs.append(job)
+            placed = True
+            break
+
+        if not placed:
+            # Створюємо нову партію
+            batches.append(Batch(jobs=[job]))
+
+    total_time = sum(b.total_time for b in batches)
+    print_order: List[str] = []
+    for b in batches:
+        for j in b.jobs:
+            print_order.append(j.id)
+
+    return {
+        "print_order": print_order,
+        "total_time": total_time,
+        "batches": batches,
+    }
+
+
+def parse_print_jobs(raw_text: str) -> List[PrintJob]:
+    """
+    Розбирає задачі друку, по одній на рядок у форматі id,об'єм,пріоритет,час.
+    Порожні рядки пропускаються; при помилці формату — ValueError.
+    """
+    jobs: List[PrintJob] = []
+
+    for line in raw_text.splitlines():
+        if not line.strip():
+            continue
+        parts = [p.strip() for p in line.split(",")]
+        if len(parts) != 4:
+            raise ValueError(
+                f"Рядок '{line}' має бути у форматі: id,об'єм,пріоритет,час"
+            )
+        jid = parts[0]
+        vol = float(parts[1])
+        prio = int(parts[2])
+        ptime = int(parts[3])
+
+        if prio not in (1, 2, 3):
+            raise ValueError(f"Невірний пріоритет у рядку '{line}' (має бути 1, 2 або 3).")
+        if vol <= 0 or ptime <= 0:
+            raise ValueError(f"Об'єм і час друку мають бути > 0 у рядку '{line}'.")
+
+        jobs.append(PrintJob(jid, vol, prio, ptime))
+
+    return jobs
@@ -0,0 +1,218 @@
+import heapq
+import math
+
+from mlta.samples import VERTICES_WEIGHTED as VERTICES, EDGES_WEIGHTED as EDGES
+
+# -------------------------------------------------------------
+#     ДИНАМІЧНІ НАЙКОРОТШІ ШЛЯХИ (ВСТАВКА / ВИДАЛЕННЯ / ВАГА)
+# -------------------------------------------------------------
+#
+# Для кожного джерела зберігаються dist і pred — дерево найкоротших
+# шляхів. Після зміни ребра (u, v) перераховується лише те, що могло
+# змінитися (підхід Рамалінгама–Репса):
+#   * вага зменшилась / ребро додано: якщо dist[u] + w < dist[v], з v
+#     запускається Дейкстра, що поширює лише покращення;
+#   * вага зросла / ребро видалено: якщо (u, v) — ребро дерева, усе
+#     піддерево v стає "ураженим"; кожна уражена вершина спершу
+#     отримує найкращу відстань через неуражених вхідних сусідів, а потім
+#     Дейкстра всередині ураженої множини довершує решту.
+# Робота пропорційна кількості вершин, чия відстань чи попередник
+# змінились (і їхнім ребрам), а не розміру графа. Для всіх пар те саме
+# робиться для кожного джерела: O(n) перевірок плюс розмір змін.
+#
+# Між парою вершин зберігається одне ребро: повторна вставка (u, v)
+# змінює його вагу. Ваги мають бути невід'ємні.
+
+EDGE_INSERT = "insert"
+EDGE_DELETE = "delete"
+EDGE_REWEIGHT = "reweight"
+
+
+class DynamicShortestPaths:
+    """
+    Найкоротші відстані з джерел sources (типово — з усіх вершин),
+    які підтримуються під час змін ребер.
+    """
+
+    def __init__(self, vertices=VERTICES, edges=EDGES, sources=None, directed=True):
+        self.vertices = list(vertices)
+        self.directed = directed
+        self.out = {v: {} for v in self.vertices}
+        self.inn = {v: {} for v in self.vertices}
+        for u, v, w in edges:
+            self._check_weight(w)
+            for a, b in self._arcs(u, v):
+                if w < self.out[a].get(b, math.inf):
+                    self.out[a][b] = w
+                    self.inn[b][a] = w
+
+        self.dist = {}
+        self.pred = {}
+        for s in (self.vertices if sources is None else sources):
+            self.add_source(s)
+
+    # ------------------------- джерела -------------------------
+
+    def add_source(self, s):
+        """Починає підтримувати відстані з s (повна Дейкстра один раз)."""
+        if s not in self.out:
+            raise ValueError(f"Вершини {s!r} немає в графі.")
+        dist = {v: math.inf for v in self.vertices}
+        pred = {v: None for v in self.vertices}
+        dist[s] = 0
+        self.dist[s] = dist
+        self.pred[s] = pred
+        self._propagate(dist, pred, [(0, s)])
+
+    # --------------------------- зміни --------------------------
+
+    def insert_edge(self, u, v, w):
+        """Додає ребро або змінює вагу наявного. Повертає кількість змінених відстаней."""
+        return self.update_weight(u, v, w)
+
+    def delete_edge(self, u, v):
+        self._require_edge(u, v)
+        return self.update_weight(u, v, math.inf)
+
+    def update_weight(self, u, v, w):
+        self._check_weight(w)
+        for x in (u, v):
+            if x not in self.out:
+                raise ValueError(f"Вершини {x!r} немає в графі.")
+        changed = 0
+        for a, b in self._arcs(u, v):
+            old = self.out[a].get(b, math.inf)
+            if w == math.inf:
+                self.out[a].pop(b, None)
+                self.inn[b].pop(a, None)
+            else:
+                self.out[a][b] = w
+                self.inn[b][a] = w
+            if w < old:
+                changed += self._on_decrease(a, b, w)
+            elif w > old:
+                changed += self._on_increase(a, b)
+        return changed
+
+    def apply(self, events):
+        """
+        Послідовність подій (EDGE_INSERT, u, v, w), (EDGE_DELETE, u, v),
+        (EDGE_REWEIGHT, u, v, w). Повертає сумарну кількість змінених відстаней.
+        """
+        changed = 0
+        for kind, u, v, *rest in events:
+            if kind == EDGE_DELETE:
+                changed += self.delete_edge(u, v)
+            elif kind in (EDGE_INSERT, EDGE_REWEIGHT):
+                if kind == EDGE_REWEIGHT:
+                    self._require_edge(u, v)
+                changed += self.update_weight(u, v, rest[0])
+            else:
+                raise ValueError(f"Невідома подія: {kind}")
+        return changed
+
+    # --------------------------- запити -------------------------
+
+    def distance(self, s, t):
+        return self.dist[s][t]
+
+    def distances(self, s):
+        return dict(self.dist[s])
+
+    def path(self, s, t):
+        """(відстань, [s, ..., t]) або (math.inf, [])."""
+        d = self.dist[s][t]
+        if d == math.inf:
+            return d, []
+        pred = self.pred[s]
+        path = [t]
+        while t != s:
+            t = pred[t]
+            path.append(t)
+        path.reverse()
+        return d, path
+
+    def matrix(self):
+        """Матриця відстаней у вигляді floyd_warshall (для format_distance_matrix)."""
+        return [[self.dist[s][t] for t in self.vertices] for s in self.vertices]
+
+    # -------------------- внутрішня робота ---------------------
+
+    def _arcs(self, u, v):
+        return ((u, v),) if self.directed or u == v else ((u, v), (v, u))
+
+    @staticmethod
+    def _check_weight(w):
+        if w < 0:
+            raise ValueError("Ваги ребер мають бути невід'ємні.")
+
+    def _require_edge(self, u, v):
+        if v not in self.out.get(u, {}):
+            raise ValueError(f"Ребра ({u!r}, {v!r}) немає в графі.")
+
+    def _propagate(self, dist, pred, heap, allowed=None):
+        """Дейкстра від вершин у купі; allowed обмежує, кого можна оновлювати."""
+        heapq.heapify(heap)
+        out = self.out
+        touched = 0
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d > dist[x]:
+                continue
+            touched += 1
+            for y, w in out[x].items():
+                nd = d + w
+                if nd < dist[y] and (allowed is None or y in allowed):
+                    dist[y] = nd
+                    pred[y] = x
+                    heapq.heappush(heap, (nd, y))
+        return touched
+
+    def _on_decrease(self, u, v, w):
+        changed = 0
+        for s, dist in self.dist.items():
+            nd = dist[u] + w
+            if nd < dist[v]:
+                pred = self.pred[s]
+                dist[v] = nd
+                pred[v] = u
+                changed += self._propagate(dist, pred, [(nd, v)])
+        return changed
+
+    def _on_increase(self, u, v):
+        changed = 0
+        for s, dist in self.dist.items():
+            pred = self.pred[s]
+            if pred[v] != u:
+                continue
+
+            # уражені — піддерево v у дереві найкоротших шляхів
+            affected = {v}
+            stack = [v]
+            while stack:
+                x = stack.pop()
+                for y in self.out[x]:
+                    if pred[y] == x and y not in affected:
+                        affected.add(y)
+                        stack.append(y)
+
+            old = {x: dist[x] for x in affected}
+            heap = []
+            for x in affected:
+                best, best_p = math.inf, None
+                for p, w in self.inn[x].items():
+                    if p not in affected and dist[p] + w < best:
+                        best, best_p = dist[p] + w, p
+                dist[x] = best
+                pred[x] = best_p
+                if best < math.inf:
+                    heap.append((best, x))
+            self._propagate(dist, pred, heap, affected)
+            # уражена вершина могла отримати ту саму відстань через іншого попередника
+            changed += sum(1 for x in affected if dist[x] != old[x])
+        return changed
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return (f"DynamicShortestPaths(n={len(self.vertices)}, sources={len(self.dist)}, "
+                f"{kind})")
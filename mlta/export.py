@@ -0,0 +1,165 @@
+import gzip
+from typing import Iterable, Optional
+
+from mlta.representations import (
+    edges_to_adjacency_matrix,
+    edges_to_incidence_matrix,
+    iter_adj_list_lines,
+)
+from mlta.sparse import COOIncidence, CSRAdjacency, HAS_NP
+
+# -----------------------------------------------------------
+#          ШВИДКИЙ ЕКСПОРТ У ТЕКСТОВІ ФАЙЛИ (БЕЗ GUI)
+# -----------------------------------------------------------
+#
+# Формат файлів той самий, що й у save_* з ЛР №1: рядок матриці —
+# числа через пробіл; список ребер — "i: (u, v)"; список суміжності —
+# "v: [...]". Шлях із суфіксом .gz (або compress=True) пишеться через gzip.
+
+WRITE_BUFFER = 1 << 22      # розмір буфера запису, байтів
+BLOCK_CELLS = 1 << 22       # скільки клітинок матриці форматувати за раз
+SPACE, NEWLINE = ord(" "), ord("\n")
+
+
+def open_output(path: str, compress: Optional[bool] = None, level: int = 6):
+    """Бінарний файл для запису з великим буфером (або gzip-потік)."""
+    if compress is None:
+        compress = path.lower().endswith(".gz")
+    if compress:
+        return gzip.open(path, "wb", compresslevel=level)
+    return open(path, "wb", buffering=WRITE_BUFFER)
+
+
+def format_int_block(block) -> bytes:
+    """
+    Форматує двовимірний цілочисельний NumPy-масив як рядки чисел через
+    пробіл. Уся робота векторна: для кожного різного значення його
+    текст один раз розкладається в буфер за обчисленими зміщеннями.
+    Для блоку з великим розкидом значень — звичайний запасний шлях.
+    """
+    import numpy as np
+
+    rows, cols = block.shape
+    if rows == 0:
+        return b""
+    if cols == 0:
+        return b"\n" * rows
+
+    lo, hi = int(block.min()), int(block.max())
+    if hi - lo > 255:
+        return "".join(" ".join(map(str, row)) + "\n" for row in block.tolist()).encode()
+
+    code = (block.astype(np.int64) - lo).astype(np.uint8).ravel()
+    present = np.flatnonzero(np.bincount(code, minlength=hi - lo + 1))
+    tokens = {int(c): str(lo + int(c)).encode() for c in present}
+    widths = {len(tok) for tok in tokens.values()}
+
+    if len(widths) == 1:
+        # усі числа однакової ширини — кожна клітинка займає width + 1 байт
+        width = widths.pop()
+        table = np.zeros((hi - lo + 1, width), dtype=np.uint8)
+        for c, tok in tokens.items():
+            table[c] = np.frombuffer(tok, dtype=np.uint8)
+        buf = np.empty((rows, cols, width + 1), dtype=np.uint8)
+        buf[:, :, :width] = table[code].reshape(rows, cols, width)
+        buf[:, :, width] = SPACE
+        buf[:, -1, width] = NEWLINE
+        return buf.tobytes()
+
+    token_len = np.zeros(hi - lo + 1, dtype=np.int64)
+    for c, tok in tokens.items():
+        token_len[c] = len(tok) + 1  # + роздільник
+    cell_len = token_len[code]
+    ends = np.cumsum(cell_len)
+    starts = ends - cell_len
+
+    buf = np.full(int(ends[-1]), SPACE, dtype=np.uint8)
+    buf[ends[cols - 1::cols] - 1] = NEWLINE
+    for c, tok in tokens.items():
+        pos = starts[code == c]
+        for k, ch in enumerate(tok):
+            buf[pos + k] = ch
+    return buf.tobytes()
+
+
+def _iter_row_blocks(matrix, block_cells: int):
+    """Щільні NumPy-блоки рядків для list-of-lists, ndarray, CSR або COO."""
+    import numpy as np
+
+    if isinstance(matrix, CSRAdjacency):
+        n = matrix.n
+        step = max(1, block_cells // max(n, 1))
+        offsets = np.asarray(matrix.offsets, dtype=np.int64)
+        targets = np.asarray(matrix.targets, dtype=np.int64)
+        counts = np.asarray(matrix.counts, dtype=np.int64)
+        for r0 in range(0, n, step):
+            r1 = min(n, r0 + step)
+            lo, hi = offsets[r0], offsets[r1]
+            block = np.zeros((r1 - r0, n), dtype=np.int64)
+            row_ids = np.repeat(np.arange(r1 - r0), np.diff(offsets[r0:r1 + 1]))
+            block[row_ids, targets[lo:hi]] = counts[lo:hi]
+            yield block
+    elif isinstance(matrix, COOIncidence):
+        step = max(1, block_cells // max(matrix.m, 1))
+        for r0 in range(0, matrix.n, step):
+            yield matrix.row_block(slice(r0, min(matrix.n, r0 + step)))
+    else:
+        arr = matrix if isinstance(matrix, np.ndarray) else None
+        if arr is None:
+            rows = list(matrix)
+            cols = len(rows[0]) if rows else 0
+            step = max(1, block_cells // max(cols, 1))
+            for r0 in range(0, len(rows), step):
+                chunk = rows[r0:r0 + step]
+                yield np.array(chunk, dtype=np.int64).reshape(len(chunk), cols)
+        else:
+            step = max(1, block_cells // max(arr.shape[1], 1))
+            for r0 in range(0, arr.shape[0], step):
+                yield arr[r0:r0 + step]
+
+
+def _iter_py_rows(matrix) -> Iterable[bytes]:
+    """Запасний шлях без NumPy: рядок за рядком."""
+    rows = matrix.iter_dense_rows() if isinstance(matrix, CSRAdjacency) else matrix
+    for row in rows:
+        yield (" ".join(map(str, row)) + "\n").encode()
+
+
+def write_matrix(path: str, matrix, compress: Optional[bool] = None,
+                 block_cells: int = BLOCK_CELLS) -> None:
+    """
+    Записує матрицю (list-of-lists, ndarray, CSRAdjacency або COOIncidence)
+    у текстовому форматі ЛР №1. З NumPy рядки форматуються блоками по
+    block_cells клітинок, і кожен блок пишеться одним викликом write.
+    """
+    with open_output(path, compress) as f:
+        if HAS_NP:
+            for block in _iter_row_blocks(matrix, block_cells):
+                f.write(format_int_block(block))
+        else:
+            f.writelines(_iter_py_rows(matrix))
+
+
+def write_adjacency(path: str, vertices, edges, directed: bool = False,
+                    compress: Optional[bool] = None) -> None:
+    """Матриця суміжності через CSR: пам'ять O(m + розмір блоку)."""
+    A = edges_to_adjacency_matrix(vertices, edges, directed, sparse=True)
+    write_matrix(path, A, compress)
+
+
+def write_incidence(path: str, vertices, edges, directed: bool = False,
+                    compress: Optional[bool] = None) -> None:
+    Inc = edges_to_incidence_matrix(vertices, edges, directed, sparse=HAS_NP)
+    write_matrix(path, Inc, compress)
+
+
+def write_edge_list(path: str, edges, compress: Optional[bool] = None) -> None:
+    with open_output(path, compress) as f:
+        f.writelines(f"{i+1}: {e}\n".encode("utf-8") for i, e in enumerate(edges))
+
+
+def write_adj_list(path: str, vertices, edges, directed: bool = False,
+                   compress: Optional[bool] = None) -> None:
+    with open_output(path, compress) as f:
+        f.writelines(line.encode("utf-8")
+                     for line in iter_adj_list_lines(vertices, edges, directed))
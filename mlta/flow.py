@@ -0,0 +1,234 @@
+from collections import deque, defaultdict
+import math
+
+
+# ============================================================
+#                 ЗАВДАННЯ 1 — MAX FLOW (Edmonds–Karp)
+# ============================================================
+
+def build_logistics_edges(include_variant_edge: bool):
+    """
+    Повертає список ребер (u, v, capacity).
+    include_variant_edge=True додає ребро: Склад 3 -> Термінал 2 (10)
+    """
+    edges = [
+        ("Термінал 1", "Склад 1", 25),
+        ("Термінал 1", "Склад 2", 20),
+        ("Термінал 1", "Склад 3", 15),
+
+        ("Термінал 2", "Склад 3", 15),
+        ("Термінал 2", "Склад 4", 30),
+        ("Термінал 2", "Склад 2", 10),
+
+        ("Склад 1", "Магазин 1", 15),
+        ("Склад 1", "Магазин 2", 10),
+        ("Склад 1", "Магазин 3", 20),
+
+        ("Склад 2", "Магазин 4", 15),
+        ("Склад 2", "Магазин 5", 10),
+        ("Склад 2", "Магазин 6", 25),
+
+        ("Склад 3", "Магазин 7", 20),
+        ("Склад 3", "Магазин 8", 15),
+        ("Склад 3", "Магазин 9", 10),
+
+        ("Склад 4", "Магазин 10", 20),
+        ("Склад 4", "Магазин 11", 10),
+        ("Склад 4", "Магазин 12", 15),
+        ("Склад 4", "Магазин 13", 5),
+        ("Склад 4", "Магазин 14", 10),
+    ]
+
+    if include_variant_edge:
+        edges.append(("Склад 3", "Термінал 2", 10))  # варіант
+
+    return edges
+
+
+def nodes_logistics():
+    terminals = ["Термінал 1", "Термінал 2"]
+    warehouses = ["Склад 1", "Склад 2", "Склад 3", "Склад 4"]
+    shops = [f"Магазин {i}" for i in range(1, 15)]
+    return terminals, warehouses, shops
+
+
+def build_capacity_graph(edges, source, sink):
+    """
+    Будує capacity[u][v] (dict-of-dict), додає нульові зворотні ребра.
+    """
+    capacity = defaultdict(lambda: defaultdict(int))
+    adj = defaultdict(list)
+
+    def add_edge(u, v, c):
+        if v not in adj[u]:
+            adj[u].append(v)
+        if u not in adj[v]:
+            adj[v].append(u)  # для залишкової мережі
+        capacity[u][v] += c  # якщо дубль — сумуємо
+
+    for u, v, c in edges:
+        add_edge(u, v, c)
+
+    # переконаємось, що source/sink є в графі
+    adj[source] = adj[source]
+    adj[sink] = adj[sink]
+    return capacity, adj
+
+
+def edmonds_karp(capacity, adj, source, sink):
+    """
+    Edmonds–Karp: повертає (max_flow, flow, протокол_кроків)
+    flow[u][v] — фактичний потік (зворотний зберігаємо як -flow[v][u]).
+    """
+    flow = defaultdict(lambda: defaultdict(int))
+    steps = []
+    max_flow = 0
+    iteration = 0
+
+    while True:
+        iteration += 1
+        parent = {source: None}
+        q = deque([source])
+
+        # BFS у залишковій мережі
+        while q and sink not in parent:
+            u = q.popleft()
+            for v in adj[u]:
+                residual = capacity[u][v] - flow[u][v]
+                if residual > 0 and v not in parent:
+                    parent[v] = u
+                    q.append(v)
+
+        if sink not in parent:
+            steps.append(f"Зупинка: шляхів збільшення більше немає (ітерація {iteration}).")
+            break
+
+        # відновити шлях і знайти bottleneck
+        path_nodes = []
+        v = sink
+        bottleneck = math.inf
+        while v != source:
+            u = parent[v]
+            path_nodes.append(v)
+            bottleneck = min(bottleneck, capacity[u][v] - flow[u][v])
+            v = u
+        path_nodes.append(source)
+        path_nodes.reverse()
+
+        # застосувати збільшення потоку
+        v = sink
+        while v != source:
+            u = parent[v]
+            flow[u][v] += bottleneck
+            flow[v][u] -= bottleneck
+            v = u
+
+        max_flow += bottleneck
+        steps.append(
+            f"Крок {iteration}: шлях = {' → '.join(path_nodes)}, "
+            f"Δ (bottleneck) = {bottleneck}, max_flow = {max_flow}"
+        )
+
+    return max_flow, flow, steps
+
+
+def flow_decomposition_to_terminal_shop(flow, terminals, shops, super_source="SOURCE", super_sink="SINK"):
+    """
+    Розкладає потік на s-t шляхи (по позитивних flow[u][v] > 0) і агрегує:
+      terminal -> shop -> amount
+    Працює на графі з super_source, super_sink.
+    """
+    pos_flow = defaultdict(lambda: defaultdict(int))
+    for u in flow:
+        for v in flow[u]:
+            if flow[u][v] > 0:
+                pos_flow[u][v] = flow[u][v]
+
+    table = {t: {s: 0 for s in shops} for t in terminals}
+
+    def find_path():
+        # DFS шлях SOURCE -> SINK по pos_flow
+        stack = [(super_source, [super_source], {super_source})]
+        while stack:
+            u, path, seen = stack.pop()
+            if u == super_sink:
+                return path
+            for v, fval in pos_flow[u].items():
+                if fval > 0 and v not in seen:
+                    stack.append((v, path + [v], seen | {v}))
+        return None
+
+    while True:
+        path = find_path()
+        if not path:
+            break
+
+        b = math.inf
+        for i in range(len(path) - 1):
+            u, v = path[i], path[i + 1]
+            b = min(b, pos_flow[u][v])
+
+        for i in range(len(path) - 1):
+            u, v = path[i], path[i + 1]
+            pos_flow[u][v] -= b
+
+        terminal = path[1] if len(path) >= 3 and path[1] in terminals else None
+        shop = path[-2] if len(path) >= 3 and path[-2] in shops else None
+
+        if terminal and shop:
+            table[terminal][shop] += b
+
+    return table
+
+
+def solve_logistics(include_variant_edge: bool):
+    terminals, warehouses, shops = nodes_logistics()
+
+    SOURCE = "SOURCE"
+    SINK = "SINK"
+
+    edges = build_logistics_edges(include_variant_edge)
+
+    # SOURCE -> terminals (дуже великі)
+    for t in terminals:
+        edges.append((SOURCE, t, 10**9))
+
+    # shops -> SINK (дуже великі)
+    for s in shops:
+        edges.append((s, SINK, 10**9))
+
+    capacity, adj = build_capacity_graph(edges, SOURCE, SINK)
+    max_flow, flow, steps = edmonds_karp(capacity, adj, SOURCE, SINK)
+
+    table = flow_decomposition_to_terminal_shop(flow, terminals, shops, super_source=SOURCE, super_sink=SINK)
+
+    terminal_totals = {t: max(0, flow[SOURCE][t]) for t in terminals}
+    shop_totals = {s: max(0, flow[s][SINK]) for s in shops}
+
+    return {
+        "max_flow": max_flow,
+        "steps": steps,
+        "table": table,
+        "terminal_totals": terminal_totals,
+        "shop_totals": shop_totals,
+        "edges_base": build_logistics_edges(include_variant_edge),
+    }
+
+
+def logistics_positions():
+    pos = {}
+    pos["Термінал 1"] = (-2.0, -1.0)
+    pos["Термінал 2"] = (2.0, -1.0)
+
+    pos["Склад 1"] = (-1.0, 0.0)
+    pos["Склад 2"] = (1.0, 0.0)
+    pos["Склад 3"] = (-1.5, -2.0)
+    pos["Склад 4"] = (1.5, -2.0)
+
+    for i in range(1, 7):
+        pos[f"Магазин {i}"] = (-3.0 + (i - 1) * 1.2, 1.5)
+
+    for i in range(7, 15):
+        pos[f"Магазин {i}"] = (-3.3 + (i - 7) * 0.95, -3.5)
+
+    return pos
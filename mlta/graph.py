@@ -0,0 +1,152 @@
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from mlta.traversal import (
+    DFS_PUSH,
+    BFS_ENQUEUE,
+    bfs_direction_optimizing,
+    bfs_protocol,
+    build_adj_list,
+    build_bfs_index,
+    connected_components,
+    dfs_protocol,
+    iter_bfs_events,
+    iter_dfs_events,
+    strongly_connected_components,
+    traversal_forest,
+)
+
+# -----------------------------------------------------------
+#        ГРАФ З КЕШОВАНИМИ ІНДЕКСАМИ (ВЕРСІЯ + ІНВАЛІДАЦІЯ)
+# -----------------------------------------------------------
+#
+# Похідні структури (відсортований список суміжності, масиви для BFS
+# тощо) будуються при першому зверненні й запам'ятовуються разом із
+# версією графа. Кожна зміна ребер збільшує version, і застарілі
+# структури перебудовуються ліниво при наступному зверненні. Тож серія
+# обходів з тисяч стартових вершин платить за побудову лише один раз.
+
+
+class Graph:
+    """
+    Граф ЛР №2/№3: вершини та ребра (u, v) або (u, v, w).
+    Ребра додаються через add_edge / add_edges; читати edges напряму можна,
+    змінювати — ні (інакше кеш не дізнається про зміну).
+    """
+
+    def __init__(self, vertices: Iterable[Hashable] = (), edges: Iterable[Tuple] = (),
+                 directed: bool = False):
+        self.directed = directed
+        self.vertices: List[Hashable] = []
+        self._vertex_set = set()
+        self.edges: List[Tuple] = []
+        self.version = 0
+        self._cache: Dict[str, Tuple[int, object]] = {}
+        for v in vertices:
+            self.add_vertex(v)
+        self.add_edges(edges)
+
+    # ---------------------- зміни графа ----------------------
+
+    def add_vertex(self, v: Hashable) -> None:
+        if v not in self._vertex_set:
+            self._vertex_set.add(v)
+            self.vertices.append(v)
+            self.version += 1
+
+    def add_edge(self, u: Hashable, v: Hashable, w=None) -> None:
+        """Додає ребро (невідомі вершини додаються автоматично)."""
+        self.add_vertex(u)
+        self.add_vertex(v)
+        self.edges.append((u, v) if w is None else (u, v, w))
+        self.version += 1
+
+    def add_edges(self, edges: Iterable[Tuple]) -> None:
+        for e in edges:
+            self.add_edge(*e)
+
+    # ------------------------- кеш ---------------------------
+
+    def cached(self, name: str, build: Callable[[], object]):
+        """
+        Значення build(), обчислене для поточної версії графа. Інші модулі
+        можуть складати тут свої індекси під власними іменами.
+        """
+        entry = self._cache.get(name)
+        if entry is not None and entry[0] == self.version:
+            return entry[1]
+        value = build()
+        self._cache[name] = (self.version, value)
+        return value
+
+    def pairs(self) -> List[Tuple[Hashable, Hashable]]:
+        """Ребра без ваг — у форматі алгоритмів ЛР №2."""
+        return self.cached("pairs", lambda: [(e[0], e[1]) for e in self.edges])
+
+    def adj(self) -> Dict[Hashable, List[Hashable]]:
+        """Відсортований список суміжності (будується раз на версію)."""
+        return self.cached(
+            "adj", lambda: build_adj_list(self.vertices, self.pairs(), self.directed))
+
+    def bfs_index(self) -> dict:
+        return self.cached("bfs_index", lambda: build_bfs_index(self.adj(), self.directed))
+
+    # ------------------------- обходи ------------------------
+
+    def iter_dfs_events(self, start, visited=None):
+        return iter_dfs_events(self.vertices, self.edges, start, self.directed,
+                               self.adj(), visited)
+
+    def iter_bfs_events(self, start, visited=None):
+        return iter_bfs_events(self.vertices, self.edges, start, self.directed,
+                               self.adj(), visited)
+
+    def dfs_protocol(self, start):
+        return dfs_protocol(self.vertices, self.edges, start, self.directed, self.adj())
+
+    def bfs_protocol(self, start):
+        return bfs_protocol(self.vertices, self.edges, start, self.directed, self.adj())
+
+    def bfs_direction_optimizing(self, start, **kwargs):
+        return bfs_direction_optimizing(self.vertices, self.edges, start, self.directed,
+                                        index=self.bfs_index(), **kwargs)
+
+    def numbering_from(self, roots: Optional[Iterable[Hashable]] = None,
+                       method: str = "dfs") -> Dict[Hashable, Dict[Hashable, int]]:
+        """
+        {корінь: {v: номер обходу}} для кожного кореня (типово — з усіх
+        вершин). Список суміжності спільний для всіх обходів.
+        """
+        if method not in ("dfs", "bfs"):
+            raise ValueError("method має бути 'dfs' або 'bfs'.")
+        events = self.iter_dfs_events if method == "dfs" else self.iter_bfs_events
+        push = DFS_PUSH if method == "dfs" else BFS_ENQUEUE
+        if roots is None:
+            roots = self.vertices
+        return {r: {v: k for kind, v, k in events(r) if kind == push} for r in roots}
+
+    def traversal_forest(self, roots=None, method="dfs", sweep=True):
+        return traversal_forest(self.vertices, self.edges, roots, self.directed,
+                                method, sweep, self.adj())
+
+    def connected_components(self):
+        if self.directed:
+            # слабка зв'язність: орієнтований self.adj() тут не підходить,
+            # тож неорієнтований список будується раз на версію графа
+            return self.cached(
+                "weak_components",
+                lambda: connected_components(self.vertices, self.pairs(), directed=True))
+        return self.cached(
+            "components",
+            lambda: connected_components(self.vertices, self.pairs(), adj=self.adj()))
+
+    def strongly_connected_components(self):
+        if not self.directed:
+            raise ValueError("Компоненти сильної зв'язності — лише для орієнтованого графа.")
+        return self.cached(
+            "scc", lambda: strongly_connected_components(self.vertices, self.pairs(),
+                                                         self.adj()))
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        return (f"Graph(n={len(self.vertices)}, m={len(self.edges)}, {kind}, "
+                f"version={self.version})")
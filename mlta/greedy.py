@@ -0,0 +1,50 @@
+# -------------------------------------------------------------
+#       1. МІНІМАЛЬНА КІЛЬКІСТЬ МОНЕТ (жадібний алгоритм)
+# -------------------------------------------------------------
+
+COINS = [50, 25, 10, 5]
+
+
+def minimal_coins(n):
+    if n < 0 or n > 1000:
+        return "n має бути в межах 0 ≤ n ≤ 1000"
+
+    result = []
+    original_n = n
+
+    for coin in COINS:
+        count = n // coin
+        if count > 0:
+            result.append(f"{coin} коп — {count} шт.")
+        n %= coin
+
+    if n != 0:
+        result.append(f"Неможливо видати {original_n} коп.")
+
+    return "\n".join(result)
+
+
+# -------------------------------------------------------------
+#       2. РОЗКЛАДАННЯ n У СУМУ ПАРНИХ СТУПЕНІВ ДВІЙКИ
+# -------------------------------------------------------------
+
+def decompose_even_powers(n):
+    if n < 1 or n > 1000:
+        return "n має бути в межах 1 ≤ n ≤ 1000"
+
+    result = []
+    remaining = n
+
+    powers = []
+    p = 1
+    while p <= n:
+        powers.append(p)
+        p *= 4
+    powers.reverse()
+
+    for p in powers:
+        while remaining >= p:
+            result.append(str(p))
+            remaining -= p
+
+    return "+".join(result)
@@ -0,0 +1,256 @@
+import csv
+import gzip
+from array import array
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+from mlta.representations import edges_to_adj_list
+from mlta.sparse import CSRAdjacency
+
+# -----------------------------------------------------------
+#          ПОТОКОВЕ ЗАВАНТАЖЕННЯ СПИСКУ РЕБЕР З ФАЙЛУ
+# -----------------------------------------------------------
+#
+# Підтримувані формати (по одному ребру на рядок):
+#   u v            — текст, розділювач — пробіли/табуляції;
+#   u v w          — те саме з вагою (ціле або дійсне число);
+#   u,v[,w]        — CSV (файли *.csv або delimiter=",");
+# будь-який із них може бути стиснутий gzip (*.gz або за сигнатурою).
+# Рядки, що починаються з "#" або "%", та порожні рядки пропускаються.
+
+CHUNK_BYTES = 1 << 20  # приблизний розмір порції тексту, що читається за раз
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class VertexInterner:
+    """Відображення назв вершин у цілі номери 0..n-1 (у порядку появи)."""
+
+    __slots__ = ("ids", "names")
+
+    def __init__(self, names=()):
+        self.ids: Dict[Hashable, int] = {}
+        self.names: List[Hashable] = []
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: Hashable) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            i = len(self.names)
+            self.ids[name] = i
+            self.names.append(name)
+        return i
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def open_text(path: str, encoding: str = "utf-8"):
+    """Відкриває текстовий або gzip-файл (визначається за сигнатурою)."""
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    if magic == GZIP_MAGIC:
+        return gzip.open(path, "rt", encoding=encoding, newline="")
+    return open(path, "r", encoding=encoding, newline="")
+
+
+def _is_csv(path: str) -> bool:
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return name.endswith(".csv")
+
+
+def _parse_weight(token: str):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _row_chunks(f, delimiter: Optional[str], chunk_bytes: int, first_line: int):
+    """
+    Порції рядків даних — списки пар (номер рядка у файлі, поля).
+    Текст читається блоками readlines(chunk_bytes). CSV розбирає один
+    csv.reader на весь файл, тож запис у лапках, що займає кілька
+    фізичних рядків, не розрізається між порціями; його номер —
+    line_num читача (останній рядок запису).
+    """
+    if delimiter is None:
+        lineno = first_line
+        while True:
+            lines = f.readlines(chunk_bytes)
+            if not lines:
+                return
+            yield [(lineno + k, line.split()) for k, line in enumerate(lines)]
+            lineno += len(lines)
+
+    reader = csv.reader(f, delimiter=delimiter)
+    shift = first_line - 1
+    chunk = []
+    size = 0
+    for row in reader:
+        row = [x.strip() for x in row]
+        chunk.append((reader.line_num + shift, row))
+        size += sum(map(len, row)) + len(row)
+        if size >= chunk_bytes:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def iter_edge_chunks(path: str, weighted: Optional[bool] = None,
+                     delimiter: Optional[str] = None, header: bool = False,
+                     interner: Optional[VertexInterner] = None,
+                     chunk_bytes: int = CHUNK_BYTES,
+                     ) -> Iterator[Tuple[array, array, Optional[array]]]:
+    """
+    Читає файл порціями приблизно по chunk_bytes байтів тексту і для кожної
+    порції повертає (src, dst, weights) — масиви номерів вершин та ваг
+    (weights = None для незважених графів). Назви вершин інтернуються в
+    interner, тож увесь текст файлу ніколи не тримається в пам'яті.
+
+    weighted=None — визначити за першим рядком даних (3+ стовпці → вагами).
+    delimiter=None — "," для *.csv, інакше будь-які пробільні символи.
+    Помилки формату (ValueError) містять номер рядка у файлі.
+    """
+    if interner is None:
+        interner = VertexInterner()
+    if delimiter is None and _is_csv(path):
+        delimiter = ","
+    intern = interner.intern
+    sep = " " if delimiter is None else delimiter
+
+    with open_text(path) as f:
+        if header:
+            f.readline()
+
+        for rows in _row_chunks(f, delimiter, chunk_bytes, 2 if header else 1):
+            src = array("i")
+            dst = array("i")
+            weights = None
+
+            for lineno, row in rows:
+                if not row or not row[0] or row[0][0] in "#%":
+                    continue
+                if len(row) < 2:
+                    raise ValueError(f"Рядок {lineno} ('{sep.join(row)}') має містити "
+                                     "щонайменше дві вершини.")
+
+                if weighted is None:
+                    weighted = len(row) >= 3
+                if weighted:
+                    if len(row) < 3:
+                        raise ValueError(f"Рядок {lineno} ('{sep.join(row)}') не містить ваги.")
+                    try:
+                        w = _parse_weight(row[2])
+                    except ValueError:
+                        raise ValueError(f"Рядок {lineno}: вага '{row[2]}' не є числом.") from None
+                    if weights is None:
+                        weights = array("q")
+                    if isinstance(w, float) and weights.typecode == "q":
+                        weights = array("d", weights)
+                    weights.append(w)
+
+                src.append(intern(row[0]))
+                dst.append(intern(row[1]))
+
+            if src:
+                yield src, dst, weights
+
+
+# -----------------------------------------------------------
+#                 ЗАВАНТАЖЕНИЙ ГРАФ (МАСИВИ РЕБЕР)
+# -----------------------------------------------------------
+
+
+class EdgeListGraph:
+    """
+    Граф як три масиви однакової довжини: src, dst (номери вершин, int32)
+    та weights (int64 або float64; None для незважених). Назви вершин —
+    у vertices[i]. Ітератори нижче віддають ребра у форматах, які
+    приймають алгоритми лабораторних робіт.
+    """
+
+    def __init__(self, vertices: List[Hashable], src: array, dst: array,
+                 weights: Optional[array] = None, directed: bool = False):
+        self.vertices = vertices
+        self.src = src
+        self.dst = dst
+        self.weights = weights
+        self.directed = directed
+
+    @property
+    def n(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def m(self) -> int:
+        return len(self.src)
+
+    @property
+    def weighted(self) -> bool:
+        return self.weights is not None
+
+    def ids(self) -> range:
+        """Вершини як номери 0..n-1 (для роботи без назв)."""
+        return range(self.n)
+
+    def iter_edges(self, named: bool = True) -> Iterator[Tuple]:
+        """Пари (u, v) — для ЛР №1 і ЛР №2."""
+        if not named:
+            return zip(self.src, self.dst)
+        V = self.vertices
+        return ((V[i], V[j]) for i, j in zip(self.src, self.dst))
+
+    def iter_weighted_edges(self, named: bool = True) -> Iterator[Tuple]:
+        """Трійки (u, v, w) — для ЛР №3 (ваги) і ЛР №6 (пропускні здатності)."""
+        if self.weights is None:
+            raise ValueError("Граф не має ваг.")
+        if not named:
+            return zip(self.src, self.dst, self.weights)
+        V = self.vertices
+        return ((V[i], V[j], w) for i, j, w in zip(self.src, self.dst, self.weights))
+
+    def to_csr(self, named: bool = True) -> CSRAdjacency:
+        vertices = self.vertices if named else self.ids()
+        return CSRAdjacency.from_edges(vertices, self.iter_edges(named), self.directed)
+
+    def to_adj_list(self, named: bool = True) -> Dict[Hashable, List[Hashable]]:
+        vertices = self.vertices if named else self.ids()
+        return edges_to_adj_list(vertices, self.iter_edges(named), self.directed)
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        w = ", weighted" if self.weighted else ""
+        return f"EdgeListGraph(n={self.n}, m={self.m}, {kind}{w})"
+
+
+def load_edge_list(path: str, directed: bool = False,
+                   weighted: Optional[bool] = None,
+                   delimiter: Optional[str] = None, header: bool = False,
+                   vertices=(), chunk_bytes: int = CHUNK_BYTES) -> EdgeListGraph:
+    """
+    Завантажує список ребер у EdgeListGraph. Пам'ять — O(n + m) для масивів
+    і словника назв, незалежно від розміру тексту. vertices — необов'язковий
+    початковий перелік вершин (зберігає їх порядок та ізольовані вершини).
+    """
+    interner = VertexInterner(vertices)
+    src = array("i")
+    dst = array("i")
+    weights = None
+
+    for s, d, w in iter_edge_chunks(path, weighted, delimiter, header,
+                                    interner, chunk_bytes):
+        src.extend(s)
+        dst.extend(d)
+        if w is not None:
+            if weights is None:
+                weights = array(w.typecode)
+            elif weights.typecode != w.typecode:
+                weights = array("d", weights)
+                w = array("d", w)
+            weights.extend(w)
+
+    return EdgeListGraph(interner.names, src, dst, weights, directed)
@@ -0,0 +1,137 @@
+from array import array
+from multiprocessing import Pool, shared_memory
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from mlta.traversal import build_adj_list, build_bfs_index
+
+# -----------------------------------------------------------
+#   ПАРАЛЕЛЬНІ ОБХОДИ З БАГАТЬОХ КОРЕНІВ (SHARED MEMORY + POOL)
+# -----------------------------------------------------------
+#
+# Відсортований список суміжності перекладається у CSR-масиви int32
+# (offsets, targets — вихідна частина build_bfs_index) і кладеться в
+# multiprocessing.shared_memory. Кожен процес пулу один раз
+# підключається до цих блоків в ініціалізаторі, тож граф не пікується
+# для кожного завдання — завдання містить лише номери коренів.
+# Результат для кореня — array('i') довжини n: numbers[i] — номер
+# обходу вершини vertices[i] (0 — недосяжна).
+# Нумерація збігається з dfs_protocol / bfs_protocol.
+
+ROOTS_PER_TASK = 16
+
+_shared = {}  # стан процесу-працівника: блоки пам'яті та представлення над ними
+
+
+def _dfs_numbers(offsets, targets, n, root):
+    numbers = array("i", bytes(4 * n))
+    pos = array("i", offsets[:n])
+    counter = 1
+    numbers[root] = counter
+    stack = [root]
+    while stack:
+        x = stack[-1]
+        p = pos[x]
+        end = offsets[x + 1]
+        while p < end and numbers[targets[p]]:
+            p += 1
+        if p < end:
+            y = targets[p]
+            pos[x] = p + 1
+            counter += 1
+            numbers[y] = counter
+            stack.append(y)
+        else:
+            pos[x] = p
+            stack.pop()
+    return numbers
+
+
+def _bfs_numbers(offsets, targets, n, root):
+    numbers = array("i", bytes(4 * n))
+    counter = 1
+    numbers[root] = counter
+    queue = [root]
+    head = 0
+    while head < len(queue):
+        x = queue[head]
+        head += 1
+        for p in range(offsets[x], offsets[x + 1]):
+            y = targets[p]
+            if not numbers[y]:
+                counter += 1
+                numbers[y] = counter
+                queue.append(y)
+    return numbers
+
+
+_KERNELS = {"dfs": _dfs_numbers, "bfs": _bfs_numbers}
+
+
+def _attach(off_name, tgt_name, n, nnz, method):
+    off_shm = shared_memory.SharedMemory(name=off_name)
+    tgt_shm = shared_memory.SharedMemory(name=tgt_name)
+    _shared.update(
+        blocks=(off_shm, tgt_shm),
+        offsets=off_shm.buf[:4 * (n + 1)].cast("i"),
+        targets=tgt_shm.buf[:4 * nnz].cast("i"),
+        n=n,
+        kernel=_KERNELS[method],
+    )
+
+
+def _run_roots(roots):
+    kernel = _shared["kernel"]
+    offsets, targets, n = _shared["offsets"], _shared["targets"], _shared["n"]
+    return [(r, kernel(offsets, targets, n, r).tobytes()) for r in roots]
+
+
+def _to_shared(arr: array) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(arr) * arr.itemsize))
+    shm.buf[:len(arr) * arr.itemsize] = arr.tobytes()
+    return shm
+
+
+def parallel_numbering(vertices, edges, roots: Optional[Iterable[Hashable]] = None,
+                       directed: bool = False, method: str = "dfs",
+                       processes: Optional[int] = None, adj=None,
+                       roots_per_task: int = ROOTS_PER_TASK) -> Dict[Hashable, array]:
+    """
+    Номери DFS/BFS з кожного кореня roots (типово — з усіх вершин).
+    Повертає {корінь: array('i')}, індекс масиву — позиція вершини у
+    vertices. processes=1 рахує в поточному процесі без пулу.
+    """
+    if method not in _KERNELS:
+        raise ValueError("method має бути 'dfs' або 'bfs'.")
+    if adj is None:
+        adj = build_adj_list(vertices, edges, directed)
+    vertices = list(vertices)
+    if list(adj) != vertices:
+        adj = {v: adj[v] for v in vertices}
+    # лише вихідні ребра: вхідні (directed=True) тут не потрібні
+    index = build_bfs_index(adj)
+    offsets, targets, idx = index["offsets"], index["targets"], index["idx"]
+    n = len(vertices)
+    root_ids: List[int] = [idx[r] for r in (vertices if roots is None else roots)]
+
+    if processes == 1 or len(root_ids) <= 1:
+        kernel = _KERNELS[method]
+        return {vertices[r]: kernel(offsets, targets, n, r) for r in root_ids}
+
+    tasks = [root_ids[i:i + roots_per_task] for i in range(0, len(root_ids), roots_per_task)]
+    off_shm = _to_shared(offsets)
+    tgt_shm = _to_shared(targets)
+    result = {}
+    try:
+        with Pool(processes, initializer=_attach,
+                  initargs=(off_shm.name, tgt_shm.name, n, len(targets), method)) as pool:
+            for chunk in pool.imap_unordered(_run_roots, tasks):
+                for r, raw in chunk:
+                    numbers = array("i")
+                    numbers.frombytes(raw)
+                    result[vertices[r]] = numbers
+    finally:
+        for shm in (off_shm, tgt_shm):
+            shm.close()
+            shm.unlink()
+    return result
+
@@ -0,0 +1,93 @@
+# -----------------------------------------------------------
+#                ВІЗУАЛІЗАЦІЯ ГРАФІВ
+# -----------------------------------------------------------
+#
+# networkx і matplotlib імпортуються лише під час малювання, тому
+# імпорт цього модуля (і всього пакета) не тягне графічних бібліотек.
+
+from mlta.flow import build_logistics_edges, logistics_positions
+
+
+def _import_plotting():
+    try:
+        import networkx as nx
+        import matplotlib.pyplot as plt
+    except Exception as e:
+        raise ImportError(
+            "Не знайдено networkx/matplotlib.\n"
+            "Встанови: pip install networkx matplotlib"
+        ) from e
+    return nx, plt
+
+
+def draw_graph(vertices, edges, pos, directed=False, node_size=1300):
+    nx, plt = _import_plotting()
+
+    if directed:
+        G = nx.DiGraph()
+    else:
+        G = nx.MultiGraph()
+
+    G.add_nodes_from(vertices)
+    G.add_edges_from(edges)
+
+    plt.figure(figsize=(7, 7))
+    nx.draw(
+        G, pos,
+        with_labels=True,
+        node_color="lightblue" if directed else "orange",
+        node_size=node_size,
+        font_size=14,
+        arrows=directed,
+        arrowstyle='-|>' if directed else '-',
+        arrowsize=20,
+    )
+
+    plt.title("Орієнтований граф" if directed else "Неорієнтований граф")
+    plt.show()
+
+
+def draw_weighted_graph(edges, pos, title="Граф з вагами (Лабораторна №3)"):
+    nx, plt = _import_plotting()
+
+    G = nx.DiGraph()
+    for u, v, w in edges:
+        G.add_edge(u, v, weight=w)
+
+    plt.figure(figsize=(7, 7))
+    nx.draw(
+        G, pos,
+        with_labels=True,
+        node_size=1300,
+        node_color="lightblue",
+        arrows=True,
+        arrowstyle='-|>',
+        arrowsize=20,
+        font_size=14
+    )
+    labels = {(u, v): w for (u, v, w) in edges}
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=12)
+
+    plt.title(title)
+    plt.show()
+
+
+def draw_logistics_graph(include_variant_edge: bool):
+    nx, plt = _import_plotting()
+
+    edges = build_logistics_edges(include_variant_edge)
+    G = nx.DiGraph()
+    for u, v, c in edges:
+        G.add_edge(u, v, capacity=c)
+
+    pos = logistics_positions()
+    plt.figure(figsize=(12, 6))
+    nx.draw(
+        G, pos, with_labels=True, node_size=1300, node_color="lightblue",
+        arrows=True, arrowstyle='-|>', arrowsize=16, font_size=9
+    )
+    labels = {(u, v): d["capacity"] for u, v, d in G.edges(data=True)}
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=8)
+    plt.title("Логістична мережа (Max Flow) — " + ("з варіантним ребром" if include_variant_edge else "базова"))
+    plt.axis("off")
+    plt.show()
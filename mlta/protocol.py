@@ -0,0 +1,89 @@
+from collections import Counter, deque
+
+# -------------------------------------------------------------
+#           ПРИЙМАЧІ ПРОТОКОЛУ (SINKS) ДЛЯ ДЕЙКСТРИ І ФЛОЙДА
+# -------------------------------------------------------------
+#
+# Алгоритм передає приймачу сирі події-кортежі (kind, ...), а текст
+# рядків формується лише під час читання, і лише для збережених подій.
+# Варіанти:
+#   NullSink      — нічого не зберігає; алгоритми бачать enabled=False
+#                   і йдуть швидким шляхом без подій узагалі;
+#   CountingSink  — лише лічильники подій за видами;
+#   RingSink      — останні capacity подій (кільцевий буфер);
+#   ListSink      — увесь протокол (як у GUI).
+
+
+class NullSink:
+    enabled = False
+
+    def emit(self, event):
+        pass
+
+    def lines(self, formatter):
+        return []
+
+
+class CountingSink:
+    enabled = True
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def emit(self, event):
+        self.counts[event[0]] += 1
+
+    def lines(self, formatter):
+        return [f"{kind}: {n}" for kind, n in self.counts.items()]
+
+
+class RingSink:
+    enabled = True
+
+    def __init__(self, capacity=1000):
+        if capacity <= 0:
+            raise ValueError("Місткість буфера має бути додатною.")
+        self.events = deque(maxlen=capacity)
+        self.total = 0
+
+    def emit(self, event):
+        self.events.append(event)
+        self.total += 1
+
+    @property
+    def dropped(self):
+        return self.total - len(self.events)
+
+    def lines(self, formatter):
+        out = [f"... пропущено ранніх подій: {self.dropped}"] if self.dropped else []
+        out.extend(formatter(e) for e in self.events)
+        return out
+
+
+class ListSink:
+    enabled = True
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def lines(self, formatter):
+        return [formatter(e) for e in self.events]
+
+
+SINK_MODES = ("none", "counters", "ring", "full")
+
+
+def make_sink(mode="full", capacity=1000):
+    """Приймач за назвою режиму: none | counters | ring | full."""
+    if mode == "none":
+        return NullSink()
+    if mode == "counters":
+        return CountingSink()
+    if mode == "ring":
+        return RingSink(capacity)
+    if mode == "full":
+        return ListSink()
+    raise ValueError(f"Невідомий режим протоколу: {mode}")
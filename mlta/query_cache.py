@@ -0,0 +1,115 @@
+import math
+import sys
+from array import array
+from collections import OrderedDict
+
+from mlta.shortest_paths import ShortestPathEngine, dijkstra_arrays, walk_predecessors
+
+# -------------------------------------------------------------
+#      LRU-КЕШ ДЕРЕВ НАЙКОРОТШИХ ШЛЯХІВ (КЛЮЧ — ДЖЕРЕЛО + ВЕРСІЯ)
+# -------------------------------------------------------------
+#
+# Повторний запит з того самого джерела — пошук у словнику замість
+# Дейкстри. Дерево (відстані + попередники) зберігається компактно в
+# array('d') / array('i'); розмір кешу обмежено бюджетом у байтах, і
+# найдавніше використані дерева витісняються першими. Ключ містить
+# версію графа (mlta.graph.Graph.version), тож після зміни ребер старі
+# дерева ніколи не повертаються і звільняються при наступному зверненні.
+
+DEFAULT_BUDGET = 64 << 20  # 64 МіБ
+
+
+class DistanceTreeCache:
+    """
+    Кеш дерев Дейкстри над графом mlta.graph.Graph з ребрами (u, v, w).
+    Лічильники: hits, misses, evictions (витіснення через бюджет),
+    invalidated (дерева, скинуті після зміни версії графа).
+    """
+
+    def __init__(self, graph, max_bytes=DEFAULT_BUDGET):
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self._trees = OrderedDict()
+        self._version = graph.version
+        self.size_bytes = 0
+        self.hits = self.misses = self.evictions = self.invalidated = 0
+
+    def _engine(self):
+        return self.graph.cached("sp_engine", lambda: ShortestPathEngine.from_graph(self.graph))
+
+    def _drop_stale(self):
+        if self._version != self.graph.version:
+            self.invalidated += len(self._trees)
+            self._trees.clear()
+            self.size_bytes = 0
+            self._version = self.graph.version
+
+    def tree(self, source):
+        """(dist, pred) для source: array('d') і array('i') у порядку engine.vertices."""
+        self._drop_stale()
+        key = (source, self._version)
+        entry = self._trees.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._trees.move_to_end(key)
+            return entry[0], entry[1]
+
+        self.misses += 1
+        engine = self._engine()
+        engine.require_non_negative()
+        dist, pred, _ = dijkstra_arrays(engine.index, engine.vertex_id(source))
+        dist, pred = array("d", dist), array("i", pred)
+        size = sys.getsizeof(dist) + sys.getsizeof(pred)
+        if size <= self.max_bytes:
+            self._trees[key] = (dist, pred, size)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                _, (_, _, old_size) = self._trees.popitem(last=False)
+                self.size_bytes -= old_size
+                self.evictions += 1
+        return dist, pred
+
+    @staticmethod
+    def _value(d, integral):
+        if d == math.inf or not integral:
+            return d
+        return int(d)
+
+    def distance(self, source, target):
+        dist, _ = self.tree(source)
+        engine = self._engine()
+        return self._value(dist[engine.vertex_id(target)], engine.integral)
+
+    def distances(self, source):
+        dist, _ = self.tree(source)
+        engine = self._engine()
+        if not engine.integral:
+            return dict(zip(engine.vertices, dist))
+        inf = math.inf
+        return {v: (d if d == inf else int(d)) for v, d in zip(engine.vertices, dist)}
+
+    def path(self, source, target):
+        """(відстань, [source, ..., target]) або (math.inf, [])."""
+        dist, pred = self.tree(source)
+        engine = self._engine()
+        t = engine.vertex_id(target)
+        if dist[t] == math.inf:
+            return math.inf, []
+        V = engine.vertices
+        return (self._value(dist[t], engine.integral),
+                [V[i] for i in walk_predecessors(pred, t)])
+
+    def stats(self):
+        return {
+            "entries": len(self._trees),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidated": self.invalidated,
+        }
+
+    def clear(self):
+        self._trees.clear()
+        self.size_bytes = 0
@@ -0,0 +1,87 @@
+# -----------------------------------------------------------
+#                ПЕРЕТВОРЕННЯ ПРЕДСТАВЛЕНЬ
+# -----------------------------------------------------------
+
+from mlta.sparse import COOIncidence, CSRAdjacency
+
+
+def edges_to_adjacency_matrix(vertices, edges, directed=False, sparse=False):
+    # sparse=True — CSR-представлення, пам'ять O(n + m) замість O(n²)
+    if sparse:
+        return CSRAdjacency.from_edges(vertices, edges, directed)
+
+    n = len(vertices)
+    idx = {v: i for i, v in enumerate(vertices)}
+    A = [[0] * n for _ in range(n)]
+
+    for u, v in edges:
+        i, j = idx[u], idx[v]
+        A[i][j] += 1
+        if not directed:
+            A[j][i] += 1
+    return A
+
+
+def edges_to_incidence_matrix(vertices, edges, directed=False, sparse=False):
+    # sparse=True — COO-представлення на NumPy: два записи на ребро
+    if sparse:
+        return COOIncidence.from_edges(vertices, edges, directed)
+
+    n, m = len(vertices), len(edges)
+    idx = {v: i for i, v in enumerate(vertices)}
+    Inc = [[0] * m for _ in range(n)]
+
+    for col, (u, v) in enumerate(edges):
+        i, j = idx[u], idx[v]
+        if directed:
+            Inc[i][col] = 1
+            Inc[j][col] = -1
+        else:
+            Inc[i][col] = 1
+            Inc[j][col] = 1
+    return Inc
+
+
+def adjacency_matrix_to_adj_list(vertices, A):
+    if isinstance(A, CSRAdjacency):
+        return A.to_adj_list()
+
+    n = len(vertices)
+    adj = {v: [] for v in vertices}
+
+    for i in range(n):
+        for j in range(n):
+            for _ in range(A[i][j]):
+                adj[vertices[i]].append(vertices[j])
+    return adj
+
+
+def edges_to_adj_list(vertices, edges, directed=False):
+    """
+    Список суміжності напряму зі списку ребер за O(n + m), без матриці.
+    Результат збігається з adjacency_matrix_to_adj_list: сусіди йдуть у
+    порядку списку vertices, паралельні ребра повторюються.
+    """
+    idx = {v: i for i, v in enumerate(vertices)}
+
+    # кошик j — вершини u, що мають ребро u → j
+    buckets = [[] for _ in vertices]
+    for u, v in edges:
+        buckets[idx[v]].append(u)
+        if not directed:
+            buckets[idx[u]].append(v)
+
+    # обхід кошиків за зростанням j дає відсортовані списки сусідів
+    adj = {v: [] for v in vertices}
+    for j, v in enumerate(vertices):
+        for u in buckets[j]:
+            adj[u].append(v)
+        buckets[j] = None
+    return adj
+
+
+def iter_adj_list_lines(vertices, edges, directed=False):
+    """Рядки "v: [...]" для збереження списку суміжності, по одному."""
+    adj = edges_to_adj_list(vertices, edges, directed)
+    for v in vertices:
+        yield f"{v}: {adj.pop(v)}\n"
@@ -0,0 +1,71 @@
+# -----------------------------------------------------------
+#          ГРАФИ З ЛАБОРАТОРНИХ РОБІТ №1–№3
+# -----------------------------------------------------------
+
+# НЕорієнтований граф (ЛР №1, №2)
+VERTICES_UNDIR = ['a', 'b', 'c', 'd', 'e', 'f']
+EDGES_UNDIR = [
+    ('a', 'b'),
+    ('a', 'c'),
+    ('b', 'd'),
+    ('a', 'e'),
+    ('b', 'e'),
+    ('c', 'd'),
+    ('c', 'd'),  # паралельне ребро
+    ('c', 'f'),
+    ('d', 'f'),
+]
+
+# Орієнтований граф (ЛР №1, №2)
+VERTICES_DIR = ['a', 'b', 'c', 'd', 'e', 'f']
+EDGES_DIR = [
+    ('a', 'b'),
+    ('a', 'c'),
+    ('a', 'e'),
+    ('b', 'a'),
+    ('b', 'c'),
+    ('b', 'f'),
+    ('e', 'a'),
+    ('e', 'f'),
+    ('e', 'd'),
+    ('f', 'b'),
+    ('f', 'd'),
+]
+
+# Зважений орієнтований граф (ЛР №3): (u, v, w) — ребро u→v з вагою w
+VERTICES_WEIGHTED = ['a', 'b', 'c', 'd', 'e', 'f']
+EDGES_WEIGHTED = [
+    ('a', 'b', 6),
+    ('a', 'c', 2),
+    ('a', 'e', 8),
+    ('c', 'b', 3),
+    ('b', 'f', 4),
+    ('e', 'f', 1),
+    ('e', 'd', 7),
+    ('f', 'd', 2),
+]
+
+# -----------------------------------------------------------
+#                КООРДИНАТИ ДЛЯ ВІЗУАЛІЗАЦІЇ
+# -----------------------------------------------------------
+
+directed_positions = {
+    'a': (-0.400,  0.500),
+    'b': ( 0.400,  0.500),
+    'c': ( 0.000,  0.100),
+    'e': (-0.600, -0.500),
+    'f': ( 0.600, -0.500),
+    'd': ( 0.000, -0.700),
+}
+
+undirected_positions = {
+    'a': (-0.400,  0.500),
+    'b': ( 0.400,  0.500),
+    'c': (-0.600, -0.500),
+    'e': ( 0.000,  0.100),
+    'd': ( 0.600, -0.500),
+    'f': ( 0.000, -0.700),
+}
+
+# ЛР №3 використовує ту саму розкладку, що й орієнтований граф
+weighted_positions = directed_positions
@@ -0,0 +1,717 @@
+import heapq
+import math
+from collections import deque
+
+from mlta.protocol import ListSink
+from mlta.samples import VERTICES_WEIGHTED as VERTICES, EDGES_WEIGHTED as EDGES
+
+# -------------------------------------------------------------
+#              ІНДЕКС СУМІЖНОСТІ ЗВАЖЕНОГО ГРАФА
+# -------------------------------------------------------------
+
+def build_weighted_index(vertices=VERTICES, edges=EDGES, directed=True):
+    """
+    CSR-індекс зваженого графа для Дейкстри: вихідні ребра вершини i —
+    targets[offsets[i]:offsets[i + 1]] з вагами weights[...] у порядку
+    появи в edges. Списки, а не array, щоб ваги лишались int/float як є.
+    Індекс будується за O(V + E) один раз і придатний для багатьох запусків.
+    """
+    vertices = list(vertices)
+    idx = {v: i for i, v in enumerate(vertices)}
+    n = len(vertices)
+
+    offsets = [0] * (n + 1)
+    for u, v, _ in edges:
+        offsets[idx[u] + 1] += 1
+        if not directed:
+            offsets[idx[v] + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+
+    fill = offsets[:n]
+    targets = [0] * offsets[n]
+    weights = [0] * offsets[n]
+    for u, v, w in edges:
+        i, j = idx[u], idx[v]
+        p = fill[i]
+        targets[p] = j
+        weights[p] = w
+        fill[i] = p + 1
+        if not directed:
+            p = fill[j]
+            targets[p] = i
+            weights[p] = w
+            fill[j] = p + 1
+
+    return {
+        "vertices": vertices,
+        "idx": idx,
+        "offsets": offsets,
+        "targets": targets,
+        "weights": weights,
+        "directed": directed,
+    }
+
+
+# -------------------------------------------------------------
+#              АЛГОРИТМ ДЕЙКСТРИ
+# -------------------------------------------------------------
+#
+# Бінарна купа з "лінивим" видаленням: при покращенні відстані в купу
+# кладеться новий запис, а застарілі відкидаються при вийманні.
+# O((V + E) log V) замість O(V^2 + V*E). Рівні відстані виймаються в
+# порядку vertices, тож протокол збігається з лінійним пошуком мінімуму.
+
+DIJKSTRA_SETTLE = "settle"
+DIJKSTRA_RELAX = "relax"
+
+
+def dijkstra_arrays(index, s, target=None):
+    """
+    Ядро Дейкстри над індексом build_weighted_index; s, target — номери
+    вершин. Повертає (dist, pred, settled): списки довжини n (math.inf /
+    -1 для недосяжних) і кількість остаточно вибраних вершин. Якщо задано
+    target, пошук зупиняється, щойно target вибрано.
+    """
+    offsets, targets, weights = index["offsets"], index["targets"], index["weights"]
+    n = len(offsets) - 1
+    inf = math.inf
+    dist = [inf] * n
+    pred = [-1] * n
+    done = [False] * n
+    dist[s] = 0
+    heap = [(0, s)]
+    pop, push = heapq.heappop, heapq.heappush
+    settled = 0
+
+    while heap:
+        d, x = pop(heap)
+        if done[x]:
+            continue
+        done[x] = True
+        settled += 1
+        if x == target:
+            break
+        lo, hi = offsets[x], offsets[x + 1]
+        for y, w in zip(targets[lo:hi], weights[lo:hi]):
+            nd = d + w
+            if nd < dist[y]:
+                dist[y] = nd
+                pred[y] = x
+                push(heap, (nd, y))
+
+    return dist, pred, settled
+
+
+def iter_dijkstra_events(start, vertices=VERTICES, edges=EDGES, index=None):
+    """
+    Дейкстра як потік подій:
+      (DIJKSTRA_SETTLE, u, dist)          — u вибрано з остаточною відстанню;
+      (DIJKSTRA_RELAX, y, (old, new))     — релаксація покращила dist[y].
+    """
+    if index is None:
+        index = build_weighted_index(vertices, edges)
+    V = index["vertices"]
+    offsets, targets, weights = index["offsets"], index["targets"], index["weights"]
+    n = len(V)
+    s = index["idx"][start]
+    dist = [math.inf] * n
+    done = [False] * n
+    dist[s] = 0
+    heap = [(0, s)]
+
+    while heap:
+        d, x = heapq.heappop(heap)
+        if done[x]:
+            continue
+        done[x] = True
+        yield DIJKSTRA_SETTLE, V[x], d
+        for p in range(offsets[x], offsets[x + 1]):
+            y = targets[p]
+            nd = d + weights[p]
+            if nd < dist[y]:
+                old = dist[y]
+                dist[y] = nd
+                yield DIJKSTRA_RELAX, V[y], (old, nd)
+                if not done[y]:
+                    heapq.heappush(heap, (nd, y))
+
+
+def _dijkstra_formatter(order):
+    """
+    Форматує подію протоколу. Подія вибору несе k — скільки вершин уже
+    вибрано, тож множина S відтворюється з порядку вибору лише для тих
+    подій, які приймач справді зберіг.
+    """
+    def fmt(event):
+        if event[0] == DIJKSTRA_SETTLE:
+            _, v, d, k = event
+            # зовнішній set() перекладає таблицю так само, як visited.copy()
+            # у GUI, тож порядок елементів у виводі S не змінюється
+            return f"Вибрана вершина: {v}, dist={d}, S={set(set(order[:k]))}"
+        _, v, (old, new) = event
+        return f"Оновлення: dist[{v}] = {old} → {new}"
+    return fmt
+
+
+def dijkstra_distances(start, vertices=VERTICES, edges=EDGES, index=None):
+    """Лише відстані {v: dist} — без протоколу і без зайвих об'єктів."""
+    if index is None:
+        index = build_weighted_index(vertices, edges)
+    dist, _, _ = dijkstra_arrays(index, index["idx"][start])
+    return dict(zip(index["vertices"], dist))
+
+
+def dijkstra(start, vertices=VERTICES, edges=EDGES, index=None, sink=None):
+    """
+    Відстані та покроковий протокол (як у GUI ЛР №3). sink — приймач з
+    mlta.protocol (за замовчуванням повний протокол); з NullSink події
+    не створюються взагалі, а протокол — порожній список.
+    """
+    if sink is None:
+        sink = ListSink()
+    if not sink.enabled:
+        return dijkstra_distances(start, vertices, edges, index), []
+
+    if index is None:
+        index = build_weighted_index(vertices, edges)
+    dist = {v: math.inf for v in index["vertices"]}
+    order = []
+    for event in iter_dijkstra_events(start, index=index):
+        kind, v, value = event
+        if kind == DIJKSTRA_SETTLE:
+            dist[v] = value
+            order.append(v)
+            sink.emit((kind, v, value, len(order)))
+        else:
+            dist[v] = value[1]
+            sink.emit(event)
+    return dist, sink.lines(_dijkstra_formatter(order))
+
+
+# -------------------------------------------------------------
+#        ПОТЕНЦІАЛИ БЕЛЛМАНА–ФОРДА (ПЕРЕЗВАЖУВАННЯ ДЖОНСОНА)
+# -------------------------------------------------------------
+
+def bellman_ford_potentials(index):
+    """
+    Відстані від уявної вершини, з'єднаної з усіма ребрами ваги 0:
+    h[v] <= 0 і w + h[u] - h[v] >= 0 для кожного ребра (u, v, w).
+    Проходи по ребрах закінчуються, щойно черговий нічого не змінив.
+    ValueError — якщо є цикл від'ємної ваги.
+    """
+    offsets, targets, weights = index["offsets"], index["targets"], index["weights"]
+    n = len(offsets) - 1
+    h = [0] * n
+    for _ in range(n):
+        changed = False
+        for x in range(n):
+            hx = h[x]
+            lo, hi = offsets[x], offsets[x + 1]
+            for y, w in zip(targets[lo:hi], weights[lo:hi]):
+                if hx + w < h[y]:
+                    h[y] = hx + w
+                    changed = True
+        if not changed:
+            return h
+    raise ValueError("Граф містить цикл від'ємної ваги.")
+
+
+def reweighted_index(index, h):
+    """Копія індексу з вагами w + h[u] - h[v] (невід'ємні для потенціалів h)."""
+    offsets, targets, weights = index["offsets"], index["targets"], index["weights"]
+    new_weights = list(weights)
+    for x in range(len(offsets) - 1):
+        hx = h[x]
+        for p in range(offsets[x], offsets[x + 1]):
+            new_weights[p] = weights[p] + hx - h[targets[p]]
+    return dict(index, weights=new_weights)
+
+
+# -------------------------------------------------------------
+#     БЕЛЛМАН–ФОРД / SPFA: ВІД'ЄМНІ ВАГИ ТА ВІД'ЄМНІ ЦИКЛИ
+# -------------------------------------------------------------
+#
+# Обидва варіанти працюють на тому ж індексі, що й Дейкстра, і
+# повертають (dist, pred, cycle, relaxations): cycle — номери вершин
+# від'ємного циклу, досяжного з s (None, якщо його немає; тоді dist
+# точні), relaxations — кількість успішних релаксацій.
+
+def _pred_cycle(pred, start):
+    """Цикл у графі попередників, що містить вершину на шляху від start, або None."""
+    seen = {}
+    x, step = start, 0
+    while x != -1 and x not in seen:
+        seen[x] = step
+        x = pred[x]
+        step += 1
+    if x == -1:
+        return None
+    cycle = [x]
+    y = pred[x]
+    while y != x:
+        cycle.append(y)
+        y = pred[y]
+    cycle.reverse()  # у напрямку ребер: pred[c[i+1]] == c[i]
+    return cycle
+
+
+def _find_pred_cycle(pred):
+    """Будь-який цикл у графі попередників (кожна вершина — одне ребро)."""
+    n = len(pred)
+    color = [0] * n  # 0 — не бачили, 1 — на поточному шляху, 2 — перевірено
+    for v in range(n):
+        if color[v]:
+            continue
+        x = v
+        while x != -1 and color[x] == 0:
+            color[x] = 1
+            x = pred[x]
+        if x != -1 and color[x] == 1:
+            return _pred_cycle(pred, x)
+        x = v
+        while x != -1 and color[x] == 1:
+            color[x] = 2
+            x = pred[x]
+    return None
+
+
+def bellman_ford_arrays(index, s):
+    """
+    Класичні проходи по всіх ребрах; зупинка, щойно прохід нічого не
+    змінив. Якщо змінює навіть n-й прохід — є від'ємний цикл.
+    """
+    offsets, targets, weights = index["offsets"], index["targets"], index["weights"]
+    n = len(offsets) - 1
+    inf = math.inf
+    dist = [inf] * n
+    pred = [-1] * n
+    dist[s] = 0
+    relaxations = 0
+    last = -1
+    for _ in range(n):
+        last = -1
+        for x in range(n):
+            dx = dist[x]
+            if dx == inf:
+                continue
+            lo, hi = offsets[x], offsets[x + 1]
+            for y, w in zip(targets[lo:hi], weights[lo:hi]):
+                if dx + w < dist[y]:
+                    dist[y] = dx + w
+                    pred[y] = x
+                    relaxations += 1
+                    last = y
+        if last < 0:
+            return dist, pred, None, relaxations
+
+    # n проходів не вистачило: після n кроків назад по pred ми в циклі
+    x = last
+    for _ in range(n):
+        x = pred[x]
+    return dist, pred, _pred_cycle(pred, x), relaxations
+
+
+def spfa_arrays(index, s):
+    """
+    SPFA: черга вершин, чия відстань змінилась (кожна — не більше одного
+    разу в черзі). Раз на n релаксацій граф попередників перевіряється на
+    цикл — будь-який такий цикл від'ємний, і він з'являється, щойно
+    від'ємний цикл досяжний, тож алгоритм завжди зупиняється.
+    """
+    offsets, targets, weights = index["offsets"], index["targets"], index["weights"]
+    n = len(offsets) - 1
+    inf = math.inf
+    dist = [inf] * n
+    pred = [-1] * n
+    in_queue = [False] * n
+    dist[s] = 0
+    queue = deque([s])
+    in_queue[s] = True
+    relaxations = 0
+
+    while queue:
+        x = queue.popleft()
+        in_queue[x] = False
+        dx = dist[x]
+        lo, hi = offsets[x], offsets[x + 1]
+        for y, w in zip(targets[lo:hi], weights[lo:hi]):
+            if dx + w < dist[y]:
+                dist[y] = dx + w
+                pred[y] = x
+                relaxations += 1
+                if relaxations % n == 0:
+                    cycle = _find_pred_cycle(pred)
+                    if cycle is not None:
+                        return dist, pred, cycle, relaxations
+                if not in_queue[y]:
+                    in_queue[y] = True
+                    queue.append(y)
+
+    return dist, pred, None, relaxations
+
+
+def bellman_ford(start, vertices=VERTICES, edges=EDGES, index=None, method="spfa"):
+    """
+    Найкоротші відстані з довільними (зокрема від'ємними) вагами.
+    method: "spfa" (черга) або "passes" (проходи по всіх ребрах).
+
+    Повертає словник:
+      {
+        "dist": {v: відстань},          # неточні, якщо знайдено цикл
+        "pred": {v: попередник або None},
+        "negative_cycle": [u0, u1, ..., uk] або None,   # ребра u_i → u_{i+1}, uk → u0
+        "relaxations": кількість успішних релаксацій
+      }
+    """
+    if method not in ("spfa", "passes"):
+        raise ValueError("method має бути 'spfa' або 'passes'.")
+    if index is None:
+        index = build_weighted_index(vertices, edges)
+    run = spfa_arrays if method == "spfa" else bellman_ford_arrays
+    dist, pred, cycle, relaxations = run(index, index["idx"][start])
+    V = index["vertices"]
+    return {
+        "dist": dict(zip(V, dist)),
+        "pred": {v: (V[p] if p >= 0 else None) for v, p in zip(V, pred)},
+        "negative_cycle": None if cycle is None else [V[i] for i in cycle],
+        "relaxations": relaxations,
+    }
+
+
+# -------------------------------------------------------------
+#     ЗАПИТИ ВІД ТОЧКИ ДО ТОЧКИ: ДВОБІЧНА ДЕЙКСТРА ТА A*
+# -------------------------------------------------------------
+#
+# Обидва варіанти повертають (dist, path, settled): відстань, номери
+# вершин шляху (порожній список, якщо шляху немає) і скільки вершин
+# було остаточно вибрано — міру розміру простору пошуку.
+
+def reverse_index(index):
+    """Індекс графа з оберненими ребрами (для зворотного пошуку)."""
+    offsets, targets, weights = index["offsets"], index["targets"], index["weights"]
+    n = len(offsets) - 1
+    r_offsets = [0] * (n + 1)
+    for y in targets:
+        r_offsets[y + 1] += 1
+    for i in range(n):
+        r_offsets[i + 1] += r_offsets[i]
+    fill = r_offsets[:n]
+    r_targets = [0] * len(targets)
+    r_weights = [0] * len(targets)
+    for x in range(n):
+        for p in range(offsets[x], offsets[x + 1]):
+            y = targets[p]
+            q = fill[y]
+            r_targets[q] = x
+            r_weights[q] = weights[p]
+            fill[y] = q + 1
+    return dict(index, offsets=r_offsets, targets=r_targets, weights=r_weights)
+
+
+def bidirectional_dijkstra_arrays(index, rindex, s, t):
+    """
+    Дейкстра одночасно з s (по index) і з t (по rindex). На кожному кроці
+    просувається бік з меншим ключем у купі; пошук зупиняється, коли сума
+    ключів обох куп не менша за найкращий знайдений шлях mu.
+    """
+    n = len(index["offsets"]) - 1
+    inf = math.inf
+    if s == t:
+        return 0, [s], 1
+    sides = (index, rindex)
+    dist = ([inf] * n, [inf] * n)
+    pred = ([-1] * n, [-1] * n)
+    done = ([False] * n, [False] * n)
+    dist[0][s] = 0
+    dist[1][t] = 0
+    heaps = ([(0, s)], [(0, t)])
+    mu, meet, settled = inf, -1, 0
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, x = heapq.heappop(heaps[side])
+        if done[side][x]:
+            continue
+        done[side][x] = True
+        settled += 1
+        idx = sides[side]
+        my_dist, my_pred, other = dist[side], pred[side], dist[1 - side]
+        lo, hi = idx["offsets"][x], idx["offsets"][x + 1]
+        for y, w in zip(idx["targets"][lo:hi], idx["weights"][lo:hi]):
+            nd = d + w
+            if nd < my_dist[y]:
+                my_dist[y] = nd
+                my_pred[y] = x
+                heapq.heappush(heaps[side], (nd, y))
+            if nd + other[y] < mu:
+                mu = nd + other[y]
+                meet = y
+
+    if meet < 0:
+        return inf, [], settled
+    path = walk_predecessors(pred[0], meet)
+    x = pred[1][meet]
+    while x != -1:
+        path.append(x)
+        x = pred[1][x]
+    return mu, path, settled
+
+
+def astar_arrays(index, s, t, h):
+    """
+    A*: купа впорядкована за dist + h(v), де h(v) — нижня оцінка відстані
+    до t (h — функція від номера вершини, значення кешуються). Для
+    узгодженої евристики кожна вершина вибирається один раз; для лише
+    допустимої вершини можуть перевідкриватися, але відповідь точна.
+    """
+    n = len(index["offsets"]) - 1
+    offsets, targets, weights = index["offsets"], index["targets"], index["weights"]
+    inf = math.inf
+    dist = [inf] * n
+    pred = [-1] * n
+    hval = [None] * n
+    dist[s] = 0
+    hval[s] = h(s)
+    heap = [(hval[s], 0, s)]
+    settled = 0
+
+    while heap:
+        _, d, x = heapq.heappop(heap)
+        if d > dist[x]:
+            continue
+        settled += 1
+        if x == t:
+            return d, walk_predecessors(pred, t), settled
+        lo, hi = offsets[x], offsets[x + 1]
+        for y, w in zip(targets[lo:hi], weights[lo:hi]):
+            nd = d + w
+            if nd < dist[y]:
+                dist[y] = nd
+                pred[y] = x
+                hy = hval[y]
+                if hy is None:
+                    hy = hval[y] = h(y)
+                heapq.heappush(heap, (nd + hy, nd, y))
+
+    return inf, [], settled
+
+
+def euclidean_heuristic(pos, target, scale=1.0):
+    """
+    h(v) = scale * |pos[v] - pos[target]|. Евристика узгоджена, якщо
+    scale * |pos[u] - pos[v]| <= w для кожного ребра — див. euclidean_scale.
+    Вершини без координат отримують h = 0.
+    """
+    tx, ty = pos[target]
+
+    def h(v):
+        p = pos.get(v)
+        if p is None:
+            return 0
+        return scale * math.hypot(p[0] - tx, p[1] - ty)
+    return h
+
+
+def euclidean_scale(pos, edges):
+    """
+    Найбільший множник, з яким евристика euclidean_heuristic узгоджена:
+    мінімум w / |pos[u] - pos[v]| по ребрах ненульової довжини.
+    """
+    scale = math.inf
+    for u, v, w in edges:
+        length = math.dist(pos[u], pos[v])
+        if length > 0:
+            scale = min(scale, w / length)
+    return 0.0 if scale == math.inf else max(scale, 0.0)
+
+
+# -------------------------------------------------------------
+#        РУШІЙ НАЙКОРОТШИХ ШЛЯХІВ: ПОБУДОВА РАЗ, ЗАПИТИ БАГАТО
+# -------------------------------------------------------------
+
+class ShortestPathEngine:
+    """
+    Індекс зваженого графа, побудований один раз, і запити до нього:
+    відстані з джерела, відстань між двома вершинами (пошук зупиняється,
+    щойно ціль вибрано) та відновлення шляху через масив попередників.
+    """
+
+    def __init__(self, vertices=VERTICES, edges=EDGES, directed=True):
+        edges = list(edges)
+        self.index = build_weighted_index(vertices, edges, directed)
+        self.vertices = self.index["vertices"]
+        self.directed = directed
+        self.has_negative = any(w < 0 for w in self.index["weights"])
+        self.integral = all(isinstance(w, int) for w in self.index["weights"])
+        self._reverse = None
+
+    @classmethod
+    def from_graph(cls, graph, directed=None):
+        """
+        З mlta.graph.Graph (ребра (u, v, w)) або mlta.loader.EdgeListGraph.
+        """
+        if directed is None:
+            directed = graph.directed
+        if hasattr(graph, "iter_weighted_edges"):
+            return cls(graph.vertices, graph.iter_weighted_edges(), directed)
+        return cls(graph.vertices, graph.edges, directed)
+
+    def vertex_id(self, v):
+        """Номер вершини в індексі (ValueError, якщо вершини немає)."""
+        i = self.index["idx"].get(v)
+        if i is None:
+            raise ValueError(f"Вершини {v!r} немає в графі.")
+        return i
+
+    def require_non_negative(self):
+        """ValueError, якщо є ребра від'ємної ваги (запити Дейкстри їх не допускають)."""
+        if self.has_negative:
+            raise ValueError("Дейкстра потребує невід'ємних ваг ребер.")
+
+    def tree(self, source):
+        """(dist, pred): {v: відстань}, {v: попередник або None}."""
+        self.require_non_negative()
+        dist, pred, _ = dijkstra_arrays(self.index, self.vertex_id(source))
+        V = self.vertices
+        return (dict(zip(V, dist)),
+                {v: (V[p] if p >= 0 else None) for v, p in zip(V, pred)})
+
+    def distances(self, source):
+        self.require_non_negative()
+        dist, _, _ = dijkstra_arrays(self.index, self.vertex_id(source))
+        return dict(zip(self.vertices, dist))
+
+    def distance(self, source, target):
+        self.require_non_negative()
+        t = self.vertex_id(target)
+        dist, _, _ = dijkstra_arrays(self.index, self.vertex_id(source), t)
+        return dist[t]
+
+    def path(self, source, target):
+        """
+        (відстань, [source, ..., target]); якщо target недосяжна —
+        (math.inf, []).
+        """
+        self.require_non_negative()
+        t = self.vertex_id(target)
+        dist, pred, _ = dijkstra_arrays(self.index, self.vertex_id(source), t)
+        if dist[t] == math.inf:
+            return math.inf, []
+        return dist[t], [self.vertices[i] for i in walk_predecessors(pred, t)]
+
+    def bellman_ford(self, source, method="spfa"):
+        """Відстані з source при від'ємних вагах (див. bellman_ford)."""
+        self.vertex_id(source)
+        return bellman_ford(source, index=self.index, method=method)
+
+    def query(self, source, target, method="bidirectional", heuristic=None):
+        """
+        Запит від точки до точки. method: "dijkstra" | "bidirectional" | "astar";
+        heuristic — функція від назви вершини (нижня оцінка відстані до
+        target), наприклад euclidean_heuristic(pos, target, scale).
+        Повертає {"dist": ..., "path": [...], "settled": кількість вибраних вершин}.
+        """
+        self.require_non_negative()
+        s, t = self.vertex_id(source), self.vertex_id(target)
+        if method == "dijkstra":
+            dist, pred, settled = dijkstra_arrays(self.index, s, t)
+            path = walk_predecessors(pred, t) if dist[t] != math.inf else []
+            d = dist[t]
+        elif method == "bidirectional":
+            if self._reverse is None:
+                self._reverse = self.index if not self.directed else reverse_index(self.index)
+            d, path, settled = bidirectional_dijkstra_arrays(self.index, self._reverse, s, t)
+        elif method == "astar":
+            if heuristic is None:
+                raise ValueError("Для A* потрібна евристика.")
+            V = self.vertices
+            d, path, settled = astar_arrays(self.index, s, t, lambda i: heuristic(V[i]))
+        else:
+            raise ValueError("method має бути 'dijkstra', 'bidirectional' або 'astar'.")
+        return {"dist": d, "path": [self.vertices[i] for i in path], "settled": settled}
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return (f"ShortestPathEngine(n={len(self.vertices)}, "
+                f"m={len(self.index['targets'])}, {kind})")
+
+
+def walk_predecessors(pred, t):
+    """Номери вершин шляху до t за масивом попередників (від джерела)."""
+    path = []
+    while t != -1:
+        path.append(t)
+        t = pred[t]
+    path.reverse()
+    return path
+
+
+# -------------------------------------------------------------
+#       АЛГОРИТМ ФЛОЙДА–УОРШЕЛА
+# -------------------------------------------------------------
+
+FLOYD_PIVOT = "pivot"
+FLOYD_UPDATE = "update"
+
+
+def _floyd_formatter(vertices):
+    def fmt(event):
+        if event[0] == FLOYD_PIVOT:
+            return f"\n=== Проміжна вершина: {vertices[event[1]]} ==="
+        _, i, j, old, new = event
+        return f"D[{vertices[i]}][{vertices[j]}] : {old} → {new}"
+    return fmt
+
+
+def floyd_warshall(vertices=VERTICES, edges=EDGES, sink=None):
+    """
+    Матриця відстаней D (list-of-lists) і протокол покращень. sink — як у
+    dijkstra; без протоколу внутрішній цикл не створює жодних подій.
+    З паралельних ребер береться найлегше; петля змінює діагональ лише
+    тоді, коли вона від'ємна (як і в mlta.apsp.initial_matrices).
+    """
+    if sink is None:
+        sink = ListSink()
+    n = len(vertices)
+    idx = {v: i for i, v in enumerate(vertices)}
+
+    # ініціалізація матриці
+    D = [[math.inf]*n for _ in range(n)]
+    for v in vertices:
+        D[idx[v]][idx[v]] = 0
+
+    for u, v, w in edges:
+        i, j = idx[u], idx[v]
+        if w < D[i][j]:
+            D[i][j] = w
+
+    emit = sink.emit if sink.enabled else None
+
+    # головний цикл алгоритму
+    for k in range(n):
+        Dk = D[k]
+        if emit:
+            emit((FLOYD_PIVOT, k))
+        for i in range(n):
+            Di = D[i]
+            if Di[k] == math.inf:
+                continue
+            for j in range(n):
+                nd = Di[k] + Dk[j]
+                if Di[j] > nd:
+                    if emit:
+                        emit((FLOYD_UPDATE, i, j, Di[j], nd))
+                    Di[j] = nd
+
+    return D, sink.lines(_floyd_formatter(vertices))
+
+
+def format_distance_matrix(vertices, D):
+    """Матриця відстаней у текстовому вигляді, як її показує run_floyd."""
+    text = "    " + " ".join(vertices) + "\n"
+    for i, v in enumerate(vertices):
+        text += f"{v}: " + " ".join(str(D[i][j]) for j in range(len(vertices))) + "\n"
+    return text
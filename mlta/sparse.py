@@ -0,0 +1,350 @@
+import importlib.util
+from array import array
+from bisect import bisect_left
+from typing import Dict, Hashable, Iterator, List, Sequence, Tuple
+
+# NumPy потрібен лише для COO-матриці інцидентності (і блочного експорту),
+# тому імпортується всередині методів при першому використанні: CSR,
+# завантажувач, CLI та ЛР №1 не платять за імпорт NumPy
+HAS_NP = importlib.util.find_spec("numpy") is not None
+
+# -----------------------------------------------------------
+#          РОЗРІДЖЕНА МАТРИЦЯ СУМІЖНОСТІ (CSR)
+# -----------------------------------------------------------
+
+
+class CSRAdjacency:
+    """
+    Матриця суміжності у форматі CSR (compressed sparse row).
+
+    Рядок i займає діапазон offsets[i] .. offsets[i + 1] у масивах
+    targets (номери стовпців, за зростанням) та counts (кратності —
+    кількість паралельних ребер i → j). Нульові клітинки не зберігаються,
+    тому пам'ять росте з кількістю ребер, а не з n².
+    """
+
+    __slots__ = ("vertices", "directed", "offsets", "targets", "counts", "_idx")
+
+    def __init__(self, vertices: Sequence[Hashable], offsets, targets, counts,
+                 directed: bool = False):
+        if len(offsets) != len(vertices) + 1:
+            raise ValueError("Довжина offsets має бути n + 1.")
+        if len(targets) != len(counts):
+            raise ValueError("targets і counts повинні мати однакову довжину.")
+
+        self.vertices = list(vertices)
+        self.directed = directed
+        self.offsets = offsets
+        self.targets = targets
+        self.counts = counts
+        self._idx = None
+
+    @classmethod
+    def from_edges(cls, vertices: Sequence[Hashable], edges,
+                   directed: bool = False) -> "CSRAdjacency":
+        """
+        Будує CSR зі списку ребер з тією ж семантикою, що й
+        edges_to_adjacency_matrix: у неорієнтованому графі ребро u—v
+        додається в обидва рядки, петля — двічі в той самий рядок.
+        """
+        n = len(vertices)
+        idx = {v: i for i, v in enumerate(vertices)}
+
+        src = array("i")
+        dst = array("i")
+        for u, v in edges:
+            i, j = idx[u], idx[v]
+            src.append(i)
+            dst.append(j)
+            if not directed:
+                src.append(j)
+                dst.append(i)
+
+        # сортування підрахунком за рядком
+        start = array("i", [0]) * (n + 1)
+        for i in src:
+            start[i + 1] += 1
+        for i in range(n):
+            start[i + 1] += start[i]
+
+        fill = array("i", start)
+        raw = array("i", [0]) * len(src)
+        for i, j in zip(src, dst):
+            raw[fill[i]] = j
+            fill[i] += 1
+        del src, dst, fill
+
+        # стискання паралельних ребер у кратності
+        offsets = array("i", [0]) * (n + 1)
+        targets = array("i")
+        counts = array("i")
+        for i in range(n):
+            prev = -1
+            for j in sorted(raw[start[i]:start[i + 1]]):
+                if j == prev:
+                    counts[-1] += 1
+                else:
+                    targets.append(j)
+                    counts.append(1)
+                    prev = j
+            offsets[i + 1] = len(targets)
+
+        return cls(vertices, offsets, targets, counts, directed)
+
+    # ---------------------- доступ ----------------------
+
+    @property
+    def n(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def nnz(self) -> int:
+        """Кількість ненульових клітинок."""
+        return len(self.targets)
+
+    def index(self, v: Hashable) -> int:
+        if self._idx is None:
+            self._idx = {u: i for i, u in enumerate(self.vertices)}
+        return self._idx[v]
+
+    def row(self, i: int) -> Iterator[Tuple[int, int]]:
+        """Пари (j, A[i][j]) для ненульових клітинок рядка i."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return zip(self.targets[lo:hi], self.counts[lo:hi])
+
+    def get(self, i: int, j: int) -> int:
+        """A[i][j] — двійковий пошук у відсортованому рядку."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.targets, j, lo, hi)
+        if k < hi and self.targets[k] == j:
+            return self.counts[k]
+        return 0
+
+    def __getitem__(self, key: Tuple[int, int]) -> int:
+        i, j = key
+        return self.get(i, j)
+
+    def degree(self, i: int) -> int:
+        """Сума рядка i (з урахуванням кратностей)."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return sum(self.counts[lo:hi])
+
+    # ------------------ лінива конвертація ------------------
+
+    def iter_dense_rows(self) -> Iterator[List[int]]:
+        """Рядки щільної матриці по одному (O(n) пам'яті на рядок)."""
+        n = self.n
+        for i in range(n):
+            row = [0] * n
+            for j, c in self.row(i):
+                row[j] = c
+            yield row
+
+    def to_dense(self) -> List[List[int]]:
+        """Щільна матриця, як у edges_to_adjacency_matrix."""
+        return list(self.iter_dense_rows())
+
+    def iter_adj_list(self) -> Iterator[Tuple[Hashable, List[Hashable]]]:
+        """Пари (вершина, сусіди) у порядку adjacency_matrix_to_adj_list."""
+        V = self.vertices
+        for i, v in enumerate(V):
+            neighbors = []
+            for j, c in self.row(i):
+                neighbors.extend([V[j]] * c)
+            yield v, neighbors
+
+    def to_adj_list(self) -> Dict[Hashable, List[Hashable]]:
+        return dict(self.iter_adj_list())
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        return f"CSRAdjacency(n={self.n}, nnz={self.nnz}, {kind})"
+
+
+# -----------------------------------------------------------
+#          РОЗРІДЖЕНА МАТРИЦЯ ІНЦИДЕНТНОСТІ (COO)
+# -----------------------------------------------------------
+
+
+class COOIncidence:
+    """
+    Матриця інцидентності n×m у координатному форматі (COO).
+
+    Кожне ребро (стовпець) дає рівно два записи: спершу для початку u,
+    потім для кінця v. Записи зберігаються в NumPy-масивах rows/cols/data
+    довжини 2m. Знаки як у edges_to_incidence_matrix: орієнтований граф —
+    +1 / -1, неорієнтований — 1 / 1. Для петлі перший запис має значення 0,
+    тому сума записів збігається зі щільною матрицею.
+    """
+
+    __slots__ = ("vertices", "directed", "m", "rows", "cols", "data", "_row_order")
+
+    def __init__(self, vertices: Sequence[Hashable], rows, cols, data, m: int,
+                 directed: bool = False):
+        if not HAS_NP:
+            raise ImportError("Для COOIncidence потрібен numpy: pip install numpy")
+        import numpy as np
+
+        if not (len(rows) == len(cols) == len(data)):
+            raise ValueError("rows, cols і data повинні мати однакову довжину.")
+
+        self.vertices = list(vertices)
+        self.directed = directed
+        self.m = m
+        self.rows = np.asarray(rows, dtype=np.int32)
+        self.cols = np.asarray(cols, dtype=np.int32)
+        self.data = np.asarray(data, dtype=np.int8)
+        self._row_order = None
+
+    @classmethod
+    def from_edges(cls, vertices: Sequence[Hashable], edges,
+                   directed: bool = False) -> "COOIncidence":
+        if not HAS_NP:
+            raise ImportError("Для COOIncidence потрібен numpy: pip install numpy")
+        import numpy as np
+
+        idx = {v: i for i, v in enumerate(vertices)}
+        m = len(edges)
+        ends = np.fromiter((idx[x] for e in edges for x in e),
+                           dtype=np.int32, count=2 * m).reshape(m, 2)
+        tails, heads = ends[:, 0], ends[:, 1]
+
+        tail_data = np.ones(m, dtype=np.int8)
+        tail_data[tails == heads] = 0
+        head_data = np.full(m, -1 if directed else 1, dtype=np.int8)
+
+        edge_ids = np.arange(m, dtype=np.int32)
+        return cls(
+            vertices,
+            np.concatenate([tails, heads]),
+            np.concatenate([edge_ids, edge_ids]),
+            np.concatenate([tail_data, head_data]),
+            m, directed,
+        )
+
+    # ---------------------- доступ ----------------------
+
+    @property
+    def n(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.n, self.m
+
+    def _as_indices(self, sel, size: int):
+        import numpy as np
+
+        idx = np.arange(size)[sel] if isinstance(sel, slice) else np.asarray(sel)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+        return idx.astype(np.int64, copy=False)
+
+    def row_block(self, sel):
+        """
+        Рядки sel (номери вершин, зріз або булева маска) як щільний
+        масив len(sel)×m. Вибірка записів — одна векторна операція.
+        """
+        import numpy as np
+
+        idx = self._as_indices(sel, self.n)
+        uniq, inv = np.unique(idx, return_inverse=True)
+        pos = np.full(self.n, -1, dtype=np.int64)
+        pos[uniq] = np.arange(len(uniq))
+
+        out = np.zeros((len(uniq), self.m), dtype=np.int8)
+        r = pos[self.rows]
+        mask = r >= 0
+        np.add.at(out, (r[mask], self.cols[mask]), self.data[mask])
+        return out[inv]
+
+    def column_block(self, sel):
+        """Стовпці sel (номери ребер) як щільний масив n×len(sel)."""
+        import numpy as np
+
+        idx = self._as_indices(sel, self.m)
+        k = np.arange(len(idx))
+
+        out = np.zeros((self.n, len(idx)), dtype=np.int8)
+        np.add.at(out, (self.rows[idx], k), self.data[idx])
+        np.add.at(out, (self.rows[idx + self.m], k), self.data[idx + self.m])
+        return out
+
+    def to_dense(self):
+        return self.row_block(slice(None))
+
+    # ---------------------- експорт ----------------------
+
+    def iter_dense_rows(self) -> Iterator[List[int]]:
+        """Рядки щільної матриці як списки int, по одному."""
+        import numpy as np
+
+        if self._row_order is None:
+            self._row_order = np.argsort(self.rows, kind="stable")
+        order = self._row_order
+        bounds = np.searchsorted(self.rows[order], np.arange(self.n + 1))
+
+        for i in range(self.n):
+            sel = order[bounds[i]:bounds[i + 1]]
+            row = np.zeros(self.m, dtype=np.int8)
+            np.add.at(row, self.cols[sel], self.data[sel])
+            yield row.tolist()
+
+    def to_list(self) -> List[List[int]]:
+        """Щільна матриця, як у edges_to_incidence_matrix."""
+        return list(self.iter_dense_rows())
+
+    def write_text(self, f) -> None:
+        """Запис у поточному текстовому форматі (рядки через пробіл)."""
+        for row in self.iter_dense_rows():
+            f.write(" ".join(str(x) for x in row) + "\n")
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        return f"COOIncidence(n={self.n}, m={self.m}, {kind})"
+
+
+# -----------------------------------------------------------
+#          CSR-МАСИВИ ДЛЯ ЗВАЖЕНИХ ГРАФІВ (БЕЗ СТИСКАННЯ)
+# -----------------------------------------------------------
+
+
+def build_csr_arrays(n: int, src, dst, weights=None, directed: bool = False):
+    """
+    Групує ребра за початковою вершиною сортуванням підрахунком за O(n + m).
+    Повертає (offsets, targets, row_weights): на відміну від CSRAdjacency
+    паралельні ребра не зливаються, бо в них можуть бути різні ваги;
+    сусіди в рядку йдуть у порядку появи ребер. Для неорієнтованого графа
+    кожне ребро записується в обидва рядки.
+    """
+    offsets = array("i", [0]) * (n + 1)
+    for i in src:
+        offsets[i + 1] += 1
+    if not directed:
+        for j in dst:
+            offsets[j + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+
+    total = offsets[n]
+    fill = array("i", offsets)
+    targets = array("i", [0]) * total
+    row_weights = None
+    if weights is not None:
+        row_weights = array(weights.typecode if isinstance(weights, array) else "d",
+                            [0]) * total
+
+    for k, (i, j) in enumerate(zip(src, dst)):
+        p = fill[i]
+        targets[p] = j
+        fill[i] = p + 1
+        if row_weights is not None:
+            row_weights[p] = weights[k]
+        if not directed:
+            p = fill[j]
+            targets[p] = i
+            fill[j] = p + 1
+            if row_weights is not None:
+                row_weights[p] = weights[k]
+
+    return offsets, targets, row_weights
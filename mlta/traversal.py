@@ -0,0 +1,465 @@
+from array import array
+from collections import deque
+
+# -----------------------------------------------------------
+#                   ДОПОМІЖНІ СТРУКТУРИ
+# -----------------------------------------------------------
+
+def build_adj_list(vertices, edges, directed=False):
+    adj = {v: [] for v in vertices}
+    for u, v in edges:
+        adj[u].append(v)
+        if not directed:
+            adj[v].append(u)
+    for v in adj:
+        adj[v].sort()
+    return adj
+
+
+# -----------------------------------------------------------
+#                       DFS ПРОТОКОЛ
+# -----------------------------------------------------------
+
+DFS_PUSH = "push"
+DFS_POP = "pop"
+
+
+def iter_dfs_events(vertices, edges, start, directed=False, adj=None, visited=None):
+    """
+    DFS як потік подій-дельт замість копій стеку:
+      (DFS_PUSH, v, номер)  — v покладено на стек і йому присвоєно DFS-номер;
+      (DFS_POP, v, None)    — v знято зі стеку.
+    Для кожної вершини на стеку зберігається курсор (ітератор) по її
+    списку сусідів, тож adj[x] не переглядається спочатку, коли x знову
+    стає вершиною стеку. Час і пам'ять — O(V + E).
+    adj — вже побудований список суміжності (щоб не будувати повторно);
+    visited — спільна множина відвіданих для кількох обходів поспіль.
+    """
+    if adj is None:
+        adj = build_adj_list(vertices, edges, directed)
+    if visited is None:
+        visited = set()
+    visited.add(start)
+    counter = 1
+
+    stack = [(start, iter(adj[start]))]
+    yield DFS_PUSH, start, counter
+
+    while stack:
+        x, cursor = stack[-1]
+
+        for y in cursor:
+            if y not in visited:
+                counter += 1
+                visited.add(y)
+                stack.append((y, iter(adj[y])))
+                yield DFS_PUSH, y, counter
+                break
+        else:
+            stack.pop()
+            yield DFS_POP, x, None
+
+
+def dfs_snapshots(events):
+    """
+    Відновлює з подій рядки протоколу (вершина, номер або "-", стек)
+    у форматі dfs_protocol. Копія стеку робиться лише тут — коли
+    споживачу справді потрібні повні знімки.
+    """
+    stack = []
+    for kind, v, num in events:
+        if kind == DFS_PUSH:
+            stack.append(v)
+            yield v, num, stack.copy()
+        else:
+            stack.pop()
+            if stack:
+                yield v, "-", stack.copy()
+
+
+def dfs_protocol(vertices, edges, start, directed=False, adj=None):
+    return list(dfs_snapshots(iter_dfs_events(vertices, edges, start, directed, adj)))
+
+
+# -----------------------------------------------------------
+#                       BFS ПРОТОКОЛ
+# -----------------------------------------------------------
+
+BFS_ENQUEUE = "enqueue"
+BFS_DEQUEUE = "dequeue"
+
+
+def iter_bfs_events(vertices, edges, start, directed=False, adj=None, visited=None):
+    """
+    BFS як потік подій без копій черги:
+      (BFS_ENQUEUE, v, номер) — v додано в чергу і присвоєно BFS-номер;
+      (BFS_DEQUEUE, x, None)  — x знято з голови черги після перегляду сусідів.
+    Час і пам'ять — O(V + E) навіть для "широких" графів (зірки, сітки).
+    adj і visited — як в iter_dfs_events.
+    """
+    if adj is None:
+        adj = build_adj_list(vertices, edges, directed)
+    if visited is None:
+        visited = set()
+    visited.add(start)
+    queue = deque([start])
+    counter = 1
+    yield BFS_ENQUEUE, start, counter
+
+    while queue:
+        x = queue.popleft()
+
+        for y in adj[x]:
+            if y not in visited:
+                counter += 1
+                visited.add(y)
+                queue.append(y)
+                yield BFS_ENQUEUE, y, counter
+
+        yield BFS_DEQUEUE, x, None
+
+
+def bfs_snapshots(events):
+    """
+    Рядки протоколу (вершина, номер або "-", черга) у форматі bfs_protocol.
+    Повний стан черги копіюється лише тут, на вимогу споживача.
+    """
+    queue = deque()
+    for kind, v, num in events:
+        if kind == BFS_ENQUEUE:
+            queue.append(v)
+            yield v, num, list(queue)
+        else:
+            queue.popleft()
+            if queue:
+                yield v, "-", list(queue)
+
+
+def traversal_numbers(events):
+    """Номери обходу {вершина: номер} з потоку подій DFS або BFS."""
+    return {v: num for _, v, num in events if num is not None}
+
+
+def bfs_protocol(vertices, edges, start, directed=False, adj=None):
+    return list(bfs_snapshots(iter_bfs_events(vertices, edges, start, directed, adj)))
+
+
+def format_protocol(rows):
+    """Текст протоколу — по рядку на крок, як його показує GUI ЛР №2."""
+    return "\n".join(str(row) for row in rows)
+
+
+# -----------------------------------------------------------
+#      BFS З ПЕРЕМИКАННЯМ НАПРЯМКУ (TOP-DOWN / BOTTOM-UP)
+# -----------------------------------------------------------
+
+def build_bfs_index(adj, directed=False):
+    """
+    Переводить список суміжності у масиви CSR для bfs_direction_optimizing:
+    вихідні сусіди (у порядку adj) і, для орієнтованого графа, вхідні.
+    Індекс можна побудувати один раз і використати для багатьох стартів.
+    """
+    vertices = list(adj)
+    idx = {v: i for i, v in enumerate(vertices)}
+    n = len(vertices)
+
+    offsets = array("i", [0]) * (n + 1)
+    targets = array("i")
+    for i, v in enumerate(vertices):
+        targets.extend(idx[y] for y in adj[v])
+        offsets[i + 1] = len(targets)
+
+    if directed:
+        in_offsets = array("i", [0]) * (n + 1)
+        for y in targets:
+            in_offsets[y + 1] += 1
+        for i in range(n):
+            in_offsets[i + 1] += in_offsets[i]
+        fill = array("i", in_offsets)
+        in_targets = array("i", [0]) * len(targets)
+        for x in range(n):
+            for y in targets[offsets[x]:offsets[x + 1]]:
+                in_targets[fill[y]] = x
+                fill[y] += 1
+    else:
+        in_offsets, in_targets = offsets, targets
+
+    return {
+        "vertices": vertices,
+        "idx": idx,
+        "offsets": offsets,
+        "targets": targets,
+        "in_offsets": in_offsets,
+        "in_targets": in_targets,
+    }
+
+
+def bfs_direction_optimizing(vertices, edges, start, directed=False,
+                             index=None, alpha=14, beta=24):
+    """
+    Рівневий BFS, що перемикається між кроками:
+      top-down  — перегляд вихідних ребер фронту (як у bfs_protocol);
+      bottom-up — кожна невідвідана вершина шукає сусіда у фронті
+                  (байтова маска фронту) і зупиняється на першому ж.
+    Перехід у bottom-up, коли ребер фронту більше за (ребра невідвіданих)/alpha;
+    назад у top-down, коли фронт менший за n/beta.
+
+    Повертає словник:
+      {
+        "numbers": {v: BFS-номер},
+        "levels": {v: рівень},
+        "edges_traversed": ...,  # скільки ребер переглянуто
+        "steps": [(напрямок, розмір фронту), ...]
+      }
+    Рівні завжди точні. Номери збігаються з bfs_protocol, поки працює
+    top-down; у рівнях, пройдених bottom-up, вершини нумеруються в порядку
+    списку вершин (це теж коректний порядок BFS).
+    """
+    if index is None:
+        index = build_bfs_index(build_adj_list(vertices, edges, directed), directed)
+    V = index["vertices"]
+    offsets, targets = index["offsets"], index["targets"]
+    in_offsets, in_targets = index["in_offsets"], index["in_targets"]
+    n = len(V)
+
+    level = array("i", [-1]) * n
+    s = index["idx"][start]
+    level[s] = 0
+    order = [s]
+    frontier = [s]
+    unvisited = None
+
+    # кількість ребер, які доведеться переглянути з фронту / з невідвіданих
+    m_frontier = offsets[s + 1] - offsets[s]
+    m_unvisited = len(in_targets) - (in_offsets[s + 1] - in_offsets[s])
+
+    top_down = True
+    depth = 0
+    traversed = 0
+    steps = []
+
+    while frontier:
+        depth += 1
+        if top_down and m_frontier > m_unvisited / alpha:
+            top_down = False
+        elif not top_down and len(frontier) < n / beta:
+            top_down = True
+        steps.append(("top-down" if top_down else "bottom-up", len(frontier)))
+
+        nxt = []
+        if top_down:
+            for x in frontier:
+                lo, hi = offsets[x], offsets[x + 1]
+                traversed += hi - lo
+                for y in targets[lo:hi]:
+                    if level[y] < 0:
+                        level[y] = depth
+                        nxt.append(y)
+        else:
+            in_frontier = bytearray(n)
+            for x in frontier:
+                in_frontier[x] = 1
+            if unvisited is None:
+                unvisited = [y for y in range(n) if level[y] < 0]
+            rest = []
+            for y in unvisited:
+                lo = in_offsets[y]
+                for k in range(lo, in_offsets[y + 1]):
+                    if in_frontier[in_targets[k]]:
+                        traversed += k - lo + 1
+                        level[y] = depth
+                        nxt.append(y)
+                        break
+                else:
+                    traversed += in_offsets[y + 1] - lo
+                    rest.append(y)
+            unvisited = rest
+
+        if top_down:
+            unvisited = None
+        order.extend(nxt)
+        m_frontier = sum(offsets[x + 1] - offsets[x] for x in nxt)
+        m_unvisited -= sum(in_offsets[x + 1] - in_offsets[x] for x in nxt)
+        frontier = nxt
+
+    return {
+        "numbers": {V[x]: k for k, x in enumerate(order, start=1)},
+        "levels": {V[x]: level[x] for x in order},
+        "edges_traversed": traversed,
+        "steps": steps,
+    }
+
+
+# -----------------------------------------------------------
+#       ОБХІД З БАГАТЬОХ СТАРТІВ, КОМПОНЕНТИ ЗВ'ЯЗНОСТІ
+# -----------------------------------------------------------
+
+def traversal_forest(vertices, edges, roots=None, directed=False,
+                     method="dfs", sweep=True, adj=None):
+    """
+    Ліс обходу: DFS або BFS по черзі з кожного кореня roots (уже відвідані
+    пропускаються), а при sweep=True — ще й з кожної невідвіданої вершини
+    у порядку vertices. Усі обходи ділять одну множину відвіданих, тож
+    кожна вершина й ребро переглядаються один раз.
+
+    Повертає словник:
+      {
+        "numbers": {v: наскрізний номер обходу},
+        "tree": {v: корінь дерева, що досяг v},
+        "roots": [корені, з яких реально почались дерева]
+      }
+    """
+    if method not in ("dfs", "bfs"):
+        raise ValueError("method має бути 'dfs' або 'bfs'.")
+    if adj is None:
+        adj = build_adj_list(vertices, edges, directed)
+    events = iter_dfs_events if method == "dfs" else iter_bfs_events
+    push = DFS_PUSH if method == "dfs" else BFS_ENQUEUE
+
+    starts = list(roots) if roots is not None else []
+    if sweep:
+        starts.extend(vertices)
+
+    visited = set()
+    numbers = {}
+    tree = {}
+    used_roots = []
+    for r in starts:
+        if r in visited:
+            continue
+        used_roots.append(r)
+        for kind, v, _ in events(vertices, edges, r, directed, adj, visited):
+            if kind == push:
+                numbers[v] = len(numbers) + 1
+                tree[v] = r
+
+    return {"numbers": numbers, "tree": tree, "roots": used_roots}
+
+
+def multi_source_bfs(vertices, edges, sources, directed=False, adj=None):
+    """
+    Один BFS, запущений одночасно з усіх sources (усі на рівні 0).
+    Повертає {"levels": {v: відстань до найближчого джерела},
+              "source": {v: це найближче джерело}}.
+    """
+    if adj is None:
+        adj = build_adj_list(vertices, edges, directed)
+    levels = {}
+    source = {}
+    queue = deque()
+    for s in sources:
+        if s not in levels:
+            levels[s] = 0
+            source[s] = s
+            queue.append(s)
+
+    while queue:
+        x = queue.popleft()
+        for y in adj[x]:
+            if y not in levels:
+                levels[y] = levels[x] + 1
+                source[y] = source[x]
+                queue.append(y)
+
+    return {"levels": levels, "source": source}
+
+
+def connected_components(vertices, edges, directed=False, adj=None):
+    """
+    Мітки компонент зв'язності {v: номер компоненти} (0, 1, ... у порядку
+    першої вершини). Для орієнтованого графа — слабка зв'язність.
+    """
+    if adj is None or directed:
+        adj = build_adj_list(vertices, edges, directed=False)
+    forest = traversal_forest(vertices, edges, method="bfs", adj=adj)
+    label = {r: i for i, r in enumerate(forest["roots"])}
+    return {v: label[r] for v, r in forest["tree"].items()}
+
+
+def strongly_connected_components(vertices, edges, adj=None):
+    """
+    Ітеративний алгоритм Тарʼяна для орієнтованого графа (без рекурсії,
+    тож глибина графа не обмежена стеком Python).
+    Повертає список компонент у зворотному топологічному порядку
+    (компоненти-"стоки" першими); кожна компонента — список вершин.
+    """
+    if adj is None:
+        adj = build_adj_list(vertices, edges, directed=True)
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+
+    for root in vertices:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adj[root]))]
+
+        while work:
+            v, cursor = work[-1]
+            for w in cursor:
+                if w not in index:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack.add(w)
+                    work.append((w, iter(adj[w])))
+                    break
+                if w in on_stack and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == index[v]:
+                    comp = []
+                    while True:
+                        w = stack.pop()
+                        on_stack.discard(w)
+                        comp.append(w)
+                        if w == v:
+                            break
+                    components.append(comp)
+
+    return components
+
+
+def reachability_from_sources(vertices, edges, sources, directed=True, adj=None):
+    """
+    Для всіх джерел одразу: {v: маска}, де біт i встановлено, якщо
+    sources[i] досягає v. Маски поширюються по конденсації графа
+    (компоненти сильної зв'язності) у топологічному порядку — один прохід
+    O(V + E) операцій над цілими-бітсетами замість len(sources) обходів.
+    """
+    if adj is None:
+        adj = build_adj_list(vertices, edges, directed)
+    components = strongly_connected_components(vertices, edges, adj)
+    comp_of = {}
+    for c, comp in enumerate(components):
+        for v in comp:
+            comp_of[v] = c
+
+    mask = [0] * len(components)
+    for i, s in enumerate(sources):
+        mask[comp_of[s]] |= 1 << i
+
+    # Тарʼян видає компоненти у зворотному топологічному порядку
+    for c in range(len(components) - 1, -1, -1):
+        m = mask[c]
+        if not m:
+            continue
+        for v in components[c]:
+            for w in adj[v]:
+                d = comp_of[w]
+                if d != c:
+                    mask[d] |= m
+
+    return {v: mask[comp_of[v]] for v in vertices}
@@ -0,0 +1,86 @@
+# ============================================================
+#                 ЗАВДАННЯ 2 — TRIE (Homework)
+# ============================================================
+
+class TrieNode:
+    __slots__ = ("children", "is_end", "end_count")
+
+    def __init__(self):
+        self.children = {}
+        self.is_end = False
+        self.end_count = 0
+
+
+class Trie:
+    def __init__(self):
+        self.root = TrieNode()
+        self._total_chars = 0
+        self._words = []
+
+    def put(self, word: str, value=None):
+        if not isinstance(word, str):
+            raise TypeError("word має бути рядком")
+        if word == "":
+            raise ValueError("Порожнє слово заборонено")
+
+        node = self.root
+        for ch in word:
+            if ch not in node.children:
+                node.children[ch] = TrieNode()
+            node = node.children[ch]
+
+        if not node.is_end:
+            node.is_end = True
+        node.end_count += 1
+
+        self._total_chars += len(word)
+        self._words.append(word)
+
+
+class Homework(Trie):
+    def count_words_with_suffix(self, pattern) -> int:
+        if not isinstance(pattern, str):
+            raise TypeError("pattern має бути рядком")
+        if pattern == "":
+            return len(self._words)
+        return sum(1 for w in self._words if w.endswith(pattern))
+
+    def has_prefix(self, prefix) -> bool:
+        if not isinstance(prefix, str):
+            raise TypeError("prefix має бути рядком")
+        if prefix == "":
+            return len(self._words) > 0
+
+        node = self.root
+        for ch in prefix:
+            if ch not in node.children:
+                return False
+            node = node.children[ch]
+        return True
+
+    def exists_with_mismatch(self, word, k) -> bool:
+        if not isinstance(word, str):
+            raise TypeError("word має бути рядком")
+        if not isinstance(k, int):
+            raise TypeError("k має бути цілим")
+        if k < 0:
+            raise ValueError("k має бути >= 0")
+        if word == "":
+            return False
+
+        def dfs(node: TrieNode, i: int, mism: int) -> bool:
+            if mism > k:
+                return False
+            if i == len(word):
+                return node.is_end
+            ch = word[i]
+            for nxt_ch, nxt_node in node.children.items():
+                new_mism = mism + (0 if nxt_ch == ch else 1)
+                if dfs(nxt_node, i + 1, new_mism):
+                    return True
+            return False
+
+        return dfs(self.root, 0, 0)
+
+    def total_characters(self) -> int:
+        return self._total_chars
@@ -0,0 +1,21 @@
+import pytest
+
+
+def make_random_graph(rnd, n, m, weight=None, names=False):
+    """
+    Випадковий граф: n вершин (0..n-1 або "v0".."v{n-1}") і m ребер з
+    довільними кінцями, тож петлі й паралельні ребра теж трапляються.
+    weight(rnd) дає вагу ребра (u, v, w); weight=None — ребра (u, v).
+    """
+    vertices = [f"v{i}" for i in range(n)] if names else list(range(n))
+    edges = []
+    for _ in range(m):
+        u, v = rnd.choice(vertices), rnd.choice(vertices)
+        edges.append((u, v) if weight is None else (u, v, weight(rnd)))
+    return vertices, edges
+
+
+@pytest.fixture
+def random_graph():
+    """Фабрика випадкових графів make_random_graph."""
+    return make_random_graph
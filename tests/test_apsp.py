@@ -0,0 +1,207 @@
+import math
+import os
+import random
+
+import pytest
+
+import mlta.apsp
+from mlta.shortest_paths import dijkstra_distances, floyd_warshall
+
+np = pytest.importorskip("numpy")
+
+from mlta.apsp import (  # noqa: E402
+    all_pairs_dijkstra,
+    all_pairs_floyd,
+    all_pairs_floyd_memmap,
+    floyd_warshall_vectorized,
+    initial_matrices,
+    matrix_path,
+    open_distance_matrix,
+)
+
+
+def bounded_path(P, i, j):
+    """Як matrix_path, але цикл попередників дає AssertionError, а не зависання."""
+    path = [j]
+    while j != i:
+        assert len(path) <= len(P), "попередники замкнулися в цикл"
+        j = int(P[i, j])
+        path.append(j)
+    path.reverse()
+    return path
+
+
+def zero_or_small(rnd):
+    """Кожне друге ребро — нульової ваги."""
+    return 0 if rnd.random() < 0.5 else rnd.randint(1, 5)
+
+
+def edge_weights(edges):
+    best = {}
+    for u, v, w in edges:
+        best[(u, v)] = min(w, best.get((u, v), math.inf))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_graphs_match_dijkstra(tmp_path, random_graph, seed):
+    rnd = random.Random(seed)
+    vertices, edges = random_graph(rnd, rnd.randint(2, 40), rnd.randint(0, 120),
+                                   zero_or_small)
+    vec = all_pairs_floyd(vertices, edges, method="vectorized", predecessors=True)
+    blk = all_pairs_floyd(vertices, edges, method="blocked", predecessors=True, block=7)
+    np.testing.assert_array_equal(vec["dist"], blk["dist"])
+    mm = all_pairs_floyd_memmap(str(tmp_path / "d.npy"), vertices, edges, block=6)
+    np.testing.assert_array_equal(mm["dist"], vec["dist"])
+    assert all_pairs_dijkstra(vertices, edges, processes=1) == vec["dist"].tolist()
+
+    weights = edge_weights(edges)
+    for res in (vec, blk):
+        D, P = res["dist"], res["pred"]
+        for i in vertices:
+            ref = dijkstra_distances(i, vertices, edges)
+            for j in vertices:
+                assert D[i, j] == ref[j]
+                if i == j or D[i, j] == math.inf:
+                    continue
+                # нульові ребра не повинні замикати попередників у цикл
+                path = bounded_path(P, i, j)
+                assert path == matrix_path(P, i, j)
+                assert path[0] == i and path[-1] == j
+                assert len(path) == len(set(path))
+                assert sum(weights[e] for e in zip(path, path[1:])) == D[i, j]
+
+
+@pytest.mark.parametrize("method", ["vectorized", "blocked"])
+def test_floyd_edge_cases(method):
+    empty = all_pairs_floyd([], [], method=method, predecessors=True)
+    assert empty["dist"].shape == empty["pred"].shape == (0, 0)
+
+    # мітки-числа не в порядку номерів, цикл нульової ваги, недосяжні пари
+    vertices = [30, 10, 20]
+    res = all_pairs_floyd(vertices, [(10, 30, 0), (30, 10, 0), (30, 20, 3)],
+                          method=method, predecessors=True, block=1)
+    assert res["vertices"] == vertices
+    assert res["dist"].tolist() == [[0, 0, 3], [0, 0, 3], [math.inf, math.inf, 0]]
+    P = res["pred"]
+    assert matrix_path(P, 1, 2) == [1, 0, 2]
+    assert matrix_path(P, 2, 1) == [] and matrix_path(P, 0, 0) == [0]
+
+
+def test_parallel_edges_and_self_loops_match_list_floyd():
+    vertices = ["a", "b"]
+    for edges in ([("a", "b", 2), ("a", "b", 5), ("b", "b", 3)],
+                  [("a", "b", 5), ("a", "b", 2)],
+                  [("a", "b", 2), ("b", "b", -1)]):
+        D, _ = floyd_warshall(vertices, edges)
+        for method in ("vectorized", "blocked"):
+            res = all_pairs_floyd(vertices, edges, method=method)
+            assert res["dist"].tolist() == D
+
+
+@pytest.mark.parametrize("edges, expected", [
+    # з паралельних ребер — найлегше, незалежно від порядку
+    ([("a", "b", 5), ("a", "b", 2)], [[0, 2], [math.inf, 0]]),
+    ([("a", "b", 2), ("a", "b", 5)], [[0, 2], [math.inf, 0]]),
+    # додатна петля не змінює нульову діагональ
+    ([("a", "b", 2), ("b", "b", 3)], [[0, 2], [math.inf, 0]]),
+    ([("a", "a", 0), ("b", "a", 4)], [[0, math.inf], [4, 0]]),
+])
+def test_list_floyd_parallel_edges_and_positive_loops(edges, expected):
+    vertices = ["a", "b"]
+    D, _ = floyd_warshall(vertices, edges)
+    assert D == expected
+    V, _ = floyd_warshall_vectorized(initial_matrices(vertices, edges)[0])
+    assert V.tolist() == D
+
+
+def test_list_floyd_negative_loop_matches_vectorized():
+    vertices = ["a", "b"]
+    edges = [("a", "b", 2), ("b", "b", -1)]
+    D, _ = floyd_warshall(vertices, edges)
+    V, _ = floyd_warshall_vectorized(initial_matrices(vertices, edges)[0])
+    assert V.tolist() == D
+    # від'ємна петля лишається на діагоналі
+    assert D[1][1] < 0
+
+
+@pytest.mark.parametrize("block", [1, 2, 5, 8])
+def test_memmap_stripes(tmp_path, block):
+    # рядки ребер у різних смугах, паралельні ребра й петлі на межах смуг
+    vertices = list("abcde")
+    edges = [("e", "a", 1), ("a", "b", 4), ("a", "b", 2), ("b", "b", 3), ("d", "d", -1),
+             ("c", "e", 0), ("b", "c", 7)]
+    expected, _ = floyd_warshall_vectorized(initial_matrices(vertices, edges)[0])
+    path = str(tmp_path / "d.npy")
+    res = all_pairs_floyd_memmap(path, vertices, edges, block=block)
+    np.testing.assert_array_equal(res["dist"], expected)
+    opened = open_distance_matrix(path)
+    assert opened["vertices"] == vertices
+    np.testing.assert_array_equal(opened["dist"], expected)
+
+    empty = all_pairs_floyd_memmap(path, [], [], block=block)
+    assert empty["dist"].shape == (0, 0)
+
+
+def test_memmap_float32_precision(tmp_path):
+    vertices = ["a", "b", "c"]
+    edges = [("a", "b", 2**24), ("b", "c", 1)]
+    exact = all_pairs_floyd_memmap(str(tmp_path / "d64.npy"), vertices, edges)
+    assert exact["dist"][0, 2] == 2**24 + 1
+    rounded = all_pairs_floyd_memmap(str(tmp_path / "d32.npy"), vertices, edges,
+                                     dtype="float32")
+    assert rounded["dist"].dtype == np.float32
+    # 2**24 + 1 не представне у float32
+    assert int(rounded["dist"][0, 2]) == 2**24
+
+
+JOHNSON_VERTICES = [30, 10, 20, 40]  # 40 недосяжна
+JOHNSON_EDGES = [(30, 10, 4), (10, 20, -3), (30, 20, 2), (20, 30, 1), (10, 20, 5)]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_all_pairs_dijkstra_negative_edges(monkeypatch, processes):
+    # поріг і розмір задачі знижено, щоб пул отримав кілька задач
+    monkeypatch.setattr(mlta.apsp, "PARALLEL_MIN_VERTICES", 0)
+    monkeypatch.setattr(mlta.apsp, "SOURCES_PER_TASK", 1)
+    expected, _ = floyd_warshall(JOHNSON_VERTICES, JOHNSON_EDGES)
+    D = all_pairs_dijkstra(JOHNSON_VERTICES, JOHNSON_EDGES, processes=processes)
+    assert D == expected
+    assert D[0] == [0, 4, 1, math.inf] and D[3] == [math.inf] * 3 + [0]
+
+    positive = [(u, v, abs(w)) for u, v, w in JOHNSON_EDGES]
+    both, _ = floyd_warshall(JOHNSON_VERTICES, positive + [(v, u, w) for u, v, w in positive])
+    assert all_pairs_dijkstra(JOHNSON_VERTICES, positive, directed=False,
+                              processes=processes) == both
+
+
+def test_all_pairs_dijkstra_negative_cycle():
+    edges = JOHNSON_EDGES + [(20, 10, 2)]  # 10 → 20 → 10: -3 + 2
+    with pytest.raises(ValueError):
+        all_pairs_dijkstra(JOHNSON_VERTICES, edges, processes=1)
+
+
+def test_all_pairs_dijkstra_rejects_negative_undirected_edge():
+    with pytest.raises(ValueError):
+        all_pairs_dijkstra(["a", "b"], [("a", "b", -1)], directed=False, processes=1)
+
+
+def test_memmap_vertex_names(tmp_path):
+    path = str(tmp_path / "d.npy")
+    for vertices in ([30, -1, 20], ["a", "b"], ["a", 1, 2.5], []):
+        all_pairs_floyd_memmap(path, vertices, [])
+        got = open_distance_matrix(path)["vertices"]
+        if all(type(v) is int for v in vertices):
+            assert got == vertices and all(type(v) is int for v in got)
+        else:
+            assert got == [str(v) for v in vertices]
+
+    # файл назв без заголовка (і без нього взагалі) теж читається
+    with open(path + ".vertices", "w", encoding="utf-8") as f:
+        f.write("1\n2\n")
+    assert open_distance_matrix(path)["vertices"] == ["1", "2"]
+    os.remove(path + ".vertices")
+    assert open_distance_matrix(path)["vertices"] is None
+
+    with pytest.raises(ValueError):
+        all_pairs_floyd_memmap(path, ["a\nb"], [])
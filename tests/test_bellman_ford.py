@@ -0,0 +1,97 @@
+import math
+import random
+
+import pytest
+
+from mlta.shortest_paths import ShortestPathEngine, bellman_ford, dijkstra_distances
+
+
+def reference(start, vertices, edges):
+    """Наївний Беллман–Форд: (dist, чи досяжний від'ємний цикл)."""
+    dist = {v: math.inf for v in vertices}
+    dist[start] = 0
+    for _ in range(len(vertices)):
+        changed = False
+        for u, v, w in edges:
+            if dist[u] + w < dist[v]:
+                dist[v] = dist[u] + w
+                changed = True
+        if not changed:
+            return dist, False
+    return dist, True
+
+
+def signed_graph(random_graph, rnd):
+    n = rnd.randint(1, 12)
+    return random_graph(rnd, n, rnd.randint(0, 3 * n), lambda r: r.randint(-4, 9))
+
+
+def assert_negative_cycle(cycle, edges):
+    best = {}
+    for u, v, w in edges:
+        best[(u, v)] = min(w, best.get((u, v), math.inf))
+    assert len(cycle) == len(set(cycle))
+    closed = list(zip(cycle, cycle[1:] + cycle[:1]))
+    assert all(e in best for e in closed)
+    assert sum(best[e] for e in closed) < 0
+
+
+@pytest.mark.parametrize("method", ["spfa", "passes"])
+def test_random_graphs(random_graph, method):
+    rnd = random.Random(24)
+    found = 0
+    for _ in range(400):
+        vertices, edges = signed_graph(random_graph, rnd)
+        start = rnd.choice(vertices)
+        dist, has_cycle = reference(start, vertices, edges)
+        res = bellman_ford(start, vertices, edges, method=method)
+        if has_cycle:
+            found += 1
+            assert res["negative_cycle"] is not None
+            assert_negative_cycle(res["negative_cycle"], edges)
+        else:
+            assert res["negative_cycle"] is None
+            assert res["dist"] == dist
+    assert found > 20  # вибірка справді містить графи з від'ємними циклами
+
+
+@pytest.mark.parametrize("method", ["spfa", "passes"])
+def test_unreachable_negative_cycle_is_ignored(method):
+    vertices = ["s", "a", "x", "y"]
+    edges = [("s", "a", 2), ("x", "y", -3), ("y", "x", 1)]
+    res = bellman_ford("s", vertices, edges, method=method)
+    assert res["negative_cycle"] is None
+    assert res["dist"] == {"s": 0, "a": 2, "x": math.inf, "y": math.inf}
+
+
+def test_self_loop_cycle():
+    res = bellman_ford("a", ["a", "b"], [("a", "b", 1), ("b", "b", -1)])
+    assert res["negative_cycle"] == ["b"]
+
+
+EDGE_CASES = {
+    "zero_weight_cycle": (["a", "b", "c"], [("a", "b", 0), ("b", "a", 0), ("b", "c", 1)]),
+    "unreachable": (["a", "b", "c"], [("a", "b", 3), ("c", "b", -1)]),
+    "int_labels": ([30, 10, 20], [(30, 10, 4), (10, 20, -2), (30, 20, 3)]),
+    "no_edges": (["a", "b"], []),
+}
+
+
+@pytest.mark.parametrize("case", sorted(EDGE_CASES))
+@pytest.mark.parametrize("method", ["spfa", "passes"])
+def test_edge_cases(case, method):
+    vertices, edges = EDGE_CASES[case]
+    start = vertices[0]
+    res = ShortestPathEngine(vertices, edges).bellman_ford(start, method)
+    assert res["negative_cycle"] is None
+    assert res["dist"] == reference(start, vertices, edges)[0]
+    if all(w >= 0 for _, _, w in edges):
+        assert res["dist"] == dijkstra_distances(start, vertices, edges)
+
+
+def test_bad_arguments():
+    engine = ShortestPathEngine(["a", "b"], [("a", "b", 1)])
+    with pytest.raises(ValueError):
+        engine.bellman_ford("x")
+    with pytest.raises(ValueError):
+        engine.bellman_ford("a", "dijkstra")
@@ -0,0 +1,99 @@
+import random
+from array import array
+
+import pytest
+
+from mlta.binfmt import load_binary, save_binary, save_csr, save_edge_graph
+from mlta.loader import EdgeListGraph
+from mlta.sparse import CSRAdjacency
+
+
+def csr_state(csr):
+    return (list(csr.vertices), list(csr.offsets), list(csr.targets), list(csr.counts),
+            csr.directed)
+
+
+def labelled(rnd, n, kind):
+    if kind == "names":
+        return [f"v{i}" for i in range(n)]
+    if kind == "ints":
+        return rnd.sample(range(-50, 1000), n)   # цілі, але не 0..n-1
+    return list(range(n))
+
+
+@pytest.mark.parametrize("kind", ["names", "ints", "identity"])
+def test_csr_round_trip(tmp_path, random_graph, kind):
+    rnd = random.Random(5)
+    for k in range(30):
+        n = rnd.randint(0, 15)
+        _, edges = random_graph(rnd, n, rnd.randint(0, 3 * n) if n else 0)
+        vertices = labelled(rnd, n, kind)
+        edges = [(vertices[u], vertices[v]) for u, v in edges]
+        csr = CSRAdjacency.from_edges(vertices, edges, directed=k % 2 == 0)
+        path = str(tmp_path / f"g{k}.mltag")
+        save_csr(path, csr)
+        with load_binary(path) as g:
+            assert g.vertices == vertices
+            assert all(type(a) is type(b) for a, b in zip(g.vertices, vertices))
+            loaded = g.to_csr()
+            assert csr_state(loaded) == csr_state(csr)
+            assert loaded.to_dense() == csr.to_dense()
+
+
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("typecode", ["q", "d"])
+def test_edge_graph_round_trip(tmp_path, directed, typecode):
+    vertices = [30, 10, 20, 40]  # 40 ізольована
+    # паралельні ребра з різними вагами, петля, від'ємна вага
+    pairs = [(1, 0), (0, 2), (1, 0), (2, 2), (0, 1)]
+    weights = array(typecode, [5, -3, 2, 7, 0] if typecode == "q" else [0.5, -3.25, 2, 7, 0])
+    graph = EdgeListGraph(vertices, array("i", [u for u, _ in pairs]),
+                          array("i", [v for _, v in pairs]), weights, directed)
+    path = str(tmp_path / "e.mltag")
+    save_edge_graph(path, graph)
+
+    with load_binary(path) as g:
+        assert g.vertices == vertices and g.directed == directed
+        assert not g.sorted_rows
+        # рядки у порядку появи ребер, з повторами і своїми вагами
+        rows = {}
+        for (u, v), w in zip(pairs, weights):
+            rows.setdefault(u, []).append((v, w))
+            if not directed:
+                rows.setdefault(v, []).append((u, w))
+        for i in range(len(vertices)):
+            lo, hi = g.offsets[i], g.offsets[i + 1]
+            assert list(zip(g.targets[lo:hi], g.weights[lo:hi])) == rows.get(i, [])
+            assert all(type(w) is (int if typecode == "q" else float)
+                       for w in g.weights[lo:hi])
+        assert csr_state(g.to_csr()) == csr_state(graph.to_csr())
+
+
+def test_empty_graph(tmp_path):
+    path = str(tmp_path / "empty.mltag")
+    save_csr(path, CSRAdjacency.from_edges([], []))
+    with load_binary(path) as g:
+        assert (g.n, g.nnz, g.vertices) == (0, 0, [])
+        assert csr_state(g.to_csr()) == ([], [0], [], [], False)
+
+    save_edge_graph(path, EdgeListGraph([], array("i"), array("i"), array("q")))
+    with load_binary(path) as g:
+        assert (g.n, g.nnz, g.vertices, list(g.weights)) == (0, 0, [], [])
+        assert csr_state(g.to_csr()) == ([], [0], [], [], False)
+
+
+def test_mixed_labels_come_back_as_strings(tmp_path):
+    path = str(tmp_path / "mixed.mltag")
+    save_csr(path, CSRAdjacency.from_edges(["a", 1, 2.5], [("a", 1)]))
+    with load_binary(path) as g:
+        assert g.vertices == ["a", "1", "2.5"]
+
+
+def test_rejects_bad_input(tmp_path):
+    path = str(tmp_path / "bad.mltag")
+    with pytest.raises(ValueError):
+        save_binary(path, [0, 1], [0], vertices=["a\nb"])
+    with open(path, "wb") as f:
+        f.write(b"\0" * 64)
+    with pytest.raises(ValueError):
+        load_binary(path)
@@ -0,0 +1,97 @@
+import math
+import random
+
+import pytest
+
+from mlta.ch import ContractionHierarchy
+from mlta.shortest_paths import ShortestPathEngine
+
+
+def int_or_float(rnd):
+    return rnd.choice((rnd.randint(0, 9), rnd.uniform(0, 5)))
+
+
+def path_cost(path, edges, directed):
+    best = {}
+    for u, v, w in edges:
+        for a, b in ((u, v),) if directed else ((u, v), (v, u)):
+            best[(a, b)] = min(w, best.get((a, b), math.inf))
+    return sum(best[e] for e in zip(path, path[1:]))
+
+
+def assert_same(ch, engine, vertices, edges, directed, rnd):
+    for _ in range(40):
+        s, t = rnd.choice(vertices), rnd.choice(vertices)
+        ref = engine.query(s, t)
+        res = ch.query(s, t)
+        assert res["dist"] == pytest.approx(ref["dist"])
+        assert ch.distance(s, t) == pytest.approx(ref["dist"])
+        if ref["dist"] == math.inf:
+            assert res["path"] == []
+        else:
+            assert res["path"][0] == s and res["path"][-1] == t
+            assert path_cost(res["path"], edges, directed) == pytest.approx(ref["dist"])
+
+
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("names", [True, False])
+def test_matches_engine_including_after_save_load(tmp_path, random_graph, directed, names):
+    rnd = random.Random(25 + 2 * directed + names)
+    for k in range(25):
+        n = rnd.randint(1, 30)
+        vertices, edges = random_graph(rnd, n, rnd.randint(0, 4 * n), int_or_float, names)
+        engine = ShortestPathEngine(vertices, edges, directed=directed)
+        ch = ContractionHierarchy.build(vertices, edges, directed=directed)
+        assert_same(ch, engine, vertices, edges, directed, rnd)
+
+        path = tmp_path / f"g{k}.ch"
+        ch.save(str(path))
+        loaded = ContractionHierarchy.load(str(path))
+        assert loaded.vertices == vertices
+        assert loaded.directed == directed and loaded.integral == ch.integral
+        assert_same(loaded, engine, vertices, edges, directed, rnd)
+
+
+def test_integral_distances_stay_int(tmp_path):
+    ch = ContractionHierarchy.build()  # граф ЛР №3
+    path = tmp_path / "lab3.ch"
+    ch.save(str(path))
+    for h in (ch, ContractionHierarchy.load(str(path))):
+        res = h.query("a", "d")
+        assert res["dist"] == 11 and isinstance(res["dist"], int)
+        # a-c-b-f-d і a-e-f-d мають однакову довжину 11
+        assert res["path"] in (["a", "c", "b", "f", "d"], ["a", "e", "f", "d"])
+
+
+def test_int_names_survive_save_load(tmp_path):
+    ch = ContractionHierarchy.build([10, 20, 30], [(10, 20, 1), (20, 30, 2)])
+    path = tmp_path / "ints.ch"
+    ch.save(str(path))
+    loaded = ContractionHierarchy.load(str(path))
+    assert loaded.vertices == [10, 20, 30]
+    assert loaded.query(10, 30)["path"] == [10, 20, 30]
+    assert loaded.distance(10, 30) == 3
+    # рядкові назви, схожі на числа, лишаються рядками
+    ContractionHierarchy.build(["1", "2"], [("1", "2", 1)]).save(str(path))
+    assert ContractionHierarchy.load(str(path)).vertices == ["1", "2"]
+
+
+def test_unknown_vertex_rejected():
+    ch = ContractionHierarchy.build([10, 20], [(10, 20, 1)])
+    for source, target in ((10, 99), ("10", 20)):
+        with pytest.raises(ValueError):
+            ch.query(source, target)
+        with pytest.raises(ValueError):
+            ch.distance(source, target)
+
+
+def test_negative_weight_rejected():
+    with pytest.raises(ValueError):
+        ContractionHierarchy.build(["a", "b"], [("a", "b", -1)])
+
+
+def test_load_rejects_foreign_file(tmp_path):
+    path = tmp_path / "bad.ch"
+    path.write_bytes(b"not a hierarchy")
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(str(path))
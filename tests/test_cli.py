@@ -0,0 +1,162 @@
+import io
+import json
+
+import pytest
+
+from mlta.cli import main, run_batch
+
+LAB3 = {"edges": [["a", "b", 6], ["a", "c", 2], ["c", "b", 3], ["b", "d", 4]]}
+
+
+def run(tmp_path, task, instances, with_protocol=False):
+    path = tmp_path / "in.jsonl"
+    path.write_text("".join(json.dumps(inst) + "\n" for inst in instances), encoding="utf-8")
+    out = io.StringIO()
+    run_batch(task, [str(path)], out, with_protocol)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+@pytest.fixture
+def graph_file(tmp_path):
+    path = tmp_path / "g.txt"
+    path.write_text("".join(f"{u} {v} {w}\n" for u, v, w in LAB3["edges"]), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("with_protocol", [False, True])
+def test_dijkstra_target_schema_does_not_depend_on_protocol(tmp_path, graph_file,
+                                                             with_protocol):
+    instances = [
+        dict(LAB3, source="a"),
+        dict(LAB3, source="a", target="d"),
+        {"graph": graph_file, "source": "a"},
+        {"graph": graph_file, "source": "a", "target": "d"},
+        dict(LAB3, source="d", target="a"),
+    ]
+    records = run(tmp_path, "dijkstra", instances, with_protocol)
+    results = [r["result"] for r in records]
+    all_dist = {"a": 0, "b": 5, "c": 2, "d": 9}
+    assert results[0]["dist"] == results[2]["dist"] == all_dist
+    for res in results[1], results[3]:
+        assert res["dist"] == 9 and res["path"] == ["a", "c", "b", "d"]
+    assert results[4]["dist"] is None and results[4]["path"] == []
+    for res in results:
+        assert ("protocol" in res) == with_protocol
+
+
+@pytest.mark.parametrize("with_protocol", [False, True])
+def test_dijkstra_bad_input_is_a_value_error(tmp_path, graph_file, with_protocol):
+    instances = [
+        dict(LAB3, source="z"),
+        dict(LAB3, source="a", target="z"),
+        {"graph": graph_file, "source": "z"},
+        {"edges": [["a", "b", -1]], "source": "a"},
+    ]
+    records = run(tmp_path, "dijkstra", instances, with_protocol)
+    assert all(r["error"].startswith("ValueError:") for r in records)
+
+
+TREE = {"edges": [["a", "b"], ["a", "c"], ["b", "d"]]}
+
+
+@pytest.mark.parametrize("with_protocol", [False, True])
+def test_traversals(tmp_path, with_protocol):
+    dfs, bfs, bfs_c = (r["result"] for r in run(tmp_path, "auto", [
+        dict(TREE, task="dfs"),
+        dict(TREE, task="bfs", start="a"),
+        dict(TREE, task="bfs", start="c", directed=True),
+    ], with_protocol))
+    assert dfs["numbering"] == {"a": 1, "b": 2, "d": 3, "c": 4}
+    assert bfs["numbering"] == {"a": 1, "b": 2, "c": 3, "d": 4}
+    assert bfs_c["numbering"] == {"c": 1}
+    if with_protocol:
+        assert dfs["protocol"][:3] == [["a", 1, ["a"]], ["b", 2, ["a", "b"]],
+                                       ["d", 3, ["a", "b", "d"]]]
+        assert bfs["protocol"][-1] == ["c", "-", ["d"]]
+    else:
+        assert "protocol" not in dfs and "protocol" not in bfs
+
+
+@pytest.mark.parametrize("task", ["dfs", "bfs"])
+def test_traversal_start_is_checked(tmp_path, task):
+    records = run(tmp_path, task, [{"edges": []}, dict(TREE, start="z"),
+                                   {"edges": [], "vertices": ["x"], "start": "x"}])
+    assert records[0]["error"] == ('ValueError: Граф порожній, а стартову вершину '
+                                   '("start") не задано.')
+    assert records[1]["error"] == "ValueError: Стартової вершини 'z' немає в графі."
+    assert records[2]["result"]["numbering"] == {"x": 1}
+
+
+def test_all_pairs_tasks(tmp_path):
+    edges = [["a", "b", 2], ["b", "c", -1], ["c", "a", 4]]
+    floyd, johnson = (r["result"] for r in run(tmp_path, "auto", [
+        {"task": "floyd", "edges": [e for e in edges if e[2] > 0]},
+        {"task": "johnson", "edges": edges, "processes": 1},
+    ]))
+    assert floyd == {"vertices": ["a", "b", "c"], "matrix": [[0, 2, None], [None, 0, None],
+                                                             [4, 6, 0]]}
+    assert johnson == {"vertices": ["a", "b", "c"], "matrix": [[0, 2, 1], [3, 0, -1],
+                                                               [4, 6, 0]]}
+
+
+def test_lab4_lab5_tasks(tmp_path):
+    coins, powers, rod, printing = (r["result"] for r in run(tmp_path, "auto", [
+        {"task": "coins", "n": 90},
+        {"task": "powers", "n": 21},
+        {"task": "rod", "length": 5, "prices": [2, 5, 7, 8, 10], "method": "memo"},
+        {"task": "print", "jobs": [["M1", 30, 1, 120], ["M2", 20, 3, 60], ["M3", 10, 2, 30]],
+         "max_volume": 60, "max_items": 3},
+    ]))
+    assert coins == {"result": "50 коп — 1 шт.\n25 коп — 1 шт.\n10 коп — 1 шт.\n5 коп — 1 шт."}
+    assert powers == {"result": "16+4+1"}
+    assert rod == {"gross_profit": 12, "net_profit": 2, "pieces": [1, 2, 2], "cuts": 2}
+    assert printing["print_order"] == ["M1", "M3", "M2"]
+    assert printing["total_time"] == 180
+    assert [b["jobs"] for b in printing["batches"]] == [["M1", "M3"], ["M2"]]
+
+
+@pytest.mark.parametrize("with_protocol", [False, True])
+def test_lab6_tasks(tmp_path, with_protocol):
+    flow, logistics, trie = (r["result"] for r in run(tmp_path, "auto", [
+        {"task": "maxflow", "edges": [["s", "a", 3], ["a", "t", 2], ["s", "t", 1]],
+         "source": "s", "sink": "t"},
+        {"task": "maxflow", "logistics": True},
+        {"task": "trie", "words": ["apple", "banana"],
+         "queries": [["has_prefix", "app"], ["count_words_with_suffix", "na"],
+                     ["exists_with_mismatch", "bonono", 2], ["total_characters"]]},
+    ], with_protocol))
+    assert flow["max_flow"] == 3
+    assert logistics["max_flow"] == 115
+    assert sum(logistics["terminal_totals"].values()) == 115
+    assert ("steps" in flow) == ("steps" in logistics) == with_protocol
+    assert trie == {"answers": [True, 1, False, 11]}
+
+
+def test_errors_are_reported_per_line(tmp_path, capsys):
+    path = tmp_path / "in.jsonl"
+    path.write_text('{"task": "trie", "words": ["a"], "queries": [["delete", "a"]]}\n'
+                    '# коментар\n\n'
+                    '{"task": "nope"}\n'
+                    'not json\n'
+                    '{"task": "coins", "n": 5, "id": 7}\n', encoding="utf-8")
+    assert main(["auto", str(path)]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["input"] for r in records] == [f"{path}:{i}" for i in (1, 4, 5, 6)]
+    assert records[0]["error"] == "ValueError: Невідомий запит до Trie: delete"
+    assert records[1]["error"] == "ValueError: Невідома задача: nope"
+    assert records[2]["error"].startswith("JSONDecodeError:")
+    assert records[3]["id"] == 7 and records[3]["result"] == {"result": "5 коп — 1 шт."}
+
+
+@pytest.mark.parametrize("edges", [
+    [["a", "b", 2], ["b", "c", 3.5], ["a", "c", 9]],       # мішані int і float
+    [["a", "b", 2.0], ["b", "c", 0.5], ["c", "a", -1]],
+    [["a", "b", 1], ["b", "c", 2], ["a", "c", 4]],
+])
+def test_floyd_matrix_does_not_depend_on_protocol(tmp_path, edges):
+    plain, = run(tmp_path, "floyd", [{"edges": edges}])
+    with_prot, = run(tmp_path, "floyd", [{"edges": edges}], with_protocol=True)
+    assert plain["result"]["matrix"] == with_prot["result"]["matrix"]
+    for row in plain["result"]["matrix"]:
+        for x in row:
+            assert x is None or not (isinstance(x, float) and x.is_integer())
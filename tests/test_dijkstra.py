@@ -0,0 +1,147 @@
+import math
+import random
+
+import pytest
+
+from mlta.protocol import CountingSink, NullSink, RingSink
+from mlta.samples import EDGES_WEIGHTED, VERTICES_WEIGHTED
+from mlta.shortest_paths import (
+    ShortestPathEngine,
+    build_weighted_index,
+    dijkstra,
+    dijkstra_distances,
+)
+
+
+def baseline_dijkstra(start, vertices, edges):
+    """dijkstra з MLTA_lab3.py до переписування (O(V^2 + VE)), дослівно."""
+    dist = {v: math.inf for v in vertices}
+    dist[start] = 0
+    visited = set()
+    protocol = []
+
+    while len(visited) < len(vertices):
+        # вибрати найближчу вершину
+        u = None
+        min_dist = math.inf
+        for v in vertices:
+            if v not in visited and dist[v] < min_dist:
+                min_dist = dist[v]
+                u = v
+
+        if u is None:
+            break
+
+        visited.add(u)
+        protocol.append(f"Вибрана вершина: {u}, dist={dist[u]}, S={visited.copy()}")
+
+        # релаксація
+        for (x, y, w) in edges:
+            if x == u:
+                if dist[y] > dist[u] + w:
+                    old = dist[y]
+                    dist[y] = dist[u] + w
+                    protocol.append(f"Оновлення: dist[{y}] = {old} → {dist[y]}")
+
+    return dist, protocol
+
+
+def test_lab3_protocol_matches_baseline():
+    for start in VERTICES_WEIGHTED:
+        assert dijkstra(start) == baseline_dijkstra(start, VERTICES_WEIGHTED, EDGES_WEIGHTED)
+
+
+def test_lab3_distances():
+    dist, _ = dijkstra("a")
+    assert dist == {"a": 0, "b": 5, "c": 2, "d": 11, "e": 8, "f": 9}
+
+
+def test_random_graphs_match_baseline(random_graph):
+    rnd = random.Random(15)
+    for _ in range(200):
+        vertices, edges = random_graph(rnd, rnd.randint(1, 12), rnd.randint(0, 30),
+                                       lambda r: r.randint(0, 9), names=True)
+        start = rnd.choice(vertices)
+        expected = baseline_dijkstra(start, vertices, edges)
+        assert dijkstra(start, vertices, edges) == expected
+        assert dijkstra_distances(start, vertices, edges) == expected[0]
+        engine = ShortestPathEngine(vertices, edges)
+        assert engine.distances(start) == expected[0]
+        for t in vertices:
+            d, path = engine.path(start, t)
+            assert d == expected[0][t]
+            if d == math.inf:
+                assert path == []
+            else:
+                assert path[0] == start and path[-1] == t
+
+
+@pytest.mark.parametrize("vertices, edges, start", [
+    # цикл нульової ваги, паралельні ребра з різними вагами, петля
+    ("abc", [("a", "b", 0), ("b", "a", 0), ("b", "c", 4), ("b", "c", 1), ("c", "c", 0)], "a"),
+    # недосяжна вершина лишається inf
+    ("abcd", [("a", "b", 2), ("d", "a", 1)], "a"),
+    # мітки-числа, що не збігаються з номерами
+    ([30, 10, 20], [(10, 30, 5), (30, 20, 1), (10, 20, 7)], 10),
+    (["x"], [], "x"),
+])
+def test_edge_cases_match_baseline(vertices, edges, start):
+    expected = baseline_dijkstra(start, list(vertices), edges)
+    assert dijkstra(start, vertices, edges) == expected
+    assert dijkstra_distances(start, vertices, edges) == expected[0]
+
+
+def test_explicit_index_uses_its_own_vertices():
+    index = build_weighted_index(["x", "y"], [("x", "y", 3)])
+    assert dijkstra("x", index=index)[0] == {"x": 0, "y": 3}
+    assert dijkstra("x", index=index, sink=NullSink()) == ({"x": 0, "y": 3}, [])
+
+
+def test_engine_edge_cases():
+    engine = ShortestPathEngine("abcd", [("a", "b", 0), ("b", "a", 0), ("b", "c", 2),
+                                         ("a", "c", 5)])
+    # цикл нульової ваги не зациклює відновлення шляху
+    assert engine.tree("a") == ({"a": 0, "b": 0, "c": 2, "d": math.inf},
+                                {"a": None, "b": "a", "c": "b", "d": None})
+    assert engine.path("a", "c") == (2, ["a", "b", "c"])
+    assert engine.path("c", "c") == (0, ["c"])
+    assert engine.path("a", "d") == (math.inf, [])
+    assert engine.query("a", "d")["path"] == []
+
+    # мітки-числа, неорієнтований граф
+    engine = ShortestPathEngine([30, 10, 20], [(10, 30, 5), (30, 20, 1), (10, 20, 7)],
+                                directed=False)
+    assert engine.distances(20) == {30: 1, 10: 6, 20: 0}
+    assert engine.path(20, 10) == (6, [20, 30, 10])
+
+    with pytest.raises(ValueError):
+        ShortestPathEngine([], []).distances("a")
+
+
+def test_engine_vertex_id_is_a_plain_lookup():
+    engine = ShortestPathEngine(["a", "b"], [("a", "b", -1)])
+    assert engine.vertex_id("b") == 1
+    with pytest.raises(ValueError, match="немає"):
+        engine.vertex_id("z")
+    # від'ємні ваги відхиляють лише запити Дейкстри
+    assert engine.bellman_ford("a")["dist"] == {"a": 0, "b": -1}
+    for query in (lambda: engine.tree("a"), lambda: engine.distances("a"),
+                  lambda: engine.distance("a", "b"), lambda: engine.path("a", "b"),
+                  lambda: engine.query("a", "b")):
+        with pytest.raises(ValueError, match="невід'ємних"):
+            query()
+
+
+def test_capped_sinks_agree_with_full_protocol():
+    for start in VERTICES_WEIGHTED:
+        dist, full = dijkstra(start)
+        ring_dist, ring_lines = dijkstra(start, sink=RingSink(capacity=3))
+        assert ring_dist == dist
+        dropped = max(0, len(full) - 3)
+        header = [f"... пропущено ранніх подій: {dropped}"] if dropped else []
+        assert ring_lines == header + full[-3:]
+        counting = CountingSink()
+        _, lines = dijkstra(start, sink=counting)
+        settled = sum(line.startswith("Вибрана") for line in full)
+        assert counting.counts["settle"] == settled
+        assert sum(counting.counts.values()) == len(full) and len(lines) <= 2
@@ -0,0 +1,62 @@
+import itertools
+
+import pytest
+
+from mlta.dp import (
+    S_COST,
+    PrinterConstraints,
+    PrintJob,
+    optimize_printing,
+    parse_print_jobs,
+    rod_cutting_memo,
+    rod_cutting_table,
+)
+
+CLRS_PRICES = [1, 5, 8, 9, 10, 17, 17, 20]
+
+
+def best_by_brute_force(prices):
+    """Найкращий прибуток перебором усіх розрізань (біти — місця розрізів)."""
+    n = len(prices)
+    best = 0
+    for cuts in itertools.product((0, 1), repeat=n - 1):
+        pieces, run = [], 1
+        for c in cuts:
+            if c:
+                pieces.append(run)
+                run = 0
+            run += 1
+        pieces.append(run)
+        best = max(best, sum(prices[p - 1] for p in pieces))
+    return best
+
+
+@pytest.mark.parametrize("solve", [rod_cutting_memo, rod_cutting_table])
+def test_rod_cutting(solve):
+    res = solve(8, CLRS_PRICES)
+    assert res == {"gross_profit": 22, "net_profit": 22 - S_COST, "pieces": [2, 6], "cuts": 1}
+    for length in range(1, 9):
+        prices = CLRS_PRICES[:length]
+        res = solve(length, prices)
+        assert sum(res["pieces"]) == length
+        assert res["gross_profit"] == sum(prices[p - 1] for p in res["pieces"])
+        assert res["gross_profit"] == best_by_brute_force(prices)
+    with pytest.raises(ValueError):
+        solve(3, [1, 2])
+
+
+def test_optimize_printing():
+    jobs = parse_print_jobs("a,50,1,30\n\nb,60,3,40\nc,40,2,20\nd,30,3,10\n")
+    assert [j.id for j in jobs] == ["a", "b", "c", "d"]
+    res = optimize_printing(jobs, PrinterConstraints(max_volume=100, max_items=2))
+    # P1 і P3 не змішуються, поки є інший варіант, тож штрафу немає
+    assert [[j.id for j in b.jobs] for b in res["batches"]] == [["a", "c"], ["b", "d"]]
+    assert res["print_order"] == ["a", "c", "b", "d"]
+    assert res["total_time"] == 30 + 40
+
+
+def test_parse_print_jobs_rejects_bad_lines():
+    for text in ("a,1,1", "a,1,4,10", "a,0,1,10", "a,x,1,10"):
+        with pytest.raises(ValueError):
+            parse_print_jobs(text)
+    assert parse_print_jobs("a, 2.5 ,2, 7") == [PrintJob("a", 2.5, 2, 7)]
@@ -0,0 +1,101 @@
+import math
+import random
+
+import pytest
+
+from mlta.dynamic import EDGE_DELETE, EDGE_INSERT, EDGE_REWEIGHT, DynamicShortestPaths
+from mlta.shortest_paths import dijkstra_distances
+
+
+def assert_matches_scratch(g, edges, directed):
+    """Відстані й шляхи g збігаються з Дейкстрою з нуля над поточними ребрами."""
+    triples = [(u, v, w) for (u, v), w in edges.items()]
+    for s in g.vertices:
+        ref = dijkstra_distances(s, g.vertices, triples if directed else
+                                 triples + [(v, u, w) for u, v, w in triples])
+        assert g.distances(s) == ref
+        for t in g.vertices:
+            d, path = g.path(s, t)
+            assert d == ref[t]
+            if path:
+                cost = sum(min(edges.get((a, b), float("inf")),
+                               float("inf") if directed else edges.get((b, a), float("inf")))
+                           for a, b in zip(path, path[1:]))
+                assert cost == d
+
+
+def random_events(random_graph, rnd, directed, steps=25):
+    n = rnd.randint(2, 10)
+    vertices, triples = random_graph(rnd, n, rnd.randint(0, 3 * n), lambda r: r.randint(0, 6))
+    edges = {}
+    for u, v, w in triples:
+        # між парою вершин — одне ребро, як у DynamicShortestPaths
+        if not directed and (v, u) in edges:
+            u, v = v, u
+        edges[(u, v)] = w
+    g = DynamicShortestPaths(vertices, [(u, v, w) for (u, v), w in edges.items()],
+                             directed=directed)
+    return g, edges, steps
+
+
+def test_repair_matches_scratch_after_each_change(random_graph):
+    for seed in range(150):
+        rnd = random.Random(seed)
+        directed = seed % 2 == 0
+        g, edges, steps = random_events(random_graph, rnd, directed)
+        assert_matches_scratch(g, edges, directed)
+        n = len(g.vertices)
+        for _ in range(steps):
+            existing = list(edges)
+            before = {s: g.distances(s) for s in g.vertices}
+            kind = rnd.choice((EDGE_INSERT, EDGE_DELETE, EDGE_REWEIGHT))
+            if kind != EDGE_INSERT and existing:
+                u, v = rnd.choice(existing)
+            else:
+                kind = EDGE_INSERT
+                u, v = rnd.randrange(n), rnd.randrange(n)
+                if not directed and (v, u) in edges:
+                    u, v = v, u
+            if kind == EDGE_DELETE:
+                del edges[(u, v)]
+                changed = g.apply([(kind, u, v)])
+            else:
+                edges[(u, v)] = rnd.randint(0, 6)
+                changed = g.apply([(kind, u, v, edges[(u, v)])])
+
+            assert_matches_scratch(g, edges, directed)
+            # повертається кількість відстаней, що справді змінились
+            assert changed == sum(before[s][t] != g.distance(s, t)
+                                  for s in g.vertices for t in g.vertices)
+
+
+def test_increase_with_equal_alternative_changes_nothing():
+    g = DynamicShortestPaths(list("abcd"), [("a", "b", 1), ("b", "d", 1),
+                                            ("a", "c", 1), ("c", "d", 1)], sources=["a"])
+    assert g.pred["a"]["d"] == "b"
+    # піддерево b — {b, d}, але d зберігає відстань 2 через c
+    assert g.update_weight("a", "b", 5) == 1
+    assert g.distances("a") == {"a": 0, "b": 5, "c": 1, "d": 2}
+
+
+def test_edge_cases():
+    g = DynamicShortestPaths([30, 10, 20], [(10, 30, 2), (30, 20, 0)])
+    assert g.path(10, 20) == (2, [10, 30, 20])
+    # видалення єдиного шляху робить вершини недосяжними
+    assert g.delete_edge(10, 30) == 2
+    assert g.path(10, 20) == (math.inf, []) and g.distance(10, 30) == math.inf
+    # цикл нульової ваги не зациклює відновлення шляху
+    g.insert_edge(20, 30, 0)
+    g.insert_edge(10, 20, 1)
+    assert g.path(10, 30) == (1, [10, 20, 30]) and g.path(30, 20) == (0, [30, 20])
+    assert g.matrix() == [[0, math.inf, 0], [1, 0, 1], [0, math.inf, 0]]
+
+    for bad in (lambda: g.insert_edge(10, 20, -1), lambda: g.delete_edge(20, 10),
+                lambda: g.apply([(EDGE_REWEIGHT, 20, 10, 1)]),
+                lambda: g.insert_edge(10, 99, 1), lambda: g.add_source(99),
+                lambda: g.apply([("swap", 10, 20)])):
+        with pytest.raises(ValueError):
+            bad()
+
+    empty = DynamicShortestPaths([], [])
+    assert empty.matrix() == [] and empty.apply([]) == 0
@@ -0,0 +1,91 @@
+import gzip
+import random
+
+import pytest
+
+import mlta.export
+from mlta.export import (
+    write_adj_list,
+    write_adjacency,
+    write_edge_list,
+    write_incidence,
+    write_matrix,
+)
+from mlta.representations import (
+    adjacency_matrix_to_adj_list,
+    edges_to_adjacency_matrix,
+    edges_to_incidence_matrix,
+)
+
+
+def lab1_matrix_text(M):
+    """Формат save_adjacency / save_incidence з ЛР №1 до переписування."""
+    return "".join(" ".join(str(x) for x in row) + "\n" for row in M)
+
+
+def read(path):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(params=["numpy", "no-numpy"])
+def numpy_mode(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(mlta.export, "HAS_NP", False)
+    return request.param
+
+
+def test_writers_match_lab1_format(tmp_path, random_graph, numpy_mode):
+    rnd = random.Random(6)
+    for k in range(60):
+        n = rnd.randint(0, 15)
+        vertices, edges = random_graph(rnd, n, rnd.randint(0, 4 * n) if n else 0,
+                                       names=k % 2 == 0)
+        directed = k % 3 == 0
+        A = edges_to_adjacency_matrix(vertices, edges, directed)
+        Inc = edges_to_incidence_matrix(vertices, edges, directed)
+        adj = adjacency_matrix_to_adj_list(vertices, A)
+        suffix = ".txt.gz" if k % 5 == 0 else ".txt"
+
+        write_adjacency(str(tmp_path / f"adj{suffix}"), vertices, edges, directed)
+        assert read(tmp_path / f"adj{suffix}") == lab1_matrix_text(A)
+        write_incidence(str(tmp_path / f"inc{suffix}"), vertices, edges, directed)
+        assert read(tmp_path / f"inc{suffix}") == lab1_matrix_text(Inc)
+        write_edge_list(str(tmp_path / f"edges{suffix}"), edges)
+        assert read(tmp_path / f"edges{suffix}") == \
+            "".join(f"{i+1}: {e}\n" for i, e in enumerate(edges))
+        write_adj_list(str(tmp_path / f"list{suffix}"), vertices, edges, directed)
+        assert read(tmp_path / f"list{suffix}") == \
+            "".join(f"{v}: {adj[v]}\n" for v in vertices)
+
+
+@pytest.mark.parametrize("rows", [
+    [[0, 1, 2], [3, 4, 5]],                       # однакова ширина
+    [[1, -1, 0], [0, 1, -1]],                     # мішана ширина (-1 / 0 / 1)
+    [[7, 10, 100], [0, 9, 99]],                   # мішана ширина, додатні
+    [[0, 256], [-3, 1]],                          # розкид > 255 — запасний шлях
+    [[-1000, 5, 70000]],
+    [[], []],                                     # рядки без клітинок
+    [],
+])
+def test_write_matrix_tokens(tmp_path, rows, numpy_mode):
+    path = tmp_path / "m.txt"
+    for block_cells in (1, 4, 1 << 20):
+        write_matrix(str(path), rows, block_cells=block_cells)
+        assert read(path) == lab1_matrix_text(rows)
+
+
+@pytest.mark.parametrize("rows", [
+    [[5]],
+    [[-300, -45]],                                # лише від'ємні
+    [[0, 255], [255, 0]],                         # розкид рівно 255 — векторний шлях
+    [[-1, 255]],                                  # розкид 256 — запасний шлях
+    [[9, 10], [99, 100], [-9, -10]],              # межі кількості цифр
+])
+def test_format_int_block_widths(rows):
+    np = pytest.importorskip("numpy")
+    block = np.array(rows, dtype=np.int64)
+    assert mlta.export.format_int_block(block).decode() == lab1_matrix_text(rows)
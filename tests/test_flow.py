@@ -0,0 +1,33 @@
+from mlta.flow import build_capacity_graph, edmonds_karp, solve_logistics
+
+# мережа з CLRS, рис. 26.1: максимальний потік 23
+CLRS = [("s", "v1", 16), ("s", "v2", 13), ("v2", "v1", 4), ("v1", "v3", 12),
+        ("v3", "v2", 9), ("v2", "v4", 14), ("v4", "v3", 7), ("v3", "t", 20),
+        ("v4", "t", 4)]
+
+
+def test_edmonds_karp_clrs():
+    capacity, adj = build_capacity_graph(CLRS, "s", "t")
+    max_flow, flow, steps = edmonds_karp(capacity, adj, "s", "t")
+    assert max_flow == 23
+    assert steps[-1].startswith("Зупинка")
+    for u, v, c in CLRS:
+        assert 0 <= flow[u][v] <= c
+    for x in ("v1", "v2", "v3", "v4"):
+        assert sum(flow[x][y] for y in adj[x]) == 0  # збереження потоку
+
+
+def test_parallel_edges_add_up_and_unreachable_sink():
+    capacity, adj = build_capacity_graph([("s", "t", 2), ("s", "t", 3)], "s", "t")
+    assert edmonds_karp(capacity, adj, "s", "t")[0] == 5
+    capacity, adj = build_capacity_graph([("s", "a", 2)], "s", "t")
+    assert edmonds_karp(capacity, adj, "s", "t")[0] == 0
+
+
+def test_logistics_totals_agree():
+    for variant in (False, True):
+        res = solve_logistics(variant)
+        assert res["max_flow"] == 115
+        assert sum(res["terminal_totals"].values()) == res["max_flow"]
+        assert sum(res["shop_totals"].values()) == res["max_flow"]
+        assert sum(sum(row.values()) for row in res["table"].values()) == res["max_flow"]
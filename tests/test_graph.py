@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from mlta.graph import Graph
+from mlta.traversal import build_adj_list, connected_components
+
+
+def views(g):
+    """Усі кешовані представлення графа."""
+    out = {
+        "pairs": g.pairs(),
+        "adj": g.adj(),
+        "bfs_index": g.bfs_index(),
+        "components": g.connected_components(),
+    }
+    if g.directed:
+        out["scc"] = g.strongly_connected_components()
+    return out
+
+
+def fresh_views(g):
+    """Ті самі представлення, побудовані з нуля для копії графа."""
+    return views(Graph(list(g.vertices), list(g.edges), g.directed))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_every_view_follows_mutations(random_graph, directed):
+    rnd = random.Random(13 + directed)
+    vertices, edges = random_graph(rnd, 6, 8)
+    g = Graph(vertices, edges, directed)
+    cached = views(g)
+    assert cached == fresh_views(g)
+
+    for step in range(40):
+        version = g.version
+        if step % 5 == 0:
+            g.add_vertex(100 + step)
+        else:
+            g.add_edge(rnd.choice(g.vertices), rnd.choice(g.vertices))
+        assert g.version > version
+
+        current = views(g)
+        assert current == fresh_views(g)
+        for name in current:
+            assert current[name] is not cached[name], name
+        cached = current
+
+
+def test_views_are_reused_until_a_change():
+    g = Graph("abc", [("a", "b")], directed=True)
+    first = views(g)
+    again = views(g)
+    for name in first:
+        assert again[name] is first[name]
+    g.add_vertex("a")  # вершина вже є — версія не змінюється
+    assert views(g)["adj"] is first["adj"]
+
+
+def test_weak_components_of_directed_graph():
+    g = Graph("abcd", [("a", "b"), ("c", "b")], directed=True)
+    assert g.connected_components() == {"a": 0, "b": 0, "c": 0, "d": 1}
+    # adj() орієнтованого графа кешується окремо й не підміняє неорієнтований список
+    assert g.adj() == build_adj_list("abcd", [("a", "b"), ("c", "b")], directed=True)
+    g.add_edge("d", "c")
+    assert g.connected_components() == {v: 0 for v in "abcd"}
+    assert g.connected_components() == connected_components(g.vertices, g.pairs(), True)
+
+
+def test_custom_cached_entries_are_invalidated():
+    g = Graph([1, 2], [(1, 2, 5)])
+    calls = []
+
+    def build():
+        calls.append(g.version)
+        return sum(w for _, _, w in g.edges)
+
+    assert g.cached("total", build) == 5 and g.cached("total", build) == 5
+    g.add_edge(2, 3, 7)
+    assert g.cached("total", build) == 12
+    assert calls == [3, 5]
+
+
+def test_numbering_uses_current_edges():
+    g = Graph("abc", [("a", "b")])
+    assert g.numbering_from(["a"]) == {"a": {"a": 1, "b": 2}}
+    g.add_edge("b", "c")
+    assert g.numbering_from(["a"], method="bfs") == {"a": {"a": 1, "b": 2, "c": 3}}
+    with pytest.raises(ValueError):
+        g.strongly_connected_components()
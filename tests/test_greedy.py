@@ -0,0 +1,21 @@
+from mlta.greedy import decompose_even_powers, minimal_coins
+
+
+def test_minimal_coins():
+    assert minimal_coins(85) == "50 коп — 1 шт.\n25 коп — 1 шт.\n10 коп — 1 шт."
+    assert minimal_coins(1000) == "50 коп — 20 шт."
+    assert minimal_coins(0) == ""
+    # залишок, менший за 5 коп, видати неможливо
+    assert minimal_coins(93).endswith("Неможливо видати 93 коп.")
+    assert minimal_coins(-1).startswith("n має бути")
+    assert minimal_coins(1001).startswith("n має бути")
+
+
+def test_decompose_even_powers():
+    for n in range(1, 1001):
+        parts = [int(p) for p in decompose_even_powers(n).split("+")]
+        assert sum(parts) == n
+        assert all(p & (p - 1) == 0 and p.bit_length() % 2 == 1 for p in parts)
+        assert parts == sorted(parts, reverse=True)
+    assert decompose_even_powers(7) == "4+1+1+1"
+    assert decompose_even_powers(0).startswith("n має бути")
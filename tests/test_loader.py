@@ -0,0 +1,92 @@
+import gzip
+import random
+
+import pytest
+
+from mlta.loader import VertexInterner, iter_edge_chunks, load_edge_list
+
+
+def write_edges(path, edges, sep=" ", compress=False):
+    text = "".join(sep.join(str(x) for x in e) + "\n" for e in edges)
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        path.write_text(text, encoding="utf-8")
+
+
+def collect(chunks, interner):
+    edges = []
+    for src, dst, weights in chunks:
+        assert len(src) == len(dst)
+        names = interner.names
+        if weights is None:
+            edges.extend((names[i], names[j]) for i, j in zip(src, dst))
+        else:
+            assert len(weights) == len(src)
+            edges.extend((names[i], names[j], w) for i, j, w in zip(src, dst, weights))
+    return edges
+
+
+def test_interner_keeps_first_appearance_order():
+    interner = VertexInterner(["c", "a"])
+    assert [interner.intern(x) for x in ("a", "b", "c", "b")] == [1, 2, 0, 2]
+    assert interner.names == ["c", "a", "b"] and len(interner) == 3
+
+
+@pytest.mark.parametrize("suffix, sep, compress", [
+    (".txt", " ", False), (".txt", "\t", False), (".csv", ",", False),
+    (".txt.gz", " ", True), (".csv.gz", ",", True), (".bin", " ", True),
+])
+def test_chunk_boundaries_give_same_edges(tmp_path, random_graph, suffix, sep, compress):
+    rnd = random.Random(4)
+    _, edges = random_graph(rnd, 40, 300, lambda r: r.choice((r.randint(-9, 99), 0.5)),
+                            names=True)
+    path = tmp_path / f"g{suffix}"
+    write_edges(path, edges, sep, compress)
+    # .bin без суфікса .gz — gzip розпізнається за сигнатурою
+    for chunk_bytes in (1, 7, 64, 1 << 20):
+        interner = VertexInterner()
+        chunks = list(iter_edge_chunks(str(path), interner=interner, chunk_bytes=chunk_bytes))
+        assert collect(chunks, interner) == edges
+        if chunk_bytes == 1:
+            assert len(chunks) > 1
+
+    g = load_edge_list(str(path), chunk_bytes=7)
+    assert list(g.iter_weighted_edges()) == edges
+    # int і float ваги з різних порцій зводяться до одного типу
+    assert g.weights.typecode == "d"
+
+
+def test_unweighted_with_header_and_comments(tmp_path):
+    path = tmp_path / "g.txt"
+    path.write_text("source target\n# коментар\n\n% теж коментар\na b\nb c\n",
+                    encoding="utf-8")
+    g = load_edge_list(str(path), header=True, vertices=["z"])
+    assert g.vertices == ["z", "a", "b", "c"]
+    assert list(g.iter_edges()) == [("a", "b"), ("b", "c")] and not g.weighted
+
+
+def test_csv_quoted_record_spanning_lines(tmp_path):
+    path = tmp_path / "g.csv"
+    path.write_text('a,b,1\n"x\ny",b,2\nb,c,3\n', encoding="utf-8")
+    for chunk_bytes in (1, 3, 1 << 20):
+        g = load_edge_list(str(path), chunk_bytes=chunk_bytes)
+        assert list(g.iter_weighted_edges()) == [("a", "b", 1), ("x\ny", "b", 2), ("b", "c", 3)]
+
+
+@pytest.mark.parametrize("name, text, line, header", [
+    ("g.txt", "a b 1\nb c 2\nc\n", 3, False),
+    ("g.txt", "h\na b 1\nb c\n", 3, True),
+    ("g.txt", "a b 1\nb c x\n", 2, False),
+    ("g.csv", "a,b,1\nb,c,2\nc,d\n", 3, False),
+    # запис у лапках займає рядки 2–3, тож зламаний рядок — 4-й
+    ("g.csv", 'a,b,1\n"x\ny",b,2\nc\n', 4, False),
+    ("g.csv", 'a,b,1\n"x\ny",b\n', 3, False),
+])
+def test_bad_rows_report_file_line(tmp_path, name, text, line, header):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    for chunk_bytes in (1, 1 << 20):
+        with pytest.raises(ValueError, match=f"Рядок {line}\\b"):
+            load_edge_list(str(path), header=header, chunk_bytes=chunk_bytes)
@@ -0,0 +1,101 @@
+import math
+import random
+
+import pytest
+
+from mlta.samples import EDGES_WEIGHTED, VERTICES_WEIGHTED, weighted_positions
+from mlta.shortest_paths import (
+    ShortestPathEngine,
+    astar_arrays,
+    bidirectional_dijkstra_arrays,
+    build_weighted_index,
+    dijkstra_distances,
+    euclidean_heuristic,
+    euclidean_scale,
+    reverse_index,
+)
+
+
+def path_cost(path, edges, directed):
+    best = {}
+    for u, v, w in edges:
+        for a, b in ((u, v),) if directed else ((u, v), (v, u)):
+            best[(a, b)] = min(w, best.get((a, b), math.inf))
+    return sum(best[e] for e in zip(path, path[1:]))
+
+
+def check(res, s, t, expected, edges, directed):
+    assert res["dist"] == pytest.approx(expected)
+    if expected == math.inf:
+        assert res["path"] == []
+    else:
+        assert res["path"][0] == s and res["path"][-1] == t
+        assert path_cost(res["path"], edges, directed) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_queries_match_dijkstra(random_graph, directed):
+    rnd = random.Random(20 + directed)
+    for k in range(150):
+        n = rnd.randint(1, 20)
+        vertices, edges = random_graph(rnd, n, rnd.randint(0, 3 * n), names=k % 2 == 0)
+        pos = {v: (rnd.uniform(0, 10), rnd.uniform(0, 10)) for v in vertices}
+        # ваги не коротші за відстань між точками, тож евристика узгоджена з scale=1
+        edges = [(u, v, round(math.dist(pos[u], pos[v]) * rnd.uniform(1, 2) + 0.001, 3))
+                 for u, v in edges]
+        engine = ShortestPathEngine(vertices, edges, directed)
+        both = edges if directed else edges + [(v, u, w) for u, v, w in edges]
+        for _ in range(5):
+            s, t = rnd.choice(vertices), rnd.choice(vertices)
+            expected = dijkstra_distances(s, vertices, both)[t]
+            h = euclidean_heuristic(pos, t)
+            for method, kwargs in (("dijkstra", {}), ("bidirectional", {}),
+                                   ("astar", {"heuristic": h})):
+                res = engine.query(s, t, method, **kwargs)
+                check(res, s, t, expected, edges, directed)
+                assert 1 <= res["settled"] <= n
+
+
+@pytest.mark.parametrize("s, t, dist, path", [
+    (0, 2, 3, [0, 1, 2]),     # через цикл нульової ваги 0 ⇄ 1
+    (2, 2, 0, [2]),
+    (0, 3, math.inf, []),     # 3 ізольована
+    (2, 0, math.inf, []),     # ребра лише в один бік
+])
+def test_raw_kernels_edge_cases(s, t, dist, path):
+    vertices = [0, 1, 2, 3]
+    edges = [(0, 1, 0), (1, 0, 0), (1, 2, 3), (0, 2, 5)]
+    pos = {0: (0, 0), 1: (0, 0), 2: (3, 0), 3: (9, 9)}
+    index = build_weighted_index(vertices, edges)
+    scale = euclidean_scale(pos, edges)
+    assert scale == 1  # ребро 1 → 2: вага 3 на відстані 3
+    for d, p, settled in (bidirectional_dijkstra_arrays(index, reverse_index(index), s, t),
+                          astar_arrays(index, s, t, euclidean_heuristic(pos, t, scale))):
+        assert (d, p) == (dist, path)
+        assert 1 <= settled <= len(vertices)
+
+
+def test_lab3_graph():
+    engine = ShortestPathEngine()
+    scale = euclidean_scale(weighted_positions, EDGES_WEIGHTED)
+    assert scale > 0
+    for s in VERTICES_WEIGHTED:
+        expected = dijkstra_distances(s)
+        for t in VERTICES_WEIGHTED:
+            h = euclidean_heuristic(weighted_positions, t, scale)
+            for method, kwargs in (("bidirectional", {}), ("astar", {"heuristic": h})):
+                check(engine.query(s, t, method, **kwargs), s, t, expected[t],
+                      EDGES_WEIGHTED, True)
+
+
+def test_heuristic_without_coordinates_is_zero():
+    h = euclidean_heuristic({"a": (0, 0), "b": (3, 4)}, "b", scale=2)
+    assert h("a") == 10 and h("b") == 0 and h("zzz") == 0
+    # усі ребра нульової довжини — узгоджений лише нульовий множник
+    assert euclidean_scale({"a": (1, 1), "b": (1, 1)}, [("a", "b", 5)]) == 0.0
+    engine = ShortestPathEngine(["a"], [])
+    with pytest.raises(ValueError):
+        engine.query("a", "a", "astar")
+    for method in ("bidirectional", "astar"):
+        with pytest.raises(ValueError, match="немає"):
+            engine.query("a", "z", method, heuristic=lambda v: 0)
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import mlta
+
+HEAVY = ("tkinter", "matplotlib", "networkx", "numpy")
+
+
+def loaded_after(code):
+    """Які з HEAVY опинились у sys.modules після code у чистому інтерпретаторі."""
+    check = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True,
+                         check=True)
+    return out.stdout.strip()
+
+
+def test_import_mlta_is_headless():
+    assert loaded_after("import mlta") == ""
+
+
+def test_core_modules_are_headless():
+    # plotting теж: networkx/matplotlib підвантажуються лише під час малювання
+    modules = sorted({m.rsplit(".", 1)[1] for m in mlta._EXPORTS.values()} | {"cli", "plotting"})
+    code = "\n".join(f"import mlta.{m}" for m in modules)
+    assert loaded_after(code) == ""
+
+
+def test_exports_resolve():
+    for name in mlta.__all__:
+        assert getattr(mlta, name) is not None
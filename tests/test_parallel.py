@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from mlta.parallel import parallel_numbering
+from mlta.traversal import iter_bfs_events, iter_dfs_events, traversal_numbers
+
+EVENTS = {"dfs": iter_dfs_events, "bfs": iter_bfs_events}
+
+
+def serial_numbering(vertices, edges, root, directed, method):
+    numbers = traversal_numbers(EVENTS[method](vertices, edges, root, directed))
+    return [numbers.get(v, 0) for v in vertices]
+
+
+@pytest.mark.parametrize("method", ["dfs", "bfs"])
+@pytest.mark.parametrize("processes", [1, 2])
+def test_matches_serial_traversal_numbers(random_graph, method, processes):
+    rnd = random.Random(14)
+    for k in range(8 if processes > 1 else 60):
+        n = rnd.randint(1, 40)
+        vertices, edges = random_graph(rnd, n, rnd.randint(0, 3 * n), names=k % 2 == 0)
+        directed = k % 4 < 2
+        roots = None if k % 3 == 0 else rnd.sample(vertices, min(n, 5))
+        result = parallel_numbering(vertices, edges, roots, directed, method,
+                                    processes=processes, roots_per_task=3)
+        assert sorted(result) == sorted(vertices if roots is None else set(roots))
+        for r, numbers in result.items():
+            assert list(numbers) == serial_numbering(vertices, edges, r, directed, method)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        parallel_numbering(["a"], [], method="dijkstra")
@@ -0,0 +1,47 @@
+import math
+import random
+
+from mlta.graph import Graph
+from mlta.query_cache import DistanceTreeCache
+from mlta.shortest_paths import ShortestPathEngine
+
+
+def test_matches_engine_and_counts_hits(random_graph):
+    rnd = random.Random(22)
+    for k in range(40):
+        n = rnd.randint(1, 12)
+        weight = (lambda r: r.randint(0, 9)) if k % 2 else (lambda r: r.uniform(0, 5))
+        vertices, edges = random_graph(rnd, n, rnd.randint(0, 3 * n), weight, names=True)
+        g = Graph(vertices, edges, directed=True)
+        cache = DistanceTreeCache(g)
+        engine = ShortestPathEngine(vertices, edges)
+        for _ in range(10):
+            s, t = rnd.choice(vertices), rnd.choice(vertices)
+            expected = engine.distances(s)
+            got = cache.distances(s)
+            assert got == expected
+            assert cache.distance(s, t) == expected[t]
+            d, path = cache.path(s, t)
+            assert d == expected[t]
+            assert (path == []) == (d == math.inf)
+            if k % 2:
+                assert all(isinstance(x, int) for x in got.values() if x != math.inf)
+        stats = cache.stats()
+        assert stats["hits"] + stats["misses"] == 30
+        assert stats["misses"] == stats["entries"] <= n
+
+
+def test_mutation_invalidates_and_budget_evicts():
+    g = Graph("abc", [("a", "b", 1), ("b", "c", 1)], directed=True)
+    cache = DistanceTreeCache(g)
+    assert cache.distance("a", "c") == 2
+    g.add_edge("a", "c", 1)
+    assert cache.distance("a", "c") == 1
+    assert cache.stats()["invalidated"] == 1 and cache.stats()["misses"] == 2
+
+    one_tree = cache.size_bytes
+    small = DistanceTreeCache(g, max_bytes=one_tree)
+    for s in "abca":
+        small.distances(s)
+    stats = small.stats()
+    assert stats["entries"] == 1 and stats["evictions"] == 3 and stats["hits"] == 0
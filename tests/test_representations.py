@@ -0,0 +1,33 @@
+import random
+
+from mlta.representations import (
+    adjacency_matrix_to_adj_list,
+    edges_to_adj_list,
+    edges_to_adjacency_matrix,
+    iter_adj_list_lines,
+)
+
+
+def test_adj_list_matches_matrix_round_trip(random_graph):
+    rnd = random.Random(3)
+    for k in range(200):
+        n = rnd.randint(0, 12)
+        vertices, edges = random_graph(rnd, n, rnd.randint(0, 3 * n) if n else 0,
+                                       names=k % 2 == 0)
+        # порядок vertices не збігається з порядком назв — сусіди йдуть за vertices
+        rnd.shuffle(vertices)
+        for directed in (False, True):
+            A = edges_to_adjacency_matrix(vertices, edges, directed)
+            expected = adjacency_matrix_to_adj_list(vertices, A)
+            adj = edges_to_adj_list(vertices, edges, directed)
+            assert adj == expected
+            assert list(adj) == list(expected)
+            assert list(iter_adj_list_lines(vertices, edges, directed)) == \
+                [f"{v}: {expected[v]}\n" for v in vertices]
+
+
+def test_adj_list_lab1_graph():
+    vertices = ["a", "b", "c", "d"]
+    edges = [("a", "b"), ("c", "d"), ("c", "d"), ("d", "d")]
+    assert edges_to_adj_list(vertices, edges) == {
+        "a": ["b"], "b": ["a"], "c": ["d", "d"], "d": ["c", "c", "d", "d"]}
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+import mlta.sparse
+from mlta.representations import (
+    adjacency_matrix_to_adj_list,
+    edges_to_adjacency_matrix,
+    edges_to_incidence_matrix,
+)
+from mlta.sparse import COOIncidence, CSRAdjacency
+
+
+def graphs(random_graph, seed, count=100):
+    """Випадкові графи з петлями й паралельними ребрами, обидва види."""
+    rnd = random.Random(seed)
+    for k in range(count):
+        n = rnd.randint(0, 12)
+        m = rnd.randint(0, 3 * n) if n else 0
+        vertices, edges = random_graph(rnd, n, m, names=k % 2 == 0)
+        yield vertices, edges, k % 4 < 2
+
+
+def test_csr_matches_dense_adjacency(random_graph):
+    for vertices, edges, directed in graphs(random_graph, 1):
+        dense = edges_to_adjacency_matrix(vertices, edges, directed)
+        csr = edges_to_adjacency_matrix(vertices, edges, directed, sparse=True)
+        assert isinstance(csr, CSRAdjacency)
+        assert csr.to_dense() == dense
+        assert csr.nnz == sum(1 for row in dense for x in row if x)
+        for i, row in enumerate(dense):
+            assert csr.degree(i) == sum(row)
+            assert [csr[i, j] for j in range(len(vertices))] == row
+        assert csr.to_adj_list() == adjacency_matrix_to_adj_list(vertices, dense)
+        assert adjacency_matrix_to_adj_list(vertices, csr) == \
+            adjacency_matrix_to_adj_list(vertices, dense)
+
+
+def test_csr_edge_cases():
+    empty = CSRAdjacency.from_edges([], [])
+    assert empty.to_dense() == [] and empty.nnz == 0 and empty.to_adj_list() == {}
+    # ізольовані вершини й мітки-числа, що не збігаються з номерами рядків
+    csr = CSRAdjacency.from_edges([30, 10, 20], [(10, 30), (10, 30)], directed=True)
+    assert csr.index(10) == 1 and csr[1, 0] == 2 and csr[0, 1] == 0
+    assert csr.degree(2) == 0 and list(csr.row(2)) == []
+    assert csr.to_adj_list() == {30: [], 10: [30, 30], 20: []}
+
+
+def test_csr_lab1_graph():
+    vertices = ["a", "b", "c", "d"]
+    edges = [("a", "b"), ("c", "d"), ("c", "d"), ("d", "d")]
+    csr = CSRAdjacency.from_edges(vertices, edges)
+    # паралельні ребра — кратність, петля — двічі в тому ж рядку
+    assert csr.to_dense() == [[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 0, 2], [0, 0, 2, 2]]
+    assert csr.index("d") == 3 and list(csr.row(3)) == [(2, 2), (3, 2)]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_coo_matches_dense_incidence(directed):
+    np = pytest.importorskip("numpy")
+    vertices = ["a", "b", "c", "d", "e"]  # "e" ізольована
+    edges = [("a", "b"), ("c", "d"), ("c", "d"), ("d", "d"), ("b", "a")]
+    dense = edges_to_incidence_matrix(vertices, edges, directed)
+    coo = edges_to_incidence_matrix(vertices, edges, directed, sparse=True)
+    assert isinstance(coo, COOIncidence)
+    assert coo.shape == (5, 5)
+    assert coo.to_list() == dense and coo.to_dense().tolist() == dense
+
+    rows = np.array(dense, dtype=np.int8)
+    # рядки в довільному порядку з повтором, маска, зріз
+    for sel in ([3, 0, 3], np.arange(5) % 2 == 0, slice(1, None, 2), []):
+        assert coo.row_block(sel).tolist() == rows[sel].tolist()
+    assert coo.column_block([4, 1]).tolist() == rows[:, [4, 1]].tolist()
+    assert coo.column_block(slice(1, None, 2)).tolist() == rows[:, 1::2].tolist()
+
+
+def test_coo_without_edges():
+    pytest.importorskip("numpy")
+    assert COOIncidence.from_edges([], []).shape == (0, 0)
+    coo = COOIncidence.from_edges(["a", "b"], [])
+    assert coo.shape == (2, 0) and coo.to_list() == [[], []]
+    assert coo.row_block([1]).shape == (1, 0)
+
+
+def test_coo_self_loop_signs():
+    pytest.importorskip("numpy")
+    for directed, expected in ((False, [[1, 1], [1, 0]]), (True, [[1, -1], [-1, 0]])):
+        coo = COOIncidence.from_edges(["a", "b"], [("a", "b"), ("a", "a")], directed)
+        assert coo.to_list() == expected
+        assert coo.to_list() == edges_to_incidence_matrix(
+            ["a", "b"], [("a", "b"), ("a", "a")], directed)
+
+
+def test_coo_without_numpy(monkeypatch):
+    monkeypatch.setattr(mlta.sparse, "HAS_NP", False)
+    with pytest.raises(ImportError):
+        edges_to_incidence_matrix(["a", "b"], [("a", "b")], sparse=True)
+    # CSR від NumPy не залежить
+    assert edges_to_adjacency_matrix(["a", "b"], [("a", "b")], sparse=True).nnz == 2
@@ -0,0 +1,285 @@
+import random
+from collections import deque
+
+import pytest
+
+from mlta.samples import EDGES_DIR, EDGES_UNDIR, VERTICES_DIR, VERTICES_UNDIR
+from mlta.traversal import (
+    bfs_direction_optimizing,
+    bfs_protocol,
+    bfs_snapshots,
+    build_adj_list,
+    connected_components,
+    dfs_protocol,
+    dfs_snapshots,
+    iter_bfs_events,
+    iter_dfs_events,
+    multi_source_bfs,
+    reachability_from_sources,
+    strongly_connected_components,
+    traversal_forest,
+    traversal_numbers,
+)
+
+
+def baseline_dfs_protocol(vertices, edges, start, directed=False):
+    """dfs_protocol з MLTA_lab2.py до переписування (копія стеку на кожному кроці)."""
+    adj = build_adj_list(vertices, edges, directed)
+    visited = set()
+    stack = []
+    protocol = []
+    counter = 1
+
+    stack.append(start)
+    protocol.append((start, counter, stack.copy()))
+    visited.add(start)
+
+    while stack:
+        x = stack[-1]
+
+        found = False
+        for y in adj[x]:
+            if y not in visited:
+                counter += 1
+                stack.append(y)
+                visited.add(y)
+                protocol.append((y, counter, stack.copy()))
+                found = True
+                break
+
+        if not found:
+            stack.pop()
+            if stack:
+                protocol.append((x, "-", stack.copy()))
+
+    return protocol
+
+
+def baseline_bfs_protocol(vertices, edges, start, directed=False):
+    """bfs_protocol з MLTA_lab2.py до переписування (копія черги на кожному кроці)."""
+    adj = build_adj_list(vertices, edges, directed)
+    visited = set()
+    protocol = []
+    queue = deque()
+    counter = 1
+
+    queue.append(start)
+    visited.add(start)
+    protocol.append((start, counter, list(queue)))
+
+    while queue:
+        x = queue[0]
+
+        for y in adj[x]:
+            if y not in visited:
+                counter += 1
+                visited.add(y)
+                queue.append(y)
+                protocol.append((y, counter, list(queue)))
+
+        queue.popleft()
+        if queue:
+            protocol.append((x, "-", list(queue)))
+
+    return protocol
+
+
+def lab2_graphs():
+    yield VERTICES_UNDIR, EDGES_UNDIR, False
+    yield VERTICES_DIR, EDGES_DIR, True
+
+
+def random_graphs(random_graph, seed, count=150):
+    """Орієнтовані й неорієнтовані графи з петлями та паралельними ребрами."""
+    rnd = random.Random(seed)
+    for k in range(count):
+        n = rnd.randint(1, 15)
+        vertices, edges = random_graph(rnd, n, rnd.randint(0, 3 * n), names=k % 2 == 0)
+        yield vertices, edges, k % 4 < 2, rnd.choice(vertices)
+
+
+def check_dfs(vertices, edges, directed, start):
+    expected = baseline_dfs_protocol(vertices, edges, start, directed)
+    assert dfs_protocol(vertices, edges, start, directed) == expected
+    events = list(iter_dfs_events(vertices, edges, start, directed))
+    assert list(dfs_snapshots(events)) == expected
+    assert traversal_numbers(events) == {v: k for v, k, _ in expected if k != "-"}
+
+
+def check_bfs(vertices, edges, directed, start):
+    expected = baseline_bfs_protocol(vertices, edges, start, directed)
+    assert bfs_protocol(vertices, edges, start, directed) == expected
+    events = list(iter_bfs_events(vertices, edges, start, directed))
+    assert list(bfs_snapshots(events)) == expected
+    assert traversal_numbers(events) == {v: k for v, k, _ in expected if k != "-"}
+
+
+def bfs_levels(vertices, edges, start, directed):
+    adj = build_adj_list(vertices, edges, directed)
+    levels = {start: 0}
+    queue = deque([start])
+    while queue:
+        x = queue.popleft()
+        for y in adj[x]:
+            if y not in levels:
+                levels[y] = levels[x] + 1
+                queue.append(y)
+    return levels
+
+
+def check_direction_optimizing(vertices, edges, directed, start):
+    levels = bfs_levels(vertices, edges, start, directed)
+    top_down = traversal_numbers(iter_bfs_events(vertices, edges, start, directed))
+
+    # alpha ~ 0 — завжди top-down, тож нумерація як у bfs_protocol
+    res = bfs_direction_optimizing(vertices, edges, start, directed, alpha=1e-9)
+    assert res["numbers"] == top_down and res["levels"] == levels
+
+    # типові пороги і примусовий bottom-up: рівні точні, номери — порядок BFS
+    for alpha, beta in ((14, 24), (1e9, 1e9)):
+        res = bfs_direction_optimizing(vertices, edges, start, directed,
+                                       alpha=alpha, beta=beta)
+        assert res["levels"] == levels
+        numbers = res["numbers"]
+        assert set(numbers) == set(levels)
+        assert sorted(numbers.values()) == list(range(1, len(levels) + 1))
+        order = sorted(numbers, key=numbers.get)
+        assert [levels[v] for v in order] == sorted(levels.values())
+
+
+def check_components(vertices, edges, directed, start):
+    reach = {v: set(bfs_levels(vertices, edges, v, directed)) for v in vertices}
+
+    components = strongly_connected_components(vertices, edges)
+    comp_of = {v: c for c, comp in enumerate(components) for v in comp}
+    assert sorted(comp_of) == sorted(vertices)
+    assert sum(map(len, components)) == len(vertices)
+    directed_reach = reach if directed else \
+        {v: set(bfs_levels(vertices, edges, v, True)) for v in vertices}
+    for u in vertices:
+        for v in vertices:
+            same = v in directed_reach[u] and u in directed_reach[v]
+            assert (comp_of[u] == comp_of[v]) == same
+    # зворотний топологічний порядок: ребро веде до компоненти, виданої раніше
+    for u, v in edges:
+        assert comp_of[v] <= comp_of[u]
+
+    sources = [start] + vertices[::3]
+    masks = reachability_from_sources(vertices, edges, sources, directed)
+    for v in vertices:
+        assert masks[v] == sum(1 << i for i, s in enumerate(sources) if v in reach[s])
+
+    undirected_reach = {v: set(bfs_levels(vertices, edges, v, False)) for v in vertices}
+    labels = connected_components(vertices, edges, directed)
+    assert sorted(labels) == sorted(vertices)
+    for u in vertices:
+        assert {v for v in vertices if labels[v] == labels[u]} == undirected_reach[u]
+    # номери компонент — у порядку першої вершини
+    order = list(dict.fromkeys(labels[v] for v in vertices))
+    assert order == list(range(len(order)))
+
+    roots = list(dict.fromkeys([start] + vertices[-2:]))
+    for method in ("dfs", "bfs"):
+        forest = traversal_forest(vertices, edges, roots, directed, method)
+        assert sorted(forest["numbers"].values()) == list(range(1, len(vertices) + 1))
+        assert forest["roots"][0] == start
+        seen = set()
+        for r in forest["roots"]:
+            tree = {v for v, t in forest["tree"].items() if t == r}
+            assert tree == reach[r] - seen
+            seen |= tree
+
+    levels = multi_source_bfs(vertices, edges, roots, directed)
+    per_root = [bfs_levels(vertices, edges, r, directed) for r in roots]
+    for v, d in levels["levels"].items():
+        assert d == min(lv.get(v, len(vertices)) for lv in per_root)
+        assert per_root[roots.index(levels["source"][v])][v] == d
+    assert set(levels["levels"]) == set().union(*per_root)
+
+
+def test_lab2_graphs_match_baseline():
+    for vertices, edges, directed in lab2_graphs():
+        for start in vertices:
+            check_dfs(vertices, edges, directed, start)
+            check_bfs(vertices, edges, directed, start)
+
+
+def test_random_graphs_match_reference(random_graph):
+    for vertices, edges, directed, start in random_graphs(random_graph, 9):
+        check_dfs(vertices, edges, directed, start)
+        check_bfs(vertices, edges, directed, start)
+        check_direction_optimizing(vertices, edges, directed, start)
+        check_components(vertices, edges, directed, start)
+
+
+def test_dfs_edge_cases():
+    # петлі й паралельні ребра не дають повторних відвідувань
+    assert dfs_protocol(["a"], [("a", "a"), ("a", "a")], "a") == [("a", 1, ["a"])]
+    assert dfs_protocol("abc", [("a", "b"), ("a", "b"), ("b", "b")], "a") == [
+        ("a", 1, ["a"]), ("b", 2, ["a", "b"]), ("b", "-", ["a"])]
+    # орієнтоване ребро проти напрямку обходу не веде далі
+    assert dfs_protocol("ab", [("b", "a")], "a", directed=True) == [("a", 1, ["a"])]
+    assert traversal_numbers(iter_dfs_events("abc", [], "c")) == {"c": 1}
+
+
+def test_bfs_edge_cases():
+    # повторне ребро a → b і петля b → b не додають b у чергу вдруге
+    assert bfs_protocol("abc", [("a", "b"), ("a", "b"), ("b", "b"), ("c", "a")], "a",
+                        directed=True) == [("a", 1, ["a"]), ("b", 2, ["a", "b"]),
+                                           ("a", "-", ["b"])]
+    assert bfs_protocol(["a"], [], "a") == [("a", 1, ["a"])]
+    # спільний visited: вже відвідані вершини пропускаються
+    events = iter_bfs_events("abc", [("a", "b"), ("b", "c")], "a", visited={"b"})
+    assert traversal_numbers(events) == {"a": 1}
+
+
+def test_direction_optimizing_star():
+    leaves = list(range(1, 21))
+    vertices, edges = [0] + leaves, [(0, v) for v in leaves]
+    # з листка: крок до центру top-down, далі фронт "важкий" — bottom-up
+    res = bfs_direction_optimizing(vertices, edges, 7)
+    assert res["steps"] == [("top-down", 1), ("bottom-up", 1), ("bottom-up", 19)]
+    assert res["levels"] == {7: 0, 0: 1, **{v: 2 for v in leaves if v != 7}}
+    # у рівні, пройденому bottom-up, номери йдуть у порядку списку вершин
+    others = [v for v in leaves if v != 7]
+    assert [res["numbers"][v] for v in others] == list(range(3, 22))
+
+
+def test_direction_optimizing_isolated_start():
+    res = bfs_direction_optimizing(["a", "b"], [("b", "a")], "a", directed=True)
+    assert res == {"numbers": {"a": 1}, "levels": {"a": 0}, "edges_traversed": 0,
+                   "steps": [("top-down", 1)]}
+
+
+def test_strongly_connected_components_edge_cases():
+    assert strongly_connected_components([], []) == []
+    # ланцюг — одиночні компоненти у зворотному топологічному порядку
+    assert strongly_connected_components("abc", [("a", "b"), ("b", "c")]) == [
+        ["c"], ["b"], ["a"]]
+    # петля не об'єднує вершину ні з ким
+    assert strongly_connected_components(
+        "abcd", [("a", "b"), ("b", "a"), ("c", "c"), ("b", "c")]) == [["c"], ["b", "a"], ["d"]]
+    # довгий цикл — без рекурсії
+    n = 5000
+    cycle = [(i, i + 1) for i in range(n - 1)] + [(n - 1, 0)]
+    assert [len(c) for c in strongly_connected_components(range(n), cycle)] == [n]
+
+
+def test_reachability_and_forest_edge_cases():
+    edges = [("a", "b"), ("b", "a"), ("b", "c")]
+    # повторене джерело дає власний біт; d недосяжна ні з якого
+    assert reachability_from_sources("abcd", edges, ["c", "a", "a"]) == {
+        "a": 0b110, "b": 0b110, "c": 0b111, "d": 0}
+
+    two = [("a", "b"), ("c", "d")]
+    assert traversal_forest("abcd", two, ["c"], sweep=False) == {
+        "numbers": {"c": 1, "d": 2}, "tree": {"c": "c", "d": "c"}, "roots": ["c"]}
+    assert traversal_forest("abcd", two, ["c"], method="bfs")["roots"] == ["c", "a"]
+    with pytest.raises(ValueError):
+        traversal_forest("ab", [], method="dijkstra")
+
+    assert connected_components("abcd", [("b", "c")]) == {"a": 0, "b": 1, "c": 1, "d": 2}
+    levels = multi_source_bfs("abcde", [("a", "b"), ("b", "c"), ("c", "d"), ("e", "d")],
+                              ["a", "e", "a"])
+    assert levels["levels"] == {"a": 0, "e": 0, "b": 1, "d": 1, "c": 2}
+    assert levels["source"] == {"a": "a", "e": "e", "b": "a", "d": "e", "c": "a"}
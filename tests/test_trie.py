@@ -0,0 +1,39 @@
+import pytest
+
+from mlta.trie import Homework
+
+
+@pytest.fixture
+def trie():
+    t = Homework()
+    for word in ("apple", "application", "banana", "cat", "cat"):
+        t.put(word)
+    return t
+
+
+def test_queries(trie):
+    assert trie.count_words_with_suffix("ion") == 1
+    assert trie.count_words_with_suffix("at") == 2  # повтори рахуються
+    assert trie.count_words_with_suffix("") == 5
+    assert trie.has_prefix("app") and trie.has_prefix("") and not trie.has_prefix("bat")
+    assert trie.total_characters() == 5 + 11 + 6 + 3 + 3
+
+
+def test_exists_with_mismatch(trie):
+    assert trie.exists_with_mismatch("cat", 0)
+    assert not trie.exists_with_mismatch("cut", 0)
+    assert trie.exists_with_mismatch("cut", 1)
+    assert not trie.exists_with_mismatch("bandit", 2)  # довжина має збігатися
+    assert not trie.exists_with_mismatch("", 3)
+
+
+def test_bad_arguments(trie):
+    with pytest.raises(ValueError):
+        trie.put("")
+    with pytest.raises(TypeError):
+        trie.put(5)
+    with pytest.raises(TypeError):
+        trie.has_prefix(None)
+    with pytest.raises(ValueError):
+        trie.exists_with_mismatch("cat", -1)
+    assert not Homework().has_prefix("")